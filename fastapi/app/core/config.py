@@ -1,5 +1,7 @@
 """Application configuration."""
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -55,11 +57,43 @@ class Settings(BaseSettings):
         "http://localhost:8000",
     ]
 
+    # ATS scoring
+    ats_requirements_cache_size: int = 4096
+
+    # Outbound HTTP (shared client pool for job sources)
+    http_timeout: float = 30.0
+    http_connect_timeout: float = 10.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = True
+
+    # Job ingest
+    job_upsert_chunk_size: int = 500
+    job_ingest_queue_size: int = 8  # fetched chunks buffered ahead of the DB writer
+    job_feed_cache_ttl: float = 300.0  # seconds a parsed Remotive/WWR feed is served without revalidating
+    job_feed_cache_size: int = 64
+    job_dedup_max_simhash_distance: int = 6  # max differing SimHash bits for a near-duplicate
+    job_summary_description_chars: int = 300  # description length in view=summary listings
+    resume_score_page_size: int = 500  # candidate postings scored per page by /score
+    resume_score_max_candidates: int = 5000  # cap on postings scored per /score request
+    resume_profile_cache_size: int = 256  # ATS resume profiles kept per process
+    resume_extraction_cache_size: int = 1000  # LLM resume extractions kept in Neo4j; 0 disables
+    resume_ingest_concurrency: int = 2  # background uploads processed at once
+    resume_ingest_max_pending: int = 20  # queued + running background uploads before 503
+    resume_ingest_job_ttl: float = 3600.0  # seconds a finished upload job stays queryable
+    extraction_executor: Literal["thread", "process"] = "thread"  # pool for PDF/DOCX parsing
+    extraction_max_workers: int = 2
+    extraction_timeout: float = 30.0  # seconds before an upload's extraction returns 504
+    pdf_extractor: Literal["pymupdf", "pypdf"] = "pymupdf"  # pypdf is also the fallback
+    pdf_pages_per_job: int = 8  # page-parallel PDFs: pages per pool job (process pools only)
+
     # Job Finder API Keys
     usajobs_api_key: str = ""
     usajobs_email: str = ""
     adzuna_app_id: str = ""
     adzuna_app_key: str = ""
+    adzuna_page_concurrency: int = 4  # Adzuna pages fetched in parallel by fetch-live
 
 
 settings = Settings()
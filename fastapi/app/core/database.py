@@ -110,11 +110,61 @@ class Neo4jConnection:
                 FOR (j:JobPosting) ON (j.source)
             """)
 
+            # Relevance-ranked free-text search for GET /jobs/
+            await session.run("""
+                CREATE FULLTEXT INDEX job_fulltext_index IF NOT EXISTS
+                FOR (j:JobPosting) ON EACH [j.title, j.description, j.company, j.location]
+            """)
+
+            # Case-insensitive location filter: a lowercased copy behind a
+            # TEXT index so CONTAINS does not scan every posting.
+            await session.run("""
+                CREATE TEXT INDEX job_location_lc_index IF NOT EXISTS
+                FOR (j:JobPosting) ON (j.location_lc)
+            """)
+
+            await session.run("""
+                MATCH (j:JobPosting)
+                WHERE j.location IS NOT NULL AND j.location_lc IS NULL
+                SET j.location_lc = toLower(j.location)
+            """)
+
+            # Keyset pagination key for job listings: epoch millis of when the
+            # posting was first stored, with apply_url as the tiebreaker. It is
+            # never rewritten, so refreshes cannot move rows past a cursor.
+            await session.run("""
+                CREATE INDEX job_sort_ts_index IF NOT EXISTS
+                FOR (j:JobPosting) ON (j.sort_ts)
+            """)
+
+            await session.run("""
+                MATCH (j:JobPosting)
+                WHERE j.sort_ts IS NULL
+                SET j.sort_ts = coalesce(j.created_at, j.updated_at, datetime({epochSeconds: 0})).epochMillis
+            """)
+
+            await session.run("""
+                CREATE INDEX job_dedup_fingerprint_index IF NOT EXISTS
+                FOR (j:JobPosting) ON (j.dedup_fingerprint)
+            """)
+
             await session.run("""
                 CREATE INDEX resume_person_name_index IF NOT EXISTS
                 FOR (r:Resume) ON (r.person_name)
             """)
 
+            # Content-addressed cache of LLM resume extractions, evicted
+            # least recently used first.
+            await session.run("""
+                CREATE CONSTRAINT resume_extraction_key_unique IF NOT EXISTS
+                FOR (c:ResumeExtraction) REQUIRE c.key IS UNIQUE
+            """)
+
+            await session.run("""
+                CREATE INDEX resume_extraction_last_used_index IF NOT EXISTS
+                FOR (c:ResumeExtraction) ON (c.last_used_at)
+            """)
+
             print("Neo4j schema initialized (constraints and indexes created)")
 
 
@@ -0,0 +1,126 @@
+"""Bounded worker pools for blocking work called from async endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal, Optional, TypeVar
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class ExecutorTimeoutError(TimeoutError):
+    """Raised when a job does not finish within the executor timeout."""
+
+
+class BoundedExecutor:
+    """Runs blocking callables on a thread or process pool off the event loop.
+
+    At most ``max_workers`` jobs are submitted at once; further callers wait
+    on a semaphore, and that wait is recorded as the queue wait time. A job
+    keeps its slot until it really finishes, even after the caller timed
+    out, so a stuck job cannot oversubscribe the pool. Process pools need
+    picklable, module-level callables.
+
+    Not thread-safe; it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, name: str, kind: ExecutorKind = "thread", max_workers: int = 2, timeout: float = 30.0):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(int(max_workers), 1)
+        self.timeout = timeout
+        self._pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_last = 0.0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+        return self._pool
+
+    def _record_wait(self, seconds: float) -> None:
+        self._wait_last = seconds
+        self._wait_total += seconds
+        self._wait_max = max(self._wait_max, seconds)
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> T:
+        """
+        Run ``fn(*args)`` on the pool and return its result.
+
+        Raises:
+            ExecutorTimeoutError: if the job (excluding queue wait) takes
+                longer than ``timeout`` (defaults to the executor timeout)
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        timeout = self.timeout if timeout is None else timeout
+
+        queued = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self._record_wait(time.perf_counter() - queued)
+
+        self.running += 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._get_pool(), fn, *args)
+        except BaseException:
+            self.running -= 1
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release)
+        try:
+            # shield: a timed-out job keeps running and holds its slot.
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise ExecutorTimeoutError(
+                f"{self.name} job did not finish within {timeout:.0f}s"
+            ) from None
+
+    def _release(self, _future: asyncio.Future) -> None:
+        self.running -= 1
+        self.completed += 1
+        self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, load and queue wait times (milliseconds)."""
+        started = self.completed + self.running
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "queue_wait_ms": {
+                "last": round(self._wait_last * 1000, 1),
+                "avg": round(self._wait_total / started * 1000, 1) if started else 0.0,
+                "max": round(self._wait_max * 1000, 1),
+            },
+        }
+
+    def shutdown(self) -> None:
+        """Stop the pool without waiting for running jobs."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
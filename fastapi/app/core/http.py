@@ -0,0 +1,56 @@
+"""Shared outbound HTTP client pool."""
+
+from typing import Dict, Optional
+
+import httpx
+
+from .config import settings
+
+try:  # HTTP/2 needs the optional ``h2`` package (httpx[http2])
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HTTPClientRegistry:
+    """Application-scoped ``httpx.AsyncClient`` instances with keep-alive pooling.
+
+    Clients are created lazily on first use and closed by the app lifespan,
+    so every request reuses warm TCP/TLS connections to the same upstream.
+    HTTP/2 is negotiated via ALPN when ``h2`` is installed; upstreams that
+    only speak HTTP/1.1 fall back transparently.
+    """
+
+    def __init__(self):
+        """Initialize the registry."""
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def get(self, name: str = "default") -> httpx.AsyncClient:
+        """Return the shared client for ``name``, creating it if needed."""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
+                http2=settings.http2_enabled and HTTP2_AVAILABLE,
+                follow_redirects=True,
+            )
+            self._clients[name] = client
+        return client
+
+    async def close(self, name: Optional[str] = None):
+        """Close one named client, or all of them."""
+        names = [name] if name else list(self._clients)
+        for key in names:
+            client = self._clients.pop(key, None)
+            if client is not None:
+                await client.aclose()
+
+
+# Global registry instance
+http_clients = HTTPClientRegistry()
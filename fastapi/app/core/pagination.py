@@ -0,0 +1,33 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import binascii
+import json
+from typing import Any, List
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor we did not issue."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Pack the sort key of the last returned row into a URL-safe token."""
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Unpack a cursor produced by ``encode_cursor`` with ``size`` sort-key values.
+
+    Raises:
+        InvalidCursorError: if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid cursor")
+    return values
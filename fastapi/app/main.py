@@ -8,9 +8,14 @@ from .routers import job as jobs_router
 
 from app.core.config import settings
 from app.core.database import neo4j_db
+from app.core.http import http_clients
 from app.core.auth import bootstrap_seed_user, migrate_orphans_to_seed_user
 from app.routers import career, resume, ollama, latex, interview, tts, auth as auth_router
 from app.routers.tts import warmup_kokoro
+from app.services.job_dedup_service import job_dedup_service
+from app.services.resume_processor import resume_processor
+from app.services.resume_ingest_service import resume_ingest_service
+from app.services.job_skill_index_service import job_skill_index_service
 
 
 @asynccontextmanager
@@ -28,6 +33,15 @@ async def lifespan(app: FastAPI):
         if seed and seed.get("id"):
             await migrate_orphans_to_seed_user(session, seed["id"])
 
+    # Index postings stored before cross-source dedup and the skill index
+    # existed, and move resumes onto canonical Skill nodes. Idempotent.
+    async with neo4j_db.session() as session:
+        await job_dedup_service.backfill(session)
+        await job_skill_index_service.backfill(session)
+        await job_skill_index_service.backfill_resume_skills(session)
+
+    await resume_ingest_service.start()
+
     # Warm Kokoro TTS in the background so the first real request is fast.
     # Fire-and-forget: don't block startup on it.
     kokoro_warmup_task = asyncio.create_task(warmup_kokoro())
@@ -38,6 +52,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down CareerLift Backend...")
     kokoro_warmup_task.cancel()
+    await resume_ingest_service.shutdown()
+    resume_processor.executor.shutdown()
+    await http_clients.close()
     await neo4j_db.close()
     print("All services closed")
 
@@ -87,5 +104,11 @@ async def health():
         "services": {
             "neo4j": "connected",
             "ollama": "available"
-        }
+        },
+        "executors": {
+            "resume_extraction": resume_processor.executor.stats(),
+        },
+        "queues": {
+            "resume_ingest": resume_ingest_service.stats(),
+        },
     }
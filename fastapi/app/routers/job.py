@@ -1,21 +1,37 @@
 from __future__ import annotations
+import json
+import xml.etree.ElementTree as ET
+from contextlib import aclosing
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, Query, Body
+import httpx
+from fastapi import APIRouter, Depends, Query, Body, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 # Use your existing async Neo4j dependency
 from app.core.database import get_db  # yields an async Neo4j session
 
 from app.schemas.job import Job as JobSchema
-from app.services.job_ingest_service import ingest_all_sources
-from app.services.job_sources import (
-    USAJobsClient,
-    AdzunaClient,
-    RemotiveClient,
-    WeWorkRemotelyClient,
+from app.services.job_ingest_service import (
+    JOB_SOURCE_NAMES,
+    SOURCE_NOT_CONFIGURED,
+    ingest_all_sources,
+    open_job_source,
 )
 from app.core.config import settings
 from app.core.auth import get_current_user
+from app.core.pagination import InvalidCursorError
+from app.services.ats_service import ats_service, strip_requirement_properties
+from app.services.job_dedup_service import dedup_properties
+from app.services.job_skill_index_service import job_skill_index_service, skill_index_row
+from app.services.job_search_service import (
+    JobView,
+    job_projection,
+    job_search_service,
+    public_job,
+    truncate_description,
+)
+from app.services.resume_profile_cache import resume_profile_cache
 
 router = APIRouter(
     prefix="/jobs",
@@ -37,88 +53,111 @@ async def list_jobs(
     source: Optional[str] = None,
     remote_only: bool = False,
     resume_id: Optional[str] = None,
-    limit: int = Query(default=200, le=500),
+    limit: int = Query(default=200, ge=1, le=500),
+    top: Optional[int] = Query(default=None, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None, description="Opaque next_cursor from the previous page"),
+    view: JobView = Query(default="summary", description="summary truncates descriptions"),
+    skill_match: bool = Query(default=False, description="With resume_id: only jobs requiring a resume skill"),
     db = Depends(get_db),
 ):
     """
     List jobs with optional filters and ATS scoring.
 
+    Results are paged in (relevance,) recency order with keyset pagination:
+    when more jobs match, ``next_cursor`` holds a cursor for the following
+    page (None on the last page). ATS sorting (and ``top``) apply within
+    each page.
+
     Args:
-        q: Search query (searches title and description)
+        q: Search query (full-text over title, description, company and
+            location; results are ranked by relevance)
         location: Location filter
         source: Filter by job source (usajobs, adzuna, remotive, weworkremotely)
         remote_only: Show only remote jobs
         resume_id: Optional resume ID for ATS scoring
         limit: Maximum number of results
+        top: Only return the best ``top`` jobs by ATS score (with resume_id);
+            full ATS details are built for those jobs only
+        view: ``summary`` (default) returns the first
+            ``job_summary_description_chars`` characters of each description;
+            ``full`` the whole text. ``GET /jobs/detail`` returns one posting
+            in full.
+        skill_match: With ``resume_id`` and no ``q``, only list postings
+            linked to one of the resume's skills, most shared skills first
     """
-    from app.services.ats_service import ats_service
-
-    cypher = """
-    MATCH (j:JobPosting)
-    WHERE ($q IS NULL OR toLower(j.title) CONTAINS toLower($q) OR toLower(j.description) CONTAINS toLower($q))
-      AND ($location IS NULL OR toLower(j.location) CONTAINS toLower($location))
-      AND ($source IS NULL OR j.source = $source)
-      AND ($remote_only = false OR j.remote = true)
-    RETURN j
-    ORDER BY coalesce(j.updated_at, j.created_at, datetime({epochSeconds:0})) DESC
-    LIMIT $limit
-    """
-    result = await db.run(cypher, q=q, location=location, source=source, remote_only=remote_only, limit=limit)
-
-    # Get resume skills for ATS scoring if resume_id provided
+    # Resume profile for ATS scoring (cached per resume version)
     resume_profile = None
     if resume_id:
-        resume_query = """
-        MATCH (r:Resume {id: $resume_id})-[:BELONGS_TO]->(p:Person)
-        OPTIONAL MATCH (p)-[:HAS_SKILL]->(s:Skill)
-        OPTIONAL MATCH (p)-[:HAS_EXPERIENCE]->(e:Experience)
-        OPTIONAL MATCH (p)-[:HAS_EDUCATION]->(ed:Education)
-        RETURN r.text AS resume_text,
-               collect(DISTINCT s.name) AS skills,
-               collect(DISTINCT e.description) AS experiences,
-               collect(DISTINCT e.title) AS experience_titles,
-               collect(DISTINCT ed.degree) AS education
-        """
-        resume_result = await db.run(resume_query, resume_id=resume_id)
-        resume_data = await resume_result.single()
-        if resume_data:
-            resume_profile = ats_service.build_resume_profile(
-                skills=resume_data["skills"] or [],
-                experiences=resume_data["experiences"] or [],
-                experience_titles=resume_data["experience_titles"] or [],
-                education=resume_data["education"] or [],
-                resume_text=resume_data["resume_text"] or "",
-            )
+        resume_profile = await resume_profile_cache.get_profile(db, resume_id)
+
+    try:
+        results, next_cursor = await job_search_service.search(
+            db,
+            q=q,
+            location=location,
+            source=source,
+            remote_only=remote_only,
+            limit=limit,
+            cursor=cursor,
+            view=view,
+            for_scoring=bool(resume_id),
+            skills_of=resume_id if resume_profile and skill_match else None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     items: List[Dict[str, Any]] = []
-    async for rec in result:
-        j = rec["j"]
-        job_data = {
-            "title": j.get("title"),
-            "company": j.get("company"),
-            "location": j.get("location"),
-            "employment_type": j.get("employment_type"),
-            "remote": j.get("remote"),
-            "salary_text": j.get("salary_text"),
-            "posted_at": j.get("posted_at"),
-            "apply_url": j.get("apply_url"),
-            "source_url": j.get("source_url"),
-            "description": j.get("description"),
-            "source": j.get("source"),
-            "source_job_id": j.get("source_job_id"),
-        }
-
-        # Add ATS score if resume provided
+    nodes = []
+    for j, score in results:
+        nodes.append(j)
+        items.append(public_job(j))
+        if score is not None:
+            items[-1]["search_score"] = score
+
+    # Top-K mode: prune on an upper bound and only detail the winners
+    if resume_profile and top:
+        ranked = []
+        for index, scoring in ats_service.rank_resume_to_jobs(resume_profile, nodes, top):
+            items[index].update(scoring)
+            ranked.append(items[index])
+        items = ranked
+    else:
+        # Add ATS scores if resume provided, scoring all jobs in one batch
         if resume_profile:
-            job_data.update(ats_service.score_resume_to_job(resume_profile, j))
+            for job_data, scoring in zip(items, ats_service.score_resume_to_jobs(resume_profile, nodes)):
+                job_data.update(scoring)
+            items.sort(key=lambda x: x.get("ats_score", 0), reverse=True)
+
+        if top:
+            items = items[:top]
 
-        items.append(job_data)
+    # Scoring needs whole descriptions; trim them only for the response
+    if view == "summary" and resume_id:
+        for job_data in items:
+            truncate_description(job_data)
 
-    # Sort by ATS score if resume provided
-    if resume_profile:
-        items.sort(key=lambda x: x.get("ats_score", 0), reverse=True)
+    return {"jobs": items, "next_cursor": next_cursor}
+
+
+@router.get("/detail")
+async def get_job_detail(
+    apply_url: str = Query(..., description="apply_url of the posting"),
+    db = Depends(get_db),
+):
+    """
+    Return one posting with its full description.
 
-    return items
+    Listings return a truncated description by default; clients fetch the
+    rest here on demand. The fields are those of a ``view=full`` listing.
+    """
+    result = await db.run(
+        f"MATCH (j:JobPosting {{apply_url: $apply_url}}) RETURN {job_projection('full')} AS j",
+        apply_url=apply_url,
+    )
+    record = await result.single()
+    if not record:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return public_job(record["j"])
 
 
 @router.post("/calculate-ats")
@@ -135,39 +174,19 @@ async def calculate_ats_scores(
     Returns:
         List of jobs with ats_score added
     """
-    from app.services.ats_service import ats_service
-
-    # Get resume skills and experience
-    resume_query = """
-    MATCH (r:Resume {id: $resume_id})-[:BELONGS_TO]->(p:Person)
-    OPTIONAL MATCH (p)-[:HAS_SKILL]->(s:Skill)
-    OPTIONAL MATCH (p)-[:HAS_EXPERIENCE]->(e:Experience)
-    OPTIONAL MATCH (p)-[:HAS_EDUCATION]->(ed:Education)
-    RETURN r.text AS resume_text,
-           collect(DISTINCT s.name) AS skills,
-           collect(DISTINCT e.description) AS experiences,
-           collect(DISTINCT e.title) AS experience_titles,
-           collect(DISTINCT ed.degree) AS education
-    """
-    resume_result = await db.run(resume_query, resume_id=request.resume_id)
-    resume_data = await resume_result.single()
-
-    if not resume_data:
+    resume_profile = await resume_profile_cache.get_profile(db, request.resume_id)
+    if resume_profile is None:
         return request.jobs
 
-    resume_profile = ats_service.build_resume_profile(
-        skills=resume_data["skills"] or [],
-        experiences=resume_data["experiences"] or [],
-        experience_titles=resume_data["experience_titles"] or [],
-        education=resume_data["education"] or [],
-        resume_text=resume_data["resume_text"] or "",
-    )
+    # Client jobs may not supply persisted requirements: they would be
+    # cached for every user scoring the same posting.
+    jobs = [strip_requirement_properties(job) for job in request.jobs]
 
-    # Calculate ATS scores for each job
+    # Calculate ATS scores for all jobs in one batch
     scored_jobs = []
-    for job in request.jobs:
+    for job, scoring in zip(jobs, ats_service.score_resume_to_jobs(resume_profile, jobs)):
         job_copy = job.copy()
-        job_copy.update(ats_service.score_resume_to_job(resume_profile, job))
+        job_copy.update(scoring)
         scored_jobs.append(job_copy)
 
     # Sort by ATS score
@@ -185,17 +204,43 @@ async def refresh_jobs(
     Fetch latest jobs from all sources and update the database.
 
     This endpoint fetches jobs from USAJOBS, Adzuna, Remotive, and WeWorkRemotely.
-    Call this to populate or refresh the job database.
+    Call this to populate or refresh the job database. Sources are fetched
+    concurrently; ``sources`` reports per-source counts, latency and errors.
     """
     results = await ingest_all_sources(db, limit_per_source)
-    total = sum(results.values())
+    total = sum(results["by_source"].values())
     return {
         "total_fetched": total,
-        "by_source": results,
+        "by_source": results["by_source"],
+        "sources": results["sources"],
+        "elapsed_ms": results["elapsed_ms"],
         "limit_per_source": limit_per_source
     }
 
 
+def _live_filters(
+    source: str,
+    keyword: Optional[str],
+    location: Optional[str],
+    category: Optional[str],
+    limit: int,
+) -> Dict[str, Any]:
+    filters: Dict[str, Any] = {
+        "keyword": keyword or "",
+        "location": location or "",
+        "category": category,
+        "limit": limit,
+    }
+    if source == "usajobs":
+        filters["limit"] = min(limit, 500)
+    elif source == "adzuna":
+        # Adzuna API returns max 50 jobs per page; fetch a window of pages
+        # concurrently, with extra pages to absorb duplicate URLs.
+        filters["concurrency"] = settings.adzuna_page_concurrency
+        filters["max_pages"] = min((limit + 49) // 50 + 2, 20)  # max 20 pages
+    return filters
+
+
 @router.get("/fetch-live/{source}")
 async def fetch_jobs_live(
     source: str,
@@ -211,70 +256,65 @@ async def fetch_jobs_live(
 
     Supported sources: usajobs, adzuna, remotive, weworkremotely
     """
+    if source not in JOB_SOURCE_NAMES:
+        return {"error": f"Unknown source: {source}"}
+
     jobs = []
+    client = open_job_source(source)
+    try:
+        if not client.is_configured():
+            return {"jobs": [], "message": SOURCE_NOT_CONFIGURED[source]}
+        pages = client.iter_pages(**_live_filters(source, keyword, location, category, limit))
+        async with aclosing(pages):
+            async for page in pages:
+                jobs.extend(page)
+    except (httpx.HTTPError, ET.ParseError) as e:
+        print(f"{source.upper()}: Error - {e}")
+    finally:
+        await client.close()
 
-    if source == "usajobs":
-        client = USAJobsClient(settings.usajobs_api_key, settings.usajobs_email)
-        try:
-            if not client.is_configured():
-                return {"jobs": [], "message": "USAJOBS API key not configured"}
-            jobs = await client.fetch_jobs(keyword=keyword, location=location, limit=min(limit, 500))
-        finally:
-            await client.close()
+    return {"jobs": jobs, "count": len(jobs), "source": source}
 
-    elif source == "adzuna":
-        client = AdzunaClient(settings.adzuna_app_id, settings.adzuna_app_key)
-        try:
-            if not client.is_configured():
-                return {"jobs": [], "message": "Adzuna API credentials not configured"}
-            # Adzuna API returns max 50 jobs per page
-            # Fetch multiple pages with buffer to account for duplicate URLs during deduplication
-            jobs = []
-            seen_urls = set()
-            max_pages = min((limit + 49) // 50 + 2, 20)  # Extra pages for duplicates, max 20 pages
-            page = 1
-
-            while len(jobs) < limit and page <= max_pages:
-                page_jobs = await client.fetch_jobs(
-                    keyword=keyword,
-                    location=location,
-                    page=page,
-                    results_per_page=50
-                )
-                if not page_jobs:
-                    break
-
-                # Deduplicate by apply_url
-                for job in page_jobs:
-                    url = job.get("apply_url")
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        jobs.append(job)
-                        if len(jobs) >= limit:
-                            break
-
-                page += 1
-        finally:
-            await client.close()
 
-    elif source == "remotive":
-        client = RemotiveClient()
-        try:
-            jobs = await client.fetch_jobs(category=category, limit=min(limit, 1000))
-        finally:
-            await client.close()
+@router.get("/fetch-live/{source}/stream")
+async def stream_jobs_live(
+    source: str,
+    keyword: Optional[str] = Query(default="", description="Search keyword"),
+    location: Optional[str] = Query(default="", description="Location filter"),
+    category: Optional[str] = Query(default=None, description="Category for remotive/weworkremotely"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Max jobs to return (1-1000)"),
+):
+    """
+    Stream jobs from a specific source as NDJSON, without storing them.
 
-    elif source == "weworkremotely":
-        client = WeWorkRemotelyClient()
+    Each line is one posting, written as soon as its page arrives. The last
+    line is ``{"done": true, "count": n}``, or ``{"error": "...", "count": n}``
+    if the upstream failed part-way.
+    """
+    if source not in JOB_SOURCE_NAMES:
+        raise HTTPException(status_code=404, detail=f"Unknown source: {source}")
+
+    client = open_job_source(source)
+    if not client.is_configured():
+        await client.close()
+        raise HTTPException(status_code=503, detail=SOURCE_NOT_CONFIGURED[source])
+
+    async def iter_lines():
+        count = 0
+        pages = client.iter_pages(**_live_filters(source, keyword, location, category, limit))
         try:
-            jobs = await client.fetch_jobs(category=category, limit=min(limit, 1000))
+            async with aclosing(pages):
+                async for page in pages:
+                    for job in page:
+                        count += 1
+                        yield json.dumps(job, default=str) + "\n"
+            yield json.dumps({"done": True, "count": count}) + "\n"
+        except (httpx.HTTPError, ET.ParseError) as e:
+            yield json.dumps({"error": str(e), "count": count}) + "\n"
         finally:
             await client.close()
 
-    else:
-        return {"error": f"Unknown source: {source}"}
-
-    return {"jobs": jobs, "count": len(jobs), "source": source}
+    return StreamingResponse(iter_lines(), media_type="application/x-ndjson")
 
 
 @router.post("/add-to-graph")
@@ -305,6 +345,9 @@ async def add_job_to_graph(
         "source": job.get("source"),
         "source_job_id": job.get("source_job_id"),
     }
+    requirements = ats_service.get_job_requirements(params)
+    params.update(requirements.to_node_properties())
+    params.update(dedup_properties(params))
 
     cypher = """
     MERGE (j:JobPosting {apply_url: $apply_url})
@@ -334,6 +377,14 @@ async def add_job_to_graph(
       j.source = coalesce($source, j.source),
       j.source_job_id = coalesce($source_job_id, j.source_job_id),
       j.updated_at = datetime()
+    SET j.ats_requirements_hash = $ats_requirements_hash,
+        j.ats_requirements = $ats_requirements,
+        j.dedup_fingerprint = $dedup_fingerprint,
+        j.simhash = $simhash,
+        j.description_hash = $description_hash,
+        j.dedup_version = $dedup_version,
+        j.location_lc = toLower(j.location),
+        j.sort_ts = coalesce(j.sort_ts, timestamp())
     RETURN j
     """
 
@@ -341,6 +392,7 @@ async def add_job_to_graph(
     record = await result.single()
 
     if record:
+        await job_skill_index_service.link(db, [skill_index_row(apply_url, requirements)])
         return {
             "success": True,
             "message": "Job added to knowledge graph",
@@ -1,14 +1,24 @@
 """Resume processing API endpoints. Every endpoint is scoped to the
 currently-authenticated user via :User-[:OWNS]->(:Resume) etc."""
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Form
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, Depends, HTTPException, Form, Query, Response
+from fastapi.responses import StreamingResponse
 from app.core.database import get_db
 from app.core.auth import get_current_user
-from app.services.resume_processor import resume_processor
-from app.services.knowledge_graph_service import (
-    ResumeGraphExtractionError,
-    knowledge_graph_service,
-)
+from app.core.executors import ExecutorTimeoutError
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.services.knowledge_graph_service import ResumeGraphExtractionError
 from app.services.ats_service import ats_service
+from app.services.job_search_service import JobView
+from app.services.job_skill_index_service import job_skill_index_service, skill_index_row
+from app.services.resume_match_service import resume_match_service
+from app.services.resume_ingest_service import (
+    IngestJob,
+    IngestQueueFullError,
+    resume_ingest_service,
+)
+from app.services.resume_profile_cache import resume_profile_cache
+from app.services.resume_queries import collect_related, subgraph_collections
+from app.services.saved_job_score_service import saved_job_score_service
 from app.schemas.resume import (
     ResumeInfo,
     ResumeList,
@@ -18,17 +28,67 @@ from app.schemas.resume import (
     SkillGapAnalysis,
 )
 from typing import Optional
-import uuid
+import json
 
 
 router = APIRouter(prefix="/api/resume", tags=["resume"])
 
 
+def _upload_error(exc: Exception) -> HTTPException:
+    """Map an upload pipeline failure to the HTTP error returned for it."""
+    if isinstance(exc, HTTPException):
+        return exc
+    if isinstance(exc, ResumeGraphExtractionError):
+        return HTTPException(status_code=422, detail=str(exc))
+    if isinstance(exc, ExecutorTimeoutError):
+        return HTTPException(status_code=504, detail=f"Text extraction timed out: {exc}")
+    if isinstance(exc, ValueError):
+        error_msg = str(exc)
+        if error_msg.startswith("OLLAMA_AUTH_REQUIRED:"):
+            signin_url = error_msg.split(":", 1)[1] if ":" in error_msg else None
+            return HTTPException(
+                status_code=401,
+                detail={
+                    "error": "Ollama authentication required",
+                    "signin_url": signin_url,
+                    "message": "Please sign in to Ollama to process resumes",
+                },
+            )
+        return HTTPException(status_code=400, detail=error_msg)
+    return HTTPException(status_code=500, detail=f"Error processing resume: {str(exc)}")
+
+
+def _upload_error_payload(exc: Exception) -> dict:
+    error = _upload_error(exc)
+    return {"status_code": error.status_code, "detail": error.detail}
+
+
+def _ingest_job_payload(job: IngestJob) -> dict:
+    payload = {
+        "job_id": job.job_id,
+        "status": job.status,
+        "resume_name": job.resume_name,
+        "filename": job.filename,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+    if job.result is not None:
+        payload["result"] = job.result
+    if job.error is not None:
+        payload["error"] = job.error
+    return payload
+
+
 @router.post("/upload")
 async def upload_resume(
+    response: Response,
     file: UploadFile = File(...),
     person_name: str = Form(""),
     resume_name: str = Form(""),
+    background: bool = Query(
+        False,
+        description="Return a job_id at once and process the upload in the background",
+    ),
     db=Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
@@ -38,6 +98,10 @@ async def upload_resume(
     Supports: .txt, .md, .pdf, .doc, .docx
     The Resume becomes :OWNS-owned by the current user; the resulting
     skill/experience/education subgraph is linked to this Resume only.
+
+    With ``background=true`` the request returns 202 with a ``job_id`` as
+    soon as the file is received; follow progress with
+    ``GET /ingest/{job_id}`` or the ``/ingest/{job_id}/events`` SSE stream.
     """
     user_id = current_user["id"]
 
@@ -57,94 +121,70 @@ async def upload_resume(
         )
 
     file_content = await file.read()
+    upload = {
+        "user_id": user_id,
+        "file_content": file_content,
+        "filename": file.filename,
+        "resume_name": resume_name,
+        "person_name": person_name,
+    }
 
-    try:
-        text = await resume_processor.extract_text_from_file(file_content, file.filename)
-
-        if not text or len(text.strip()) < 10:
-            raise HTTPException(
-                status_code=400,
-                detail="Could not extract meaningful text from the file"
-            )
+    if background:
+        try:
+            job = resume_ingest_service.submit(**upload, describe_error=_upload_error_payload)
+        except IngestQueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        response.status_code = 202
+        return {
+            **_ingest_job_payload(job),
+            "status_url": f"{router.prefix}/ingest/{job.job_id}",
+            "events_url": f"{router.prefix}/ingest/{job.job_id}/events",
+        }
 
-        resume_id = str(uuid.uuid4())
-        graph_data = await knowledge_graph_service.transform_resume_to_graph(text)
+    try:
+        return await resume_ingest_service.ingest(db, **upload)
+    except Exception as e:
+        raise _upload_error(e)
 
-        extracted_person_name = (
-            graph_data.get("person", {}).get("name") if graph_data.get("person") else None
-        )
-        final_person_name = (
-            person_name.strip()
-            if person_name and person_name.strip()
-            else (extracted_person_name or "Unknown")
-        )
-        if not graph_data.get("person"):
-            graph_data["person"] = {"name": final_person_name}
-        else:
-            graph_data["person"]["name"] = final_person_name
-
-        final_resume_name = resume_name.strip()
-
-        # Create the Resume node and link it to the owning user.
-        resume_query = """
-        MATCH (u:User {id: $user_id})
-        CREATE (r:Resume {
-            id: $resume_id,
-            name: $resume_name,
-            person_name: $person_name,
-            text: $text,
-            filename: $filename,
-            created_at: datetime(),
-            updated_at: datetime()
-        })
-        MERGE (u)-[:OWNS]->(r)
-        RETURN r
-        """
-        result = await db.run(
-            resume_query,
-            user_id=user_id,
-            resume_id=resume_id,
-            resume_name=final_resume_name,
-            person_name=final_person_name,
-            text=text,
-            filename=file.filename,
-        )
-        await result.consume()
 
-        # Build per-resume subgraph (Skills/Experiences/Education hang off
-        # this Resume; Person is created/MERGEd under the user).
-        nodes_created = await knowledge_graph_service.create_resume_subgraph(
-            db, graph_data, resume_id=resume_id, user_id=user_id
-        )
+@router.get("/ingest/{job_id}")
+async def get_ingest_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+):
+    """Status of a background upload; ``result`` or ``error`` once finished."""
+    job = resume_ingest_service.get(job_id, current_user["id"])
+    if job is None:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    return _ingest_job_payload(job)
 
-        return {
-            "message": "Resume processed successfully",
-            "resume_id": resume_id,
-            "resume_name": final_resume_name,
-            "person_name": final_person_name,
-            "filename": file.filename,
-            "text_length": len(text),
-            "nodes_created": nodes_created,
-            "graph_data": graph_data,
-        }
 
-    except ResumeGraphExtractionError as e:
-        raise HTTPException(status_code=422, detail=str(e))
-    except ValueError as e:
-        error_msg = str(e)
-        if error_msg.startswith("OLLAMA_AUTH_REQUIRED:"):
-            signin_url = error_msg.split(":", 1)[1] if ":" in error_msg else None
-            raise HTTPException(
-                status_code=401,
-                detail={
-                    "error": "Ollama authentication required",
-                    "signin_url": signin_url,
-                    "message": "Please sign in to Ollama to process resumes",
-                },
-            )
-        raise HTTPException(status_code=400, detail=error_msg)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+@router.get("/ingest/{job_id}/events")
+async def stream_ingest_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Server-sent events for a background upload: one ``status`` event per
+    stage change, the last one with ``result`` or ``error``, and keepalive
+    comments while a stage is running.
+    """
+    job = resume_ingest_service.get(job_id, current_user["id"])
+    if job is None:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+
+    async def events():
+        async for update in resume_ingest_service.watch(job):
+            if update is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: status\ndata: {json.dumps(_ingest_job_payload(update))}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/graph/{person_name}")
@@ -155,22 +195,16 @@ async def get_resume_graph(
 ):
     """Return the user's most-recent Resume subgraph for the given person.
     Skills/Experiences/Education are now per-Resume."""
-    query = """
-    MATCH (u:User {id: $user_id})-[:OWNS]->(p:Person {name: $person_name})
+    query = f"""
+    MATCH (u:User {{id: $user_id}})-[:OWNS]->(p:Person {{name: $person_name}})
     OPTIONAL MATCH (u)-[:OWNS]->(r:Resume)-[:BELONGS_TO]->(p)
     WITH p, r ORDER BY r.created_at DESC
-    WITH p, head(collect(r)) AS r
-    OPTIONAL MATCH (r)-[:HAS_SKILL]->(s:Skill)
-    OPTIONAL MATCH (r)-[:HAS_EXPERIENCE]->(e:Experience)
-    OPTIONAL MATCH (r)-[:HAS_EDUCATION]->(ed:Education)
-    OPTIONAL MATCH (r)-[:SAVED_JOB]->(j:JobPosting)
-    OPTIONAL MATCH (u)-[:OWNS]->(allr:Resume)-[:BELONGS_TO]->(p)
+    WITH p, collect(r) AS resumes
+    WITH p, resumes, head(resumes) AS r
     RETURN p,
-           collect(DISTINCT s) AS skills,
-           collect(DISTINCT e) AS experiences,
-           collect(DISTINCT ed) AS education,
-           collect(DISTINCT j) AS saved_jobs,
-           collect(DISTINCT allr) AS resumes
+           {subgraph_collections("r")},
+           {collect_related("r", "SAVED_JOB", "JobPosting", "n", "saved_jobs")},
+           resumes
     """
 
     result = await db.run(query, user_id=current_user["id"], person_name=person_name)
@@ -192,23 +226,31 @@ async def get_resume_graph(
 @router.get("/score/{person_name}")
 async def score_resume_against_jobs(
     person_name: str,
+    top: int = Query(default=50, ge=1, le=500, description="Number of best jobs to return"),
+    stream: bool = Query(default=False, description="Stream NDJSON as pages are scored"),
+    view: JobView = Query(default="summary", description="summary truncates descriptions"),
     db=Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
+    """Return the ``top`` best jobs for the person's latest resume.
+
+    Only postings linked to at least one resume skill are scored, in pages
+    and up to ``resume_score_max_candidates`` of them. The response is
+    ``{"jobs": [...best first], "scanned": n}``.
+
+    With ``stream=true`` the response is NDJSON: each page's best jobs are
+    written as soon as the page is scored, and the last line is
+    ``{"done": true, "scanned": n, "top": [apply_url, ...]}`` giving the
+    overall ranking.
+    """
     person_query = """
     MATCH (u:User {id: $user_id})-[:OWNS]->(p:Person {name: $person_name})
     OPTIONAL MATCH (u)-[:OWNS]->(r:Resume)-[:BELONGS_TO]->(p)
     WITH p, r ORDER BY r.created_at DESC
     WITH p, head(collect(r)) AS r
-    OPTIONAL MATCH (r)-[:HAS_SKILL]->(s:Skill)
-    OPTIONAL MATCH (r)-[:HAS_EXPERIENCE]->(e:Experience)
-    OPTIONAL MATCH (r)-[:HAS_EDUCATION]->(ed:Education)
     RETURN p,
-           collect(DISTINCT s.name) AS skills,
-           collect(DISTINCT e.description) AS experiences,
-           collect(DISTINCT e.title) AS experience_titles,
-           collect(DISTINCT ed.degree) AS education,
-           collect(DISTINCT r.text) AS resume_texts
+           r.id AS resume_id,
+           coalesce(r.profile_version, toString(r.updated_at)) AS profile_version
     """
 
     record = await (await db.run(
@@ -217,55 +259,81 @@ async def score_resume_against_jobs(
     if not record or not record.get("p"):
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume_profile = ats_service.build_resume_profile(
-        skills=record["skills"] or [],
-        experiences=record["experiences"] or [],
-        experience_titles=record["experience_titles"] or [],
-        education=record["education"] or [],
-        resume_text=" ".join(record["resume_texts"] or []),
-    )
+    resume_profile = None
+    if record["resume_id"]:
+        resume_profile = await resume_profile_cache.get_profile(
+            db, record["resume_id"], record["profile_version"]
+        )
+    if resume_profile is None:
+        resume_profile = ats_service.build_resume_profile(
+            skills=[], experiences=[], experience_titles=[], education=[]
+        )
 
-    job_query = "MATCH (j:JobPosting) RETURN j"
-    result = await db.run(job_query)
+    if not stream:
+        return await resume_match_service.top_jobs(
+            db, resume_profile, top, view, resume_id=record["resume_id"]
+        )
 
-    jobs = []
-    async for row in result:
-        j = dict(row["j"])
-        j.update(ats_service.score_resume_to_job(resume_profile, j))
-        jobs.append(j)
+    async def iter_lines():
+        done = {"done": True, "scanned": 0, "top": []}
+        async for page in resume_match_service.iter_pages(
+            db, resume_profile, top, view, resume_id=record["resume_id"]
+        ):
+            for job in page.jobs:
+                yield json.dumps(job, default=str) + "\n"
+            done = {
+                "done": True,
+                "scanned": page.scanned,
+                "top": [job.get("apply_url") for job in page.top],
+            }
+        yield json.dumps(done) + "\n"
 
-    return {"jobs": jobs}
+    return StreamingResponse(iter_lines(), media_type="application/x-ndjson")
 
 
 @router.get("/list", response_model=ResumeList)
 async def list_resumes(
     person_name: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
+    cursor: Optional[str] = None,
     db=Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    """List the current user's resumes (optionally filtered by person name)."""
+    """List the current user's resumes (optionally filtered by person name).
+
+    With ``limit`` the list is keyset-paginated on ``(created_at, id)``;
+    pass back ``next_cursor`` as ``cursor`` for the following page.
+    """
+    params = {"user_id": current_user["id"]}
+    where = []
     if person_name:
-        query = """
-        MATCH (u:User {id: $user_id})-[:OWNS]->(r:Resume {person_name: $person_name})
-        RETURN r.id AS resume_id,
-               r.name AS resume_name,
-               r.person_name AS person_name,
-               toString(r.created_at) AS created_at,
-               toString(r.updated_at) AS updated_at
-        ORDER BY r.created_at DESC
-        """
-        result = await db.run(query, user_id=current_user["id"], person_name=person_name)
-    else:
-        query = """
-        MATCH (u:User {id: $user_id})-[:OWNS]->(r:Resume)
-        RETURN r.id AS resume_id,
-               r.name AS resume_name,
-               r.person_name AS person_name,
-               toString(r.created_at) AS created_at,
-               toString(r.updated_at) AS updated_at
-        ORDER BY r.created_at DESC
-        """
-        result = await db.run(query, user_id=current_user["id"])
+        params["person_name"] = person_name
+        where.append("r.person_name = $person_name")
+    if cursor:
+        try:
+            params["after_created_at"], params["after_id"] = decode_cursor(cursor, 2)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        where.append(
+            "(r.created_at < datetime($after_created_at)"
+            " OR (r.created_at = datetime($after_created_at) AND r.id < $after_id))"
+        )
+
+    query = "MATCH (u:User {id: $user_id})-[:OWNS]->(r:Resume)"
+    if where:
+        query += "\nWHERE " + " AND ".join(where)
+    query += """
+    RETURN r.id AS resume_id,
+           r.name AS resume_name,
+           r.person_name AS person_name,
+           toString(r.created_at) AS created_at,
+           toString(r.updated_at) AS updated_at
+    ORDER BY r.created_at DESC, r.id DESC
+    """
+    if limit is not None:
+        params["limit"] = limit + 1
+        query += "LIMIT $limit"
+    result = await db.run(query, **params)
 
     resumes = []
     async for record in result:
@@ -277,7 +345,12 @@ async def list_resumes(
             updated_at=record.get("updated_at"),
         ))
 
-    return ResumeList(resumes=resumes)
+    next_cursor = None
+    if limit is not None and len(resumes) > limit:
+        resumes = resumes[:limit]
+        next_cursor = encode_cursor(resumes[-1].created_at, resumes[-1].resume_id)
+
+    return ResumeList(resumes=resumes, next_cursor=next_cursor)
 
 
 @router.delete("/{resume_id}")
@@ -306,6 +379,7 @@ async def delete_resume(
         user_id=current_user["id"],
         resume_id=resume_id,
     )
+    resume_profile_cache.invalidate(resume_id)
 
     return {"message": "Resume deleted successfully", "resume_id": resume_id}
 
@@ -354,6 +428,7 @@ async def save_job_to_resume(
     SET j.title         = coalesce($title, j.title),
         j.company       = coalesce($company, j.company),
         j.location      = coalesce($location, j.location),
+        j.location_lc   = toLower(coalesce($location, j.location)),
         j.source        = coalesce($source, j.source),
         j.description   = coalesce($description, j.description),
         j.salary_text   = coalesce($salary_text, j.salary_text),
@@ -361,14 +436,17 @@ async def save_job_to_resume(
         j.remote        = coalesce($remote, j.remote),
         j.posted_at     = coalesce($posted_at, j.posted_at),
         j.source_url    = coalesce($source_url, j.source_url),
-        j.updated_at    = datetime()
+        j.updated_at    = datetime(),
+        j.sort_ts       = coalesce(j.sort_ts, timestamp())
     WITH j
     MATCH (u:User {id: $user_id})-[:OWNS]->(r:Resume {id: $resume_id})
     MERGE (u)-[:OWNS]->(j)
     MERGE (r)-[s:SAVED_JOB]->(j)
       ON CREATE SET s.saved_at = datetime()
     SET s.notes = coalesce($notes, s.notes)
-    RETURN j.apply_url AS apply_url
+    RETURN j {.apply_url, .title, .company, .location, .description,
+              .ats_requirements_hash, .ats_requirements} AS job,
+           coalesce(r.profile_version, toString(r.updated_at)) AS profile_version
     """
     result = await db.run(
         save_query,
@@ -391,89 +469,68 @@ async def save_job_to_resume(
     if not record:
         raise HTTPException(status_code=500, detail="Failed to save job")
 
+    # Keep the posting in the skill index so skill-gap analysis sees it.
+    job = record["job"]
+    requirements = ats_service.get_job_requirements(job)
+    await job_skill_index_service.link(db, [skill_index_row(job["apply_url"], requirements)])
+    # Materialize the ATS score now, so listing saved jobs is a pure read.
+    await saved_job_score_service.score_saved_job(
+        db, resume_id=data.resume_id, profile_version=record["profile_version"], job=job
+    )
+
     return {
         "message": "Job saved successfully",
         "resume_id": data.resume_id,
-        "job_url": record["apply_url"],
+        "job_url": job["apply_url"],
     }
 
 
 @router.get("/saved-jobs/{resume_id}", response_model=SavedJobsList)
 async def get_saved_jobs(
     resume_id: str,
+    background_tasks: BackgroundTasks,
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
+    cursor: Optional[str] = None,
     db=Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    """List saved jobs for a resume the current user owns, with ATS scores."""
-    resume_query = """
-    MATCH (u:User {id: $user_id})-[:OWNS]->(r:Resume {id: $resume_id})
-    RETURN r.name AS resume_name, r.person_name AS person_name
-    """
-    resume_record = await (await db.run(
-        resume_query, user_id=current_user["id"], resume_id=resume_id
-    )).single()
-    if not resume_record:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    profile_query = """
-    MATCH (r:Resume {id: $resume_id})
-    OPTIONAL MATCH (r)-[:HAS_SKILL]->(s:Skill)
-    OPTIONAL MATCH (r)-[:HAS_EXPERIENCE]->(e:Experience)
-    OPTIONAL MATCH (r)-[:HAS_EDUCATION]->(ed:Education)
-    RETURN collect(DISTINCT s.name) AS skills,
-           collect(DISTINCT e.description) AS experiences,
-           collect(DISTINCT e.title) AS experience_titles,
-           collect(DISTINCT ed.degree) AS education,
-           collect(DISTINCT r.text) AS resume_texts
-    """
-    person_data = await (await db.run(profile_query, resume_id=resume_id)).single()
-
-    resume_profile = ats_service.build_resume_profile(
-        skills=person_data["skills"] or [],
-        experiences=person_data["experiences"] or [],
-        experience_titles=person_data["experience_titles"] or [],
-        education=person_data["education"] or [],
-        resume_text=" ".join(person_data["resume_texts"] or []),
-    )
+    """List saved jobs for a resume the current user owns, with ATS scores.
 
-    jobs_query = """
-    MATCH (r:Resume {id: $resume_id})-[s:SAVED_JOB]->(j:JobPosting)
-    RETURN j.title AS title,
-           j.company AS company,
-           j.location AS location,
-           j.apply_url AS apply_url,
-           j.source AS source,
-           j.description AS description,
-           toString(s.saved_at) AS saved_at,
-           s.notes AS notes
-    ORDER BY s.saved_at DESC
+    Scores are materialized on the SAVED_JOB relationship and only
+    recomputed when the resume, the posting or the scoring version changes;
+    recomputed scores are written back after the response.
+    With ``limit`` the list is paged; pass back ``next_cursor`` as ``cursor``.
     """
-    result = await db.run(jobs_query, resume_id=resume_id)
-
-    jobs = []
-    async for record in result:
-        scoring = ats_service.score_resume_to_job(resume_profile, {
-            "description": record.get("description", ""),
-            "title": record.get("title", ""),
-            "company": record.get("company", ""),
-            "location": record.get("location", ""),
-        })
-        jobs.append(SavedJobInfo(
-            job_title=record["title"],
-            company=record.get("company"),
-            location=record.get("location"),
-            apply_url=record["apply_url"],
-            source=record.get("source"),
-            saved_at=record["saved_at"],
-            notes=record.get("notes"),
-            ats_score=scoring["ats_score"],
-            ats_details=scoring["ats_details"],
-        ))
+    try:
+        saved = await saved_job_score_service.load_saved_jobs(
+            db, user_id=current_user["id"], resume_id=resume_id, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if saved is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    background_tasks.add_task(saved_job_score_service.persist, saved["pending_scores"])
+
+    jobs = [
+        SavedJobInfo(
+            job_title=job["title"],
+            company=job.get("company"),
+            location=job.get("location"),
+            apply_url=job["apply_url"],
+            source=job.get("source"),
+            saved_at=job["saved_at"],
+            notes=job.get("notes"),
+            ats_score=job["ats_score"],
+            ats_details=job["ats_details"],
+        )
+        for job in saved["jobs"]
+    ]
 
     return SavedJobsList(
         resume_id=resume_id,
-        resume_name=resume_record["resume_name"],
+        resume_name=saved["resume_name"],
         jobs=jobs,
+        next_cursor=saved["next_cursor"],
     )
 
 
@@ -505,62 +562,23 @@ async def remove_saved_job(
 @router.get("/skill-gap-analysis/{resume_id}", response_model=SkillGapAnalysis)
 async def analyze_skill_gaps(
     resume_id: str,
+    background_tasks: BackgroundTasks,
     db=Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    """Cross-resume skill gap analysis (saved jobs vs resume skills)."""
-    resume_query = """
-    MATCH (u:User {id: $user_id})-[:OWNS]->(r:Resume {id: $resume_id})
-    RETURN r.name AS resume_name, r.person_name AS person_name
-    """
-    resume_record = await (await db.run(
-        resume_query, user_id=current_user["id"], resume_id=resume_id
-    )).single()
-    if not resume_record:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    """Cross-resume skill gap analysis (saved jobs vs resume skills).
 
-    profile_query = """
-    MATCH (r:Resume {id: $resume_id})
-    OPTIONAL MATCH (r)-[:HAS_SKILL]->(s:Skill)
-    OPTIONAL MATCH (r)-[:HAS_EXPERIENCE]->(e:Experience)
-    OPTIONAL MATCH (r)-[:HAS_EDUCATION]->(ed:Education)
-    RETURN collect(DISTINCT s.name) AS skills,
-           collect(DISTINCT e.description) AS experiences,
-           collect(DISTINCT e.title) AS experience_titles,
-           collect(DISTINCT ed.degree) AS education,
-           collect(DISTINCT r.text) AS resume_texts
-    """
-    person_data = await (await db.run(profile_query, resume_id=resume_id)).single()
-
-    resume_profile = ats_service.build_resume_profile(
-        skills=person_data["skills"] or [],
-        experiences=person_data["experiences"] or [],
-        experience_titles=person_data["experience_titles"] or [],
-        education=person_data["education"] or [],
-        resume_text=" ".join(person_data["resume_texts"] or []),
+    The saved jobs' skills are read from the skill index (see
+    ``job_skill_index_service``) and compared with the resume's ATS profile
+    skills; the average ATS score comes from the saved jobs' scores."""
+    saved = await saved_job_score_service.load_saved_jobs(
+        db, user_id=current_user["id"], resume_id=resume_id
     )
+    if saved is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    background_tasks.add_task(saved_job_score_service.persist, saved["pending_scores"])
 
-    jobs_query = """
-    MATCH (r:Resume {id: $resume_id})-[s:SAVED_JOB]->(j:JobPosting)
-    RETURN j.title AS title,
-           j.company AS company,
-           j.location AS location,
-           j.apply_url AS apply_url,
-           j.source AS source,
-           j.description AS description
-    ORDER BY s.saved_at DESC
-    """
-    result = await db.run(jobs_query, resume_id=resume_id)
-
-    jobs_data = []
-    async for record in result:
-        jobs_data.append({
-            "description": record.get("description", ""),
-            "title": record.get("title", ""),
-            "company": record.get("company", ""),
-            "location": record.get("location", ""),
-        })
-
+    jobs_data = saved["jobs"]
     if not jobs_data:
         raise HTTPException(status_code=400, detail="No saved jobs found for analysis")
 
@@ -568,26 +586,24 @@ async def analyze_skill_gaps(
     all_preferred_skills = {}
     all_job_skills = set()
     matched_skills = set()
-    total_ats_scores = 0
-
-    for job_data in jobs_data:
-        scoring = ats_service.score_resume_to_job(resume_profile, job_data)
-        total_ats_scores += scoring["ats_score"]
-        ats_details = scoring.get("ats_details", {})
-
-        if "matched" in ats_details and "required_skills" in ats_details["matched"]:
-            matched_skills.update(ats_details["matched"]["required_skills"])
-        if "missing" in ats_details and "required_skills" in ats_details["missing"]:
-            for skill in ats_details["missing"]["required_skills"]:
-                all_required_skills[skill] = all_required_skills.get(skill, 0) + 1
-        if "missing" in ats_details and "preferred_skills" in ats_details["missing"]:
-            for skill in ats_details["missing"]["preferred_skills"]:
-                all_preferred_skills[skill] = all_preferred_skills.get(skill, 0) + 1
-        if "job_requirements" in ats_details and "all_skills" in ats_details["job_requirements"]:
-            all_job_skills.update(ats_details["job_requirements"]["all_skills"])
+
+    # Job-side skill counts come from the skill index; matched/missing is
+    # decided against the same profile skills the ATS scores use.
+    profile = await resume_profile_cache.get_profile(db, resume_id)
+    resume_skills = set(profile.skills) if profile else set()
+    for row in await job_skill_index_service.saved_job_skills(db, resume_id):
+        skill, kind = row["skill"], row["kind"]
+        all_job_skills.add(skill)
+        if skill in resume_skills:
+            if kind == "required":
+                matched_skills.add(skill)
+        elif kind == "required":
+            all_required_skills[skill] = row["jobs"]
+        elif kind == "preferred":
+            all_preferred_skills[skill] = row["jobs"]
 
     job_count = len(jobs_data)
-    avg_ats_score = total_ats_scores / job_count if job_count > 0 else 0
+    avg_ats_score = sum(job["ats_score"] for job in jobs_data) / job_count
 
     def get_importance(frequency: int) -> str:
         ratio = frequency / job_count
@@ -642,7 +658,7 @@ async def analyze_skill_gaps(
 
     return SkillGapAnalysis(
         resume_id=resume_id,
-        resume_name=resume_record["resume_name"],
+        resume_name=saved["resume_name"],
         skill_analysis={
             "matched_skills": sorted(list(matched_skills)),
             "missing_required_skills": missing_required,
@@ -24,6 +24,7 @@ class ResumeInfo(BaseModel):
 class ResumeList(BaseModel):
     """List of resumes."""
     resumes: List[ResumeInfo]
+    next_cursor: Optional[str] = None
 
 
 class JobSnapshot(BaseModel):
@@ -70,6 +71,7 @@ class SavedJobsList(BaseModel):
     resume_id: str
     resume_name: str
     jobs: List[SavedJobInfo]
+    next_cursor: Optional[str] = None
 
 
 class SkillGapItem(BaseModel):
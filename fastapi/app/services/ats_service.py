@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, Iterable, List, Optional
 
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
 
 SKILL_ALIASES: dict[str, list[str]] = {
     "python": ["python"],
@@ -147,6 +155,20 @@ RESPONSIBILITY_MARKERS = [
     "in this role",
 ]
 
+# Bump whenever extract_job_requirements changes its output so cached and
+# persisted JobRequirements are recomputed.
+REQUIREMENTS_VERSION = 1
+
+# Bump whenever the scoring formula changes so materialized scores (stored
+# on SAVED_JOB relationships) are recomputed. Alias-table changes are
+# tracked separately by ATSScoringService.scoring_version.
+ATS_SCORING_VERSION = 1
+
+# JobPosting properties written by JobRequirements.to_node_properties().
+# Only trusted when read from the database: client-supplied job dicts must
+# have them stripped (see strip_requirement_properties).
+JOB_REQUIREMENT_PROPERTIES = ("ats_requirements_hash", "ats_requirements")
+
 STOPWORDS = {
     "and", "the", "for", "with", "that", "this", "from", "your", "will", "our",
     "you", "are", "has", "have", "using", "use", "into", "across", "build",
@@ -155,6 +177,124 @@ STOPWORDS = {
 }
 
 
+def _build_skill_matcher(
+    aliases: dict[str, list[str]],
+) -> tuple[re.Pattern[str], dict[str, frozenset[str]]]:
+    """Compile every alias into one pattern that is scanned once per text.
+
+    The alternation sits inside a lookahead so every start position is
+    tried, which keeps overlapping hits (``js`` inside ``next.js``) that a
+    consuming alternation would swallow. Alternatives are ordered longest
+    first, so each position reports its longest alias; any shorter alias
+    that is a boundary-terminated prefix of it (``tensorflow`` inside
+    ``tensorflow/keras``) is folded into that alias's canonical set.
+    """
+    alias_to_canonical: dict[str, str] = {}
+    for canonical, alias_list in aliases.items():
+        for alias in alias_list:
+            alias_to_canonical.setdefault(alias.lower(), canonical)
+
+    ordered = sorted(alias_to_canonical, key=lambda alias: (-len(alias), alias))
+    alias_hits: dict[str, frozenset[str]] = {}
+    for alias in ordered:
+        hits = {alias_to_canonical[alias]}
+        for other, canonical in alias_to_canonical.items():
+            if (
+                len(other) < len(alias)
+                and alias.startswith(other)
+                and not re.match(r"\w", alias[len(other)])
+            ):
+                hits.add(canonical)
+        alias_hits[alias] = frozenset(hits)
+
+    alternation = "|".join(re.escape(alias) for alias in ordered)
+    pattern = re.compile(rf"(?<!\w)(?=({alternation})(?!\w))")
+    return pattern, alias_hits
+
+
+def skill_aliases_version(aliases: dict[str, list[str]]) -> str:
+    """Short content hash of an alias table, stable across processes."""
+    payload = json.dumps(aliases, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def strip_requirement_properties(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a client-supplied job without persisted-requirement properties,
+    so forged requirements never reach ``requirements_cache``."""
+    return {key: value for key, value in job.items() if key not in JOB_REQUIREMENT_PROPERTIES}
+
+
+def job_content_hash(job: Dict[str, Any]) -> str:
+    """Hash the job fields that feed requirement extraction."""
+    content = "\x1f".join([
+        str(REQUIREMENTS_VERSION),
+        str(job.get("title", "")),
+        str(job.get("company", "")),
+        str(job.get("location", "")),
+        str(job.get("description", "")),
+    ])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class JobRequirements:
+    """Job-side half of an ATS score; identical for every resume."""
+
+    content_hash: str
+    all_skills: tuple[str, ...]
+    required_skills: tuple[str, ...]
+    preferred_skills: tuple[str, ...]
+    seniority: Optional[str]
+    years_required: Optional[int]
+    degree_required: Optional[str]
+    responsibility_keywords: tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, content_hash: str, data: dict[str, Any]) -> "JobRequirements":
+        return cls(
+            content_hash=content_hash,
+            all_skills=tuple(data.get("all_skills") or ()),
+            required_skills=tuple(data.get("required_skills") or ()),
+            preferred_skills=tuple(data.get("preferred_skills") or ()),
+            seniority=data.get("seniority"),
+            years_required=data.get("years_required"),
+            degree_required=data.get("degree_required"),
+            responsibility_keywords=tuple(data.get("responsibility_keywords") or ()),
+        )
+
+    @classmethod
+    def from_node_properties(cls, job: Any, requirements_hash: str) -> Optional["JobRequirements"]:
+        """Load requirements persisted on a JobPosting, if still current.
+
+        Args:
+            job: JobPosting properties as read from the database
+            requirements_hash: ``ATSScoringService.requirements_hash(job)``
+        """
+        stored_hash = job.get("ats_requirements_hash")
+        payload = job.get("ats_requirements")
+        if not stored_hash or not payload or stored_hash != requirements_hash:
+            return None
+        try:
+            return cls.from_dict(stored_hash, json.loads(payload))
+        except (TypeError, ValueError):
+            return None
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("content_hash")
+        for key, value in data.items():
+            if isinstance(value, tuple):
+                data[key] = list(value)
+        return data
+
+    def to_node_properties(self) -> dict[str, Any]:
+        """Properties stored on the JobPosting node at ingest time."""
+        return {
+            "ats_requirements_hash": self.content_hash,
+            "ats_requirements": json.dumps(self.as_dict()),
+        }
+
+
 @dataclass
 class ResumeATSProfile:
     skills: list[str]
@@ -164,7 +304,52 @@ class ResumeATSProfile:
     resume_text: str = ""
 
 
+@dataclass(frozen=True)
+class _ResumeScoringContext:
+    """Resume-side scoring signals, derived once per scoring call."""
+
+    skills: frozenset[str]
+    title_tokens: frozenset[str]
+    seniority: Optional[str]
+    years: int
+    degree: Optional[str]
+    responsibility_text: str
+    domain_text: str
+    base_penalties: float
+
+
 class ATSScoringService:
+    def __init__(
+        self,
+        skill_aliases: Optional[dict[str, list[str]]] = None,
+        requirements_cache_size: Optional[int] = None,
+    ):
+        self.requirements_cache: LRUCache[str, JobRequirements] = LRUCache(
+            settings.ats_requirements_cache_size
+            if requirements_cache_size is None
+            else requirements_cache_size
+        )
+        self.reload_skill_aliases(skill_aliases)
+
+    def reload_skill_aliases(self, skill_aliases: Optional[dict[str, list[str]]] = None) -> None:
+        """Rebuild the compiled skill matcher (defaults to ``SKILL_ALIASES``)."""
+        self.skill_aliases = skill_aliases if skill_aliases is not None else SKILL_ALIASES
+        self.skill_aliases_version = skill_aliases_version(self.skill_aliases)
+        self._skill_pattern, self._skill_alias_hits = _build_skill_matcher(self.skill_aliases)
+        self.requirements_cache.clear()
+
+    def requirements_hash(self, job: Dict[str, Any]) -> str:
+        """Key of a job's requirements: its content hash under the current
+        alias table, as ``"<aliases version>:<content hash>"`` so stored
+        hashes from another table can be found by prefix."""
+        return f"{self.skill_aliases_version}:{job_content_hash(job)}"
+
+    @property
+    def scoring_version(self) -> str:
+        """Staleness stamp for materialized scores: the scoring formula
+        version plus the alias table that produced the skill matches."""
+        return f"{ATS_SCORING_VERSION}:{self.skill_aliases_version}"
+
     def expand_skill_hierarchy(self, skills: Iterable[str]) -> set[str]:
         expanded = set(skills)
         changed = True
@@ -210,15 +395,24 @@ class ATSScoringService:
         )
 
     def extract_known_skills(self, text: str) -> list[str]:
-        haystack = text.lower()
-        matches: list[str] = []
-        for canonical, aliases in SKILL_ALIASES.items():
-            if any(
-                re.search(rf"(?<!\w){re.escape(alias.lower())}(?!\w)", haystack)
-                for alias in aliases
-            ):
-                matches.append(canonical)
-        return sorted(set(matches))
+        alias_hits = self._skill_alias_hits
+        matches: set[str] = set()
+        for found in {match.group(1) for match in self._skill_pattern.finditer(text.lower())}:
+            matches.update(alias_hits[found])
+        return sorted(matches)
+
+    def canonical_skill_names(self, raw_skill: str) -> list[str]:
+        """Canonical ``Skill`` names for one skill as written on a resume.
+
+        Known skills map through the alias table (``"Python/Django"`` gives
+        ``["django", "python"]``); anything else is lowercased with its
+        whitespace collapsed, so spelling variants still share a node.
+        """
+        known = self.extract_known_skills(raw_skill)
+        if known:
+            return known
+        name = " ".join(raw_skill.lower().split())
+        return [name] if name else []
 
     def extract_keywords(self, text: str) -> list[str]:
         words = re.findall(r"[a-zA-Z0-9\-+.#]+", text.lower())
@@ -337,86 +531,97 @@ class ATSScoringService:
             "responsibility_keywords": responsibility_keywords,
         }
 
-    def score_resume_to_job(
-        self,
-        profile: ResumeATSProfile,
-        job: Dict[str, Any],
-    ) -> dict[str, Any]:
-        requirements = self.extract_job_requirements(job)
-
-        required_skills = set(requirements["required_skills"])
-        preferred_skills = set(requirements["preferred_skills"])
-        resume_skills = set(profile.skills)
-
-        matched_required = sorted(required_skills & resume_skills)
-        missing_required = sorted(required_skills - resume_skills)
-        matched_preferred = sorted(preferred_skills & resume_skills)
-        missing_preferred = sorted(preferred_skills - resume_skills)
-
-        required_ratio = self.overlap_ratio(required_skills, resume_skills)
-        preferred_ratio = self.overlap_ratio(preferred_skills, resume_skills)
-        hard_skills_score = round((required_ratio * 0.75 + preferred_ratio * 0.25) * 35, 2)
-
-        resume_title_tokens = set().union(*[
+    def get_job_requirements(self, job: Dict[str, Any]) -> JobRequirements:
+        """Return the job's requirements, extracting them at most once per content hash.
+
+        Lookup order: in-memory LRU, properties persisted on the JobPosting
+        node at ingest, then a fresh extraction. ``job`` must be read from
+        the database or passed through ``strip_requirement_properties``.
+        """
+        content_hash = self.requirements_hash(job)
+        requirements = self.requirements_cache.get(content_hash)
+        if requirements is None:
+            requirements = JobRequirements.from_node_properties(job, content_hash)
+            if requirements is None:
+                requirements = JobRequirements.from_dict(
+                    content_hash, self.extract_job_requirements(job)
+                )
+            self.requirements_cache.set(content_hash, requirements)
+        return requirements
+
+    def _resume_context(self, profile: ResumeATSProfile) -> _ResumeScoringContext:
+        title_tokens = set().union(*[
             self.normalize_title_tokens(title) for title in profile.experience_titles
         ]) if profile.experience_titles else set()
-        job_title_tokens = self.normalize_title_tokens(str(job.get("title", "")))
-        title_ratio = self.overlap_ratio(job_title_tokens, resume_title_tokens)
+        base_penalties = 0.0
+        if len(profile.skills) < 3:
+            base_penalties += 1.0
+        if not re.search(r"\d", profile.resume_text):
+            base_penalties += 1.0
+        return _ResumeScoringContext(
+            skills=frozenset(profile.skills),
+            title_tokens=frozenset(title_tokens),
+            seniority=self.extract_seniority(" ".join(profile.experience_titles)),
+            years=self.infer_years_from_resume(profile),
+            degree=self.detect_resume_degree(profile),
+            responsibility_text=f"{profile.experience_text} {profile.resume_text}".lower(),
+            domain_text=" ".join(profile.skills + profile.experience_titles).lower(),
+            base_penalties=base_penalties,
+        )
 
-        job_seniority = requirements["seniority"]
-        resume_seniority = self.extract_seniority(" ".join(profile.experience_titles))
-        seniority_score = 0.0
+    @staticmethod
+    def _seniority_ratio(job_seniority: Optional[str], resume_seniority: Optional[str]) -> float:
         if job_seniority and resume_seniority:
             diff = SENIORITY_ORDER.get(resume_seniority, 0) - SENIORITY_ORDER.get(job_seniority, 0)
             if diff >= 0:
-                seniority_score = 1.0
-            elif diff == -1:
-                seniority_score = 0.55
-            else:
-                seniority_score = 0.2
-        elif job_seniority:
-            seniority_score = 0.5
-        else:
-            seniority_score = 1.0
+                return 1.0
+            if diff == -1:
+                return 0.55
+            return 0.2
+        if job_seniority:
+            return 0.5
+        return 1.0
+
+    @staticmethod
+    def _education_ratio(degree_required: Optional[str], resume_degree: Optional[str]) -> float:
+        if not degree_required or resume_degree == degree_required:
+            return 1.0
+        if resume_degree:
+            degree_rank = {"bachelors": 1, "masters": 2, "phd": 3}
+            return 0.8 if degree_rank.get(resume_degree, 0) > degree_rank.get(degree_required, 0) else 0.0
+        return 0.0
+
+    def _category_scores(
+        self,
+        requirements: JobRequirements,
+        context: _ResumeScoringContext,
+        *,
+        required_ratio: float,
+        preferred_ratio: float,
+        title_ratio: float,
+        responsibility_ratio: float,
+        domain_ratio: float,
+        missing_required_count: int,
+    ) -> dict[str, float]:
+        """Combine per-job ratios into rounded category scores and the total."""
+        hard_skills_score = round((required_ratio * 0.75 + preferred_ratio * 0.25) * 35, 2)
+
+        seniority_score = self._seniority_ratio(requirements.seniority, context.seniority)
         title_seniority_score = round((title_ratio * 0.45 + seniority_score * 0.55) * 15, 2)
 
-        responsibility_ratio = self.partial_overlap_ratio(
-            requirements["responsibility_keywords"],
-            f"{profile.experience_text} {profile.resume_text}".lower(),
-        )
-        years_required = requirements["years_required"]
-        years_have = self.infer_years_from_resume(profile)
         years_ratio = 1.0
-        if years_required:
-            years_ratio = min(years_have / years_required, 1.0)
+        if requirements.years_required:
+            years_ratio = min(context.years / requirements.years_required, 1.0)
         experience_relevance_score = round((responsibility_ratio * 0.6 + years_ratio * 0.4) * 25, 2)
 
-        degree_required = requirements["degree_required"]
-        resume_degree = self.detect_resume_degree(profile)
-        education_ratio = 1.0
-        if degree_required:
-            if resume_degree == degree_required:
-                education_ratio = 1.0
-            elif resume_degree:
-                degree_rank = {"bachelors": 1, "masters": 2, "phd": 3}
-                education_ratio = 0.8 if degree_rank.get(resume_degree, 0) > degree_rank.get(degree_required, 0) else 0.0
-            else:
-                education_ratio = 0.0
+        education_ratio = self._education_ratio(requirements.degree_required, context.degree)
         education_certs_score = round(education_ratio * 10, 2)
 
-        domain_ratio = self.partial_overlap_ratio(
-            requirements["responsibility_keywords"],
-            " ".join(profile.skills + profile.experience_titles).lower(),
-        )
         keyword_domain_score = round(domain_ratio * 10, 2)
 
-        penalties = 0.0
-        if missing_required:
-            penalties += min(len(missing_required) * 1.5, 5.0)
-        if len(profile.skills) < 3:
-            penalties += 1.0
-        if not re.search(r"\d", profile.resume_text):
-            penalties += 1.0
+        penalties = context.base_penalties
+        if missing_required_count:
+            penalties += min(missing_required_count * 1.5, 5.0)
         penalties = round(min(penalties, 5.0), 2)
 
         total_score = round(
@@ -428,7 +633,33 @@ class ATSScoringService:
             - penalties,
             2,
         )
-        total_score = max(0.0, min(100.0, total_score))
+        return {
+            "total": max(0.0, min(100.0, total_score)),
+            "hard_skills": hard_skills_score,
+            "experience_relevance": experience_relevance_score,
+            "title_seniority": title_seniority_score,
+            "education_certs": education_certs_score,
+            "keywords_domain": keyword_domain_score,
+            "penalties": -penalties,
+        }
+
+    def _build_result(
+        self,
+        requirements: JobRequirements,
+        context: _ResumeScoringContext,
+        scores: dict[str, float],
+    ) -> dict[str, Any]:
+        required_skills = set(requirements.required_skills)
+        preferred_skills = set(requirements.preferred_skills)
+        resume_skills = context.skills
+
+        matched_required = sorted(required_skills & resume_skills)
+        missing_required = sorted(required_skills - resume_skills)
+        matched_preferred = sorted(preferred_skills & resume_skills)
+        missing_preferred = sorted(preferred_skills - resume_skills)
+
+        years_required = requirements.years_required
+        job_seniority = requirements.seniority
 
         reasoning: list[str] = []
         if matched_required:
@@ -441,26 +672,21 @@ class ATSScoringService:
             )
         if years_required:
             reasoning.append(
-                f"Role asks for about {years_required}+ years; inferred resume experience is {years_have} years."
+                f"Role asks for about {years_required}+ years; inferred resume experience is {context.years} years."
             )
         if job_seniority:
             reasoning.append(
-                f"Job seniority target is {job_seniority}; resume appears {resume_seniority or 'unspecified'}."
+                f"Job seniority target is {job_seniority}; resume appears {context.seniority or 'unspecified'}."
             )
 
-        evidence_points = len(required_skills) + len(preferred_skills) + len(requirements["responsibility_keywords"])
+        evidence_points = len(required_skills) + len(preferred_skills) + len(requirements.responsibility_keywords)
         confidence = "high" if evidence_points >= 10 else "medium" if evidence_points >= 5 else "low"
 
         return {
-            "ats_score": total_score,
+            "ats_score": scores["total"],
             "ats_details": {
                 "category_scores": {
-                    "hard_skills": hard_skills_score,
-                    "experience_relevance": experience_relevance_score,
-                    "title_seniority": title_seniority_score,
-                    "education_certs": education_certs_score,
-                    "keywords_domain": keyword_domain_score,
-                    "penalties": -penalties,
+                    key: value for key, value in scores.items() if key != "total"
                 },
                 "matched": {
                     "required_skills": matched_required,
@@ -473,16 +699,213 @@ class ATSScoringService:
                 "reasoning": reasoning,
                 "confidence": confidence,
                 "job_requirements": {
-                    "all_skills": sorted(set(requirements["all_skills"])),
+                    "all_skills": sorted(set(requirements.all_skills)),
                     "required_skills": sorted(required_skills),
                     "preferred_skills": sorted(preferred_skills),
                     "seniority": job_seniority,
                     "years_required": years_required,
-                    "degree_required": degree_required,
+                    "degree_required": requirements.degree_required,
                 },
             },
         }
 
+    def score_resume_to_job(
+        self,
+        profile: ResumeATSProfile,
+        job: Dict[str, Any],
+        requirements: Optional[JobRequirements] = None,
+    ) -> dict[str, Any]:
+        requirements = requirements or self.get_job_requirements(job)
+        context = self._resume_context(profile)
+
+        scores = self._category_scores(
+            requirements,
+            context,
+            required_ratio=self.overlap_ratio(requirements.required_skills, context.skills),
+            preferred_ratio=self.overlap_ratio(requirements.preferred_skills, context.skills),
+            title_ratio=self.overlap_ratio(
+                self.normalize_title_tokens(str(job.get("title", ""))),
+                context.title_tokens,
+            ),
+            responsibility_ratio=self.partial_overlap_ratio(
+                requirements.responsibility_keywords, context.responsibility_text
+            ),
+            domain_ratio=self.partial_overlap_ratio(
+                requirements.responsibility_keywords, context.domain_text
+            ),
+            missing_required_count=len(set(requirements.required_skills) - context.skills),
+        )
+        return self._build_result(requirements, context, scores)
+
+    def _batch_ratios(
+        self,
+        context: _ResumeScoringContext,
+        jobs: List[Dict[str, Any]],
+        requirements: List[JobRequirements],
+        include_titles: bool = True,
+    ) -> dict[str, np.ndarray]:
+        """Overlap ratios for every job at once, as boolean incidence matrices."""
+        skills_index: dict[str, int] = {}
+        required = _incidence_matrix([req.required_skills for req in requirements], skills_index)
+        preferred = _incidence_matrix([req.preferred_skills for req in requirements], skills_index)
+        resume_skills = _membership_vector(skills_index, context.skills.__contains__)
+
+        keyword_index: dict[str, int] = {}
+        keywords = _incidence_matrix(
+            [req.responsibility_keywords for req in requirements], keyword_index
+        )
+        in_experience = _membership_vector(
+            keyword_index, lambda keyword: keyword in context.responsibility_text
+        )
+        in_domain = _membership_vector(
+            keyword_index, lambda keyword: keyword in context.domain_text
+        )
+
+        required_ratio, required_matched = _overlap_ratios(required, resume_skills)
+        ratios = {
+            "required_ratio": required_ratio,
+            "preferred_ratio": _overlap_ratios(preferred, resume_skills)[0],
+            "responsibility_ratio": _overlap_ratios(keywords, in_experience)[0],
+            "domain_ratio": _overlap_ratios(keywords, in_domain)[0],
+            "missing_required_count": required.sum(axis=1) - required_matched,
+        }
+        if include_titles:
+            title_index: dict[str, int] = {}
+            titles = _incidence_matrix(
+                [self.normalize_title_tokens(str(job.get("title", ""))) for job in jobs],
+                title_index,
+            )
+            resume_titles = _membership_vector(title_index, context.title_tokens.__contains__)
+            ratios["title_ratio"] = _overlap_ratios(titles, resume_titles)[0]
+        return ratios
+
+    def score_resume_to_jobs(
+        self,
+        profile: ResumeATSProfile,
+        jobs: Iterable[Dict[str, Any]],
+        requirements: Optional[Iterable[JobRequirements]] = None,
+    ) -> list[dict[str, Any]]:
+        """Score one resume against many jobs; same output as score_resume_to_job per job.
+
+        Resume-side signals are derived once and the skill, title-token and
+        responsibility-keyword overlaps for all jobs are computed as
+        matrix operations instead of per-job set arithmetic.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        if requirements is None:
+            requirements = [self.get_job_requirements(job) for job in jobs]
+        else:
+            requirements = list(requirements)
+        context = self._resume_context(profile)
+        ratios = {
+            key: values.tolist()
+            for key, values in self._batch_ratios(context, jobs, requirements).items()
+        }
+
+        results = []
+        for index, job_requirements in enumerate(requirements):
+            scores = self._category_scores(
+                job_requirements,
+                context,
+                **{key: values[index] for key, values in ratios.items()},
+            )
+            results.append(self._build_result(job_requirements, context, scores))
+        return results
+
+    def rank_resume_to_jobs(
+        self,
+        profile: ResumeATSProfile,
+        jobs: Iterable[Dict[str, Any]],
+        top_k: int,
+        requirements: Optional[Iterable[JobRequirements]] = None,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Return ``(job index, scoring)`` for the ``top_k`` best jobs, best first.
+
+        Every job first gets a cheap upper bound that assumes a perfect
+        title match (the only ratio that needs per-job tokenization).
+        Jobs are then scored exactly in bound order into a size-K heap,
+        stopping once the next bound cannot beat the K-th best score;
+        the detailed reasoning and matched/missing lists are only built
+        for the survivors. Ties keep input order, like a stable sort.
+        """
+        jobs = list(jobs)
+        if not jobs or top_k <= 0:
+            return []
+        if requirements is None:
+            requirements = [self.get_job_requirements(job) for job in jobs]
+        else:
+            requirements = list(requirements)
+        context = self._resume_context(profile)
+        ratios = {
+            key: values.tolist()
+            for key, values in self._batch_ratios(
+                context, jobs, requirements, include_titles=False
+            ).items()
+        }
+
+        def category_scores(index: int, title_ratio: float) -> dict[str, float]:
+            return self._category_scores(
+                requirements[index],
+                context,
+                title_ratio=title_ratio,
+                **{key: values[index] for key, values in ratios.items()},
+            )
+
+        bounds = [category_scores(index, 1.0)["total"] for index in range(len(jobs))]
+
+        # Min-heap of (score, -index, scores): the root is the entry to evict.
+        heap: list[tuple[float, int, dict[str, float]]] = []
+        for index in sorted(range(len(jobs)), key=lambda i: (-bounds[i], i)):
+            if len(heap) == top_k and bounds[index] < heap[0][0]:
+                break
+            title_ratio = self.overlap_ratio(
+                self.normalize_title_tokens(str(jobs[index].get("title", ""))),
+                context.title_tokens,
+            )
+            scores = category_scores(index, title_ratio)
+            entry = (scores["total"], -index, scores)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+        ranked = sorted(heap, key=lambda entry: (-entry[0], -entry[1]))
+        return [
+            (-negative_index, self._build_result(requirements[-negative_index], context, scores))
+            for _, negative_index, scores in ranked
+        ]
+
+
+def _incidence_matrix(rows: List[Iterable[str]], index: dict[str, int]) -> np.ndarray:
+    """Encode rows of labels as a boolean matrix, growing ``index`` with new labels."""
+    encoded = [[index.setdefault(label, len(index)) for label in row if label] for row in rows]
+    matrix = np.zeros((len(rows), max(len(index), 1)), dtype=bool)
+    for row_number, columns in enumerate(encoded):
+        matrix[row_number, columns] = True
+    return matrix
+
+
+def _membership_vector(index: dict[str, int], predicate) -> np.ndarray:
+    vector = np.zeros(max(len(index), 1), dtype=bool)
+    for label, column in index.items():
+        if predicate(label):
+            vector[column] = True
+    return vector
+
+
+def _overlap_ratios(expected: np.ndarray, actual: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``overlap_ratio``: matched / expected, or 1.0 when nothing is expected."""
+    # Matrices built earlier against a shared index may be narrower than
+    # the final vector; labels outside their columns cannot match anyway.
+    actual = actual[: expected.shape[1]]
+    expected_counts = expected.sum(axis=1)
+    matched = (expected & actual).sum(axis=1)
+    ratios = np.ones(expected.shape[0], dtype=np.float64)
+    np.divide(matched, expected_counts, out=ratios, where=expected_counts > 0)
+    return ratios, matched
+
 
 # Global service instance
 ats_service = ATSScoringService()
@@ -5,6 +5,7 @@ from typing import Any, List, Optional
 
 from app.services.ats_service import ats_service
 from app.services.llm_service import LLMOutputError, llm_service
+from app.services.resume_queries import context_collections
 from app.schemas.interview import (
     InterviewResponse,
     Question,
@@ -57,11 +58,8 @@ class InterviewService:
         )
 
     async def _get_resume_context(self, db, resume_id: str) -> dict[str, Any]:
-        query = """
-        MATCH (r:Resume {id: $resume_id})-[:BELONGS_TO]->(p:Person)
-        OPTIONAL MATCH (p)-[:HAS_SKILL]->(s:Skill)
-        OPTIONAL MATCH (p)-[:HAS_EXPERIENCE]->(e:Experience)
-        OPTIONAL MATCH (p)-[:HAS_EDUCATION]->(ed:Education)
+        query = f"""
+        MATCH (r:Resume {{id: $resume_id}})-[:BELONGS_TO]->(p:Person)
         RETURN r.id AS resume_id,
                r.name AS resume_name,
                r.text AS resume_text,
@@ -69,18 +67,7 @@ class InterviewService:
                p.email AS person_email,
                p.phone AS person_phone,
                p.location AS person_location,
-               collect(DISTINCT s.name) AS skills,
-               collect(DISTINCT {
-                   title: e.title,
-                   company: e.company,
-                   duration: e.duration,
-                   description: e.description
-               }) AS experiences,
-               collect(DISTINCT {
-                   degree: ed.degree,
-                   institution: ed.institution,
-                   year: ed.year
-               }) AS education
+               {context_collections("p")}
         LIMIT 1
         """
         result = await db.run(query, resume_id=resume_id)
@@ -141,7 +128,7 @@ class InterviewService:
             "description": record.get("description") or "",
             "source": record.get("source"),
         }
-        requirements = ats_service.extract_job_requirements(job_data)
+        requirements = ats_service.get_job_requirements(job_data).as_dict()
         return {
             **job_data,
             "required_skills": requirements["required_skills"],
@@ -0,0 +1,316 @@
+"""Cross-source job deduplication using content fingerprints.
+
+The same role is often syndicated to several boards (e.g. Adzuna and
+Remotive) under different apply URLs. Each posting gets:
+
+* ``dedup_fingerprint`` – a hash of its normalized title, company and
+  location; postings can only be duplicates if these agree, and
+* ``simhash`` – a 64-bit SimHash of its description shingles, which tells a
+  re-post of the same role apart from a different role with the same title,
+* ``description_hash`` – an exact hash of the normalized description, which
+  decides instead when either description is too short for a SimHash.
+
+All are persisted on ``JobPosting`` (``dedup_fingerprint`` is indexed), and
+incoming postings that match an existing node from a *different* source are
+folded into it as ``alt_apply_urls``/``alt_sources`` instead of becoming a
+new node. Two postings from the same board are always distinct openings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+DEDUP_VERSION = 2
+
+# Descriptions shorter than this (in word shingles) give an unstable SimHash,
+# and truncated snippets (Adzuna returns ~500 characters) cannot be compared
+# with a full description, so such postings only match an identical text.
+MIN_SIMHASH_SHINGLES = 100
+SHINGLE_SIZE = 3
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_BRACKETED_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation",
+    "co", "company", "gmbh", "plc", "lp", "llp", "sa", "ag", "bv",
+}
+_REMOTE_TERMS = ("remote", "anywhere", "worldwide", "work from home")
+_BIT_SHIFTS = np.arange(64, dtype=np.uint64)
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall(_TAG_RE.sub(" ", text or "").lower())
+
+
+def normalize_title(title: Optional[str]) -> str:
+    return " ".join(_words(_BRACKETED_RE.sub(" ", title or "")))
+
+
+def normalize_company(company: Optional[str]) -> str:
+    words = _words(company or "")
+    while words and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_location(location: Optional[str]) -> str:
+    text = (location or "").lower()
+    if not text or any(term in text for term in _REMOTE_TERMS):
+        return "remote"
+    # "Austin, TX, USA" and "Austin, Texas" should agree: keep the city.
+    return " ".join(_words(text.split(",")[0]))
+
+
+def job_fingerprint(job: Dict[str, Any]) -> Optional[str]:
+    """Hash of the normalized title/company/location, or None without a title."""
+    title = normalize_title(job.get("title"))
+    if not title or title == "unknown":
+        return None
+    key = "\x1f".join((
+        str(DEDUP_VERSION),
+        title,
+        normalize_company(job.get("company")),
+        normalize_location(job.get("location")),
+    ))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+
+
+def simhash64(text: Optional[str]) -> Optional[int]:
+    """
+    64-bit SimHash over word shingles, as a signed integer (Neo4j's int type).
+
+    Returns None when the text is too short to fingerprint reliably.
+    """
+    words = _words(text or "")
+    if len(words) < SHINGLE_SIZE:
+        return None
+    shingles = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    if len(shingles) < MIN_SIMHASH_SHINGLES:
+        return None
+
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    bits = (hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)
+    votes = (bits.astype(np.int64) * 2 - 1).sum(axis=0)
+    value = 0
+    for bit in np.flatnonzero(votes > 0):
+        value |= 1 << int(bit)
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def description_hash(text: Optional[str]) -> Optional[str]:
+    """Hash of the normalized description words, or None without any."""
+    words = _words(text or "")
+    if not words:
+        return None
+    return hashlib.sha1(" ".join(words).encode("utf-8")).hexdigest()[:20]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return ((a ^ b) & 0xFFFFFFFFFFFFFFFF).bit_count()
+
+
+def dedup_properties(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Properties persisted on the JobPosting node for the dedup index."""
+    return {
+        "dedup_fingerprint": job_fingerprint(job),
+        "simhash": simhash64(job.get("description")),
+        "description_hash": description_hash(job.get("description")),
+        "dedup_version": DEDUP_VERSION,
+    }
+
+
+class JobDedupService:
+    """Folds near-duplicate postings into an existing canonical JobPosting."""
+
+    def __init__(self, max_distance: Optional[int] = None):
+        self.max_distance = (
+            settings.job_dedup_max_simhash_distance if max_distance is None else max_distance
+        )
+
+    def is_near_duplicate(self, a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+        """
+        Compare the descriptions of two postings sharing a fingerprint.
+
+        SimHashes decide when both postings have one; otherwise only an
+        identical (normalized) description counts, so short snippets of
+        different roles are never folded together.
+        """
+        if a.get("simhash") is not None and b.get("simhash") is not None:
+            return hamming_distance(a["simhash"], b["simhash"]) <= self.max_distance
+        return a.get("description_hash") is not None and a.get("description_hash") == b.get("description_hash")
+
+    @staticmethod
+    def _from_other_source(entry: Dict[str, Any], row: Dict[str, Any]) -> bool:
+        """
+        Only postings syndicated to another board are duplicates. Applies to
+        new URLs; a URL already folded into ``entry`` is matched by
+        ``alt_apply_urls`` before this check.
+        """
+        source = row.get("source")
+        if source is None or entry.get("source") is None:
+            return False
+        return source != entry["source"] and source not in entry.get("alt_sources", ())
+
+    async def find_candidates(self, tx, rows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Existing canonical postings sharing a fingerprint with any row."""
+        fingerprints = sorted({row["dedup_fingerprint"] for row in rows if row.get("dedup_fingerprint")})
+        if not fingerprints:
+            return {}
+        result = await tx.run(
+            """
+            UNWIND $fingerprints AS fp
+            MATCH (j:JobPosting {dedup_fingerprint: fp})
+            RETURN fp, j.apply_url AS apply_url, j.simhash AS simhash,
+                   j.description_hash AS description_hash, j.source AS source,
+                   coalesce(j.alt_sources, []) AS alt_sources,
+                   coalesce(j.alt_apply_urls, []) AS alt_apply_urls
+            ORDER BY j.created_at
+            """,
+            fingerprints=fingerprints,
+        )
+        candidates: Dict[str, List[Dict[str, Any]]] = {}
+        for record in await result.data():
+            candidates.setdefault(record["fp"], []).append({
+                key: record[key]
+                for key in (
+                    "apply_url", "simhash", "description_hash", "source", "alt_sources", "alt_apply_urls",
+                )
+            })
+        return candidates
+
+    def partition(
+        self,
+        rows: List[Dict[str, Any]],
+        candidates: Dict[str, List[Dict[str, Any]]],
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split rows into postings to upsert and aliases of an existing posting.
+
+        Rows are matched against stored candidates and against earlier rows
+        of the same batch, from other sources only. A row whose URL was
+        already folded into a posting stays an alias of it on every refresh.
+        Returns ``(upserts, aliases)`` where each alias is
+        ``{"canonical_url", "apply_url", "source"}``.
+        """
+        known = {
+            fp: [
+                {
+                    **entry,
+                    "alt_sources": list(entry.get("alt_sources") or []),
+                    "alt_apply_urls": list(entry.get("alt_apply_urls") or []),
+                }
+                for entry in entries
+            ]
+            for fp, entries in candidates.items()
+        }
+        upserts: List[Dict[str, Any]] = []
+        aliases: List[Dict[str, Any]] = []
+        for row in rows:
+            fp = row.get("dedup_fingerprint")
+            entries = known.setdefault(fp, []) if fp else []
+            if any(entry["apply_url"] == row["apply_url"] for entry in entries):
+                upserts.append(row)  # same posting again: plain update
+                continue
+            canonical = next(
+                (entry for entry in entries if row["apply_url"] in entry["alt_apply_urls"]),
+                None,
+            ) or next(
+                (
+                    entry for entry in entries
+                    if self._from_other_source(entry, row) and self.is_near_duplicate(entry, row)
+                ),
+                None,
+            )
+            if canonical is None:
+                upserts.append(row)
+                entries.append({
+                    "apply_url": row["apply_url"],
+                    "simhash": row.get("simhash"),
+                    "description_hash": row.get("description_hash"),
+                    "source": row.get("source"),
+                    "alt_sources": [],
+                    "alt_apply_urls": [],
+                })
+            else:
+                if row.get("source") not in canonical["alt_sources"]:
+                    canonical["alt_sources"].append(row.get("source"))
+                if row["apply_url"] not in canonical["alt_apply_urls"]:
+                    canonical["alt_apply_urls"].append(row["apply_url"])
+                aliases.append({
+                    "canonical_url": canonical["apply_url"],
+                    "apply_url": row["apply_url"],
+                    "source": row.get("source"),
+                })
+        return upserts, aliases
+
+    async def merge_aliases(self, tx, aliases: List[Dict[str, Any]]) -> None:
+        """Record duplicate apply URLs and sources on their canonical posting."""
+        if not aliases:
+            return
+        result = await tx.run(
+            """
+            UNWIND $aliases AS alias
+            MATCH (j:JobPosting {apply_url: alias.canonical_url})
+            WITH j, alias, coalesce(j.alt_apply_urls, []) AS urls, coalesce(j.alt_sources, []) AS sources
+            SET j.alt_apply_urls = CASE WHEN alias.apply_url IN urls THEN urls ELSE urls + alias.apply_url END,
+                j.alt_sources = CASE
+                    WHEN alias.source IS NULL OR alias.source = j.source OR alias.source IN sources THEN sources
+                    ELSE sources + alias.source
+                END,
+                j.updated_at = datetime()
+            """,
+            aliases=aliases,
+        )
+        await result.consume()
+
+    async def backfill(self, db, batch_size: int = 1000) -> int:
+        """Compute dedup properties for postings stored before dedup existed."""
+        updated = 0
+        while True:
+            result = await db.run(
+                """
+                MATCH (j:JobPosting)
+                WHERE j.apply_url IS NOT NULL
+                  AND (j.dedup_version IS NULL OR j.dedup_version <> $version)
+                RETURN j.apply_url AS apply_url, j.title AS title, j.company AS company,
+                       j.location AS location, j.description AS description
+                LIMIT $batch_size
+                """,
+                version=DEDUP_VERSION,
+                batch_size=batch_size,
+            )
+            jobs = await result.data()
+            if not jobs:
+                return updated
+            rows = [{"apply_url": job["apply_url"], **dedup_properties(job)} for job in jobs]
+            write = await db.run(
+                """
+                UNWIND $rows AS row
+                MATCH (j:JobPosting {apply_url: row.apply_url})
+                SET j.dedup_fingerprint = row.dedup_fingerprint,
+                    j.simhash = row.simhash,
+                    j.description_hash = row.description_hash,
+                    j.dedup_version = row.dedup_version
+                """,
+                rows=rows,
+            )
+            await write.consume()
+            updated += len(rows)
+
+
+# Global service instance
+job_dedup_service = JobDedupService()
@@ -1,17 +1,87 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Literal
+from typing import List, Dict, Any, AsyncIterator, Callable, Iterable, Literal, Optional
 import asyncio
+import time
+import xml.etree.ElementTree as ET
+from contextlib import aclosing
+import httpx
 from app.services.job_sources import (
+    JobPage,
+    JobSource,
     USAJobsClient,
     AdzunaClient,
     RemotiveClient,
     WeWorkRemotelyClient,
 )
+from app.services.job_sources.rate_limit import get_source_limiter
 from app.core.config import settings
+from app.core.http import http_clients
+from app.services.ats_service import ats_service
+from app.services.job_dedup_service import dedup_properties, job_dedup_service
+from app.services.job_skill_index_service import job_skill_index_service, skill_index_row
 
 JobSourceType = Literal["usajobs", "adzuna", "remotive", "weworkremotely"]
 
 
+JOB_SOURCE_NAMES = ("usajobs", "adzuna", "remotive", "weworkremotely")
+
+SOURCE_NOT_CONFIGURED = {
+    "usajobs": "USAJOBS API key not configured",
+    "adzuna": "Adzuna API credentials not configured",
+}
+
+
+def open_job_source(source: str) -> JobSource:
+    """
+    Create the client for a job source on the shared HTTP connection pool.
+
+    Raises:
+        ValueError: if the source name is unknown
+    """
+    session = http_clients.get()
+    if source == "usajobs":
+        return USAJobsClient(settings.usajobs_api_key, settings.usajobs_email, session=session)
+    if source == "adzuna":
+        return AdzunaClient(settings.adzuna_app_id, settings.adzuna_app_key, session=session)
+    if source == "remotive":
+        return RemotiveClient(session=session)
+    if source == "weworkremotely":
+        return WeWorkRemotelyClient(session=session)
+    raise ValueError(f"Unknown source: {source}")
+
+
+async def ingest_pages(
+    db,
+    pages: AsyncIterator[JobPage],
+    chunk_size: Optional[int] = None,
+) -> List[Dict[str, int]]:
+    """
+    Write pages from a job source iterator to the graph as they arrive.
+
+    Returns:
+        One {"created", "updated", "merged"} dict per upsert chunk
+    """
+    chunks: List[Dict[str, int]] = []
+    async with aclosing(pages):
+        async for page in pages:
+            chunks.extend(await _upsert_jobs(db, page, chunk_size))
+    return chunks
+
+
+async def _ingest_from(db, source_name: str, **filters: Any) -> int:
+    source = open_job_source(source_name)
+    try:
+        if not source.is_configured():
+            print(f"{SOURCE_NOT_CONFIGURED.get(source_name, source_name)}. Skipping.")
+            return 0
+        return _created(await ingest_pages(db, source.iter_pages(**filters)))
+    except (httpx.HTTPError, ET.ParseError) as e:
+        print(f"{source_name.upper()}: Error - {e}")
+        return 0
+    finally:
+        await source.close()
+
+
 async def ingest_from_usajobs(
     db,
     keyword: str = "",
@@ -32,19 +102,9 @@ async def ingest_from_usajobs(
     Returns:
         Number of new jobs created
     """
-    client = USAJobsClient(settings.usajobs_api_key, settings.usajobs_email)
-    try:
-        if not client.is_configured():
-            print("USAJOBS API key not configured. Skipping.")
-            return 0
-
-        jobs = await client.fetch_jobs(keyword, location, remote, limit)
-        created = 0
-        for job in jobs:
-            created += await _upsert_job(db, job)
-        return created
-    finally:
-        await client.close()
+    return await _ingest_from(
+        db, "usajobs", keyword=keyword, location=location, remote=remote, limit=limit
+    )
 
 
 async def ingest_from_adzuna(
@@ -65,19 +125,7 @@ async def ingest_from_adzuna(
     Returns:
         Number of new jobs created
     """
-    client = AdzunaClient(settings.adzuna_app_id, settings.adzuna_app_key)
-    try:
-        if not client.is_configured():
-            print("Adzuna API credentials not configured. Skipping.")
-            return 0
-
-        jobs = await client.fetch_jobs(keyword, location, results_per_page=limit)
-        created = 0
-        for job in jobs:
-            created += await _upsert_job(db, job)
-        return created
-    finally:
-        await client.close()
+    return await _ingest_from(db, "adzuna", keyword=keyword, location=location, limit=limit)
 
 
 async def ingest_from_remotive(
@@ -96,15 +144,7 @@ async def ingest_from_remotive(
     Returns:
         Number of new jobs created
     """
-    client = RemotiveClient()
-    try:
-        jobs = await client.fetch_jobs(category=category, limit=limit)
-        created = 0
-        for job in jobs:
-            created += await _upsert_job(db, job)
-        return created
-    finally:
-        await client.close()
+    return await _ingest_from(db, "remotive", category=category, limit=limit)
 
 
 async def ingest_from_weworkremotely(
@@ -123,58 +163,127 @@ async def ingest_from_weworkremotely(
     Returns:
         Number of new jobs created
     """
-    client = WeWorkRemotelyClient()
-    try:
-        jobs = await client.fetch_jobs(category=category, limit=limit)
-        created = 0
-        for job in jobs:
-            created += await _upsert_job(db, job)
-        return created
-    finally:
-        await client.close()
+    return await _ingest_from(db, "weworkremotely", category=category, limit=limit)
 
 
 async def ingest_all_sources(
     db,
-    limit_per_source: int = 50
-) -> Dict[str, int]:
+    limit_per_source: int = 50,
+    sources: Iterable[str] = JOB_SOURCE_NAMES,
+    open_source: Callable[[str], JobSource] = open_job_source,
+) -> Dict[str, Any]:
     """
     Ingest jobs from all configured sources.
 
+    Sources are fetched concurrently, each under its own concurrency/rate
+    policy and per-page timeout. Pages are handed to one bounded queue as
+    each source yields them and drained by a single writer, so a slow or
+    failing source never holds up the others and the session only ever runs
+    one write at a time.
+
     Args:
         db: Neo4j database session
         limit_per_source: Maximum jobs to fetch from each source
+        sources: Source names to ingest
+        open_source: Factory creating the JobSource for a name
 
     Returns:
-        Dictionary with counts per source
+        {"by_source": {source: created}, "sources": {source: report}, "elapsed_ms": float}
+        where each report has fetched/created/updated/merged counts, fetch_ms and error
     """
-    results = {}
-
-    # USAJOBS - federal jobs
-    results["usajobs"] = await ingest_from_usajobs(db, limit=limit_per_source)
-
-    # Adzuna - commercial jobs
-    results["adzuna"] = await ingest_from_adzuna(db, limit=limit_per_source)
-
-    # Remotive - remote jobs
-    results["remotive"] = await ingest_from_remotive(db, limit=limit_per_source)
-
-    # WeWorkRemotely - remote jobs
-    results["weworkremotely"] = await ingest_from_weworkremotely(db, limit=limit_per_source)
+    sources = list(sources)
+    reports: Dict[str, Dict[str, Any]] = {
+        source: {"fetched": 0, "created": 0, "updated": 0, "merged": 0, "fetch_ms": 0.0, "error": None}
+        for source in sources
+    }
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(settings.job_ingest_queue_size, 1))
+    chunk_size = max(settings.job_upsert_chunk_size, 1)
+    started = time.perf_counter()
+
+    async def produce(name: str) -> None:
+        report = reports[name]
+        limiter = get_source_limiter(name)
+        source = open_source(name)
+        fetch_seconds = 0.0
+        try:
+            if not source.is_configured():
+                print(f"{SOURCE_NOT_CONFIGURED.get(name, name)}. Skipping.")
+                return
+            async with limiter:
+                pages = source.iter_pages(limit=limit_per_source)
+                async with aclosing(pages):
+                    while True:
+                        page_started = time.perf_counter()
+                        try:
+                            page = await asyncio.wait_for(anext(pages), limiter.policy.timeout)
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            fetch_seconds += time.perf_counter() - page_started
+                        report["fetched"] += len(page)
+                        for start in range(0, len(page), chunk_size):
+                            await queue.put((name, page[start:start + chunk_size]))
+        except asyncio.TimeoutError:
+            report["error"] = f"page timed out after {limiter.policy.timeout:.0f}s"
+        except Exception as e:
+            report["error"] = str(e) or type(e).__name__
+        finally:
+            report["fetch_ms"] = round(fetch_seconds * 1000, 1)
+            await source.close()
+
+    async def write() -> None:
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                source, jobs = item
+                try:
+                    chunks = await _upsert_jobs(db, jobs, chunk_size)
+                except Exception as e:
+                    reports[source]["error"] = f"write failed: {e}"
+                    continue
+                reports[source]["created"] += _created(chunks)
+                reports[source]["updated"] += sum(chunk["updated"] for chunk in chunks)
+                reports[source]["merged"] += sum(chunk["merged"] for chunk in chunks)
+            finally:
+                queue.task_done()
+
+    writer = asyncio.create_task(write())
+    try:
+        await asyncio.gather(*(produce(source) for source in sources))
+        await queue.put(None)
+        await writer
+    finally:
+        if not writer.done():
+            writer.cancel()
 
     # Print summary
-    for source, count in results.items():
-        print(f"{source.upper()}: Ingested {count} jobs to database")
+    for source, report in reports.items():
+        status = f" (error: {report['error']})" if report["error"] else ""
+        print(
+            f"{source.upper()}: Ingested {report['created']} jobs to database "
+            f"in {report['fetch_ms']:.0f} ms{status}"
+        )
+
+    return {
+        "by_source": {source: report["created"] for source, report in reports.items()},
+        "sources": reports,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
 
-    return results
+def _created(chunks: List[Dict[str, int]]) -> int:
+    return sum(chunk["created"] for chunk in chunks)
 
 
-async def _upsert_job(db, job: Dict[str, Any]) -> int:
+def _job_row(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize a source posting into upsert parameters, or None if it has no apply URL."""
     apply_url = job.get("apply_url")
     if not apply_url:
-        return 0  # skip if no stable unique key
+        return None  # skip if no stable unique key
 
-    params = {
+    row = {
         "apply_url": apply_url,
         "title": job.get("title") or "Unknown",
         "company": job.get("company"),
@@ -188,36 +297,94 @@ async def _upsert_job(db, job: Dict[str, Any]) -> int:
         "source": job.get("source"),
         "source_job_id": job.get("source_job_id"),
     }
+    # Persist the job-side ATS requirements so scoring never re-parses
+    # this description for as long as its content hash holds.
+    requirements = ats_service.get_job_requirements(row)
+    row.update(requirements.to_node_properties())
+    row.update(skill_index_row(apply_url, requirements))
+    row.update(dedup_properties(row))
+    return row
+
+
+_UPSERT_JOBS_CYPHER = """
+UNWIND $rows AS row
+MERGE (j:JobPosting {apply_url: row.apply_url})
+ON CREATE SET
+  j.title = row.title,
+  j.company = row.company,
+  j.location = row.location,
+  j.employment_type = row.employment_type,
+  j.remote = row.remote,
+  j.salary_text = row.salary_text,
+  j.posted_at = row.posted_at,
+  j.source_url = row.source_url,
+  j.description = row.description,
+  j.source = row.source,
+  j.source_job_id = row.source_job_id,
+  j.created_at = datetime()
+ON MATCH SET
+  j.title = coalesce(row.title, j.title),
+  j.company = coalesce(row.company, j.company),
+  j.location = coalesce(row.location, j.location),
+  j.employment_type = coalesce(row.employment_type, j.employment_type),
+  j.remote = coalesce(row.remote, j.remote),
+  j.salary_text = coalesce(row.salary_text, j.salary_text),
+  j.posted_at = coalesce(row.posted_at, j.posted_at),
+  j.source_url = coalesce(row.source_url, j.source_url),
+  j.description = coalesce(row.description, j.description),
+  j.source = coalesce(row.source, j.source),
+  j.source_job_id = coalesce(row.source_job_id, j.source_job_id),
+  j.updated_at = datetime()
+SET j.ats_requirements_hash = row.ats_requirements_hash,
+    j.ats_requirements = row.ats_requirements,
+    j.dedup_fingerprint = row.dedup_fingerprint,
+    j.simhash = row.simhash,
+    j.description_hash = row.description_hash,
+    j.dedup_version = row.dedup_version,
+    j.location_lc = toLower(j.location),
+    j.sort_ts = coalesce(j.sort_ts, timestamp())
+"""
+
+
+async def _upsert_chunk_tx(tx, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    # Fold cross-source near-duplicates into their canonical posting first,
+    # inside the same transaction so concurrent chunks see a consistent index.
+    candidates = await job_dedup_service.find_candidates(tx, rows)
+    upserts, aliases = job_dedup_service.partition(rows, candidates)
+    created = 0
+    if upserts:
+        result = await tx.run(_UPSERT_JOBS_CYPHER, rows=upserts)
+        summary = await result.consume()
+        created = summary.counters.nodes_created
+        # After the count: MERGEd Skill nodes must not count as created jobs.
+        await job_skill_index_service.link(tx, upserts)
+    await job_dedup_service.merge_aliases(tx, aliases)
+    return {"created": created, "updated": len(upserts) - created, "merged": len(aliases)}
+
+
+async def _upsert_jobs(
+    db,
+    jobs: Iterable[Dict[str, Any]],
+    chunk_size: Optional[int] = None,
+) -> List[Dict[str, int]]:
+    """
+    Upsert postings in chunks, one UNWIND write transaction per chunk.
+
+    Args:
+        db: Neo4j database session
+        jobs: Postings as returned by the job source clients
+        chunk_size: Rows per transaction (defaults to settings.job_upsert_chunk_size)
+
+    Returns:
+        One {"created", "updated", "merged"} dict per chunk sent, where
+        ``merged`` counts near-duplicates folded into an existing posting
+    """
+    chunk_size = max(chunk_size or settings.job_upsert_chunk_size, 1)
+    rows = [row for row in map(_job_row, jobs) if row is not None]
+
+    chunks = []
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        chunks.append(await db.execute_write(_upsert_chunk_tx, chunk))
+    return chunks
 
-    cypher = """
-    MERGE (j:JobPosting {apply_url: $apply_url})
-    ON CREATE SET
-      j.title = $title,
-      j.company = $company,
-      j.location = $location,
-      j.employment_type = $employment_type,
-      j.remote = $remote,
-      j.salary_text = $salary_text,
-      j.posted_at = $posted_at,
-      j.source_url = $source_url,
-      j.description = $description,
-      j.source = $source,
-      j.source_job_id = $source_job_id,
-      j.created_at = datetime()
-    ON MATCH SET
-      j.title = coalesce($title, j.title),
-      j.company = coalesce($company, j.company),
-      j.location = coalesce($location, j.location),
-      j.employment_type = coalesce($employment_type, j.employment_type),
-      j.remote = coalesce($remote, j.remote),
-      j.salary_text = coalesce($salary_text, j.salary_text),
-      j.posted_at = coalesce($posted_at, j.posted_at),
-      j.source_url = coalesce($source_url, j.source_url),
-      j.description = coalesce($description, j.description),
-      j.source = coalesce($source, j.source),
-      j.source_job_id = coalesce($source_job_id, j.source_job_id),
-      j.updated_at = datetime()
-    """
-    result = await db.run(cypher, **params)
-    summary = await result.consume()
-    return summary.counters.nodes_created  # 1 if created, 0 if updated
\ No newline at end of file
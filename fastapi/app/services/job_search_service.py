@@ -0,0 +1,232 @@
+"""Index-backed job search for the job listing endpoints."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+
+JOB_FULLTEXT_INDEX = "job_fulltext_index"
+
+JobView = Literal["summary", "full"]
+
+# Properties clients see for a posting (description is added separately,
+# truncated in the summary view). Everything else on the node is internal
+# bookkeeping: dedup and skill-index state, sort keys, persisted requirements.
+JOB_PUBLIC_FIELDS = (
+    "title", "company", "location", "employment_type", "remote", "salary_text",
+    "posted_at", "apply_url", "source_url", "source", "source_job_id",
+)
+# Properties read for listings: the public ones plus the keyset sort key.
+JOB_SUMMARY_FIELDS = JOB_PUBLIC_FIELDS + ("sort_ts",)
+# Extra properties ATS scoring reads: the full description (hashed to check
+# the persisted requirements) and the persisted requirements themselves.
+JOB_SCORING_FIELDS = ("description", "ats_requirements_hash", "ats_requirements")
+
+
+def job_projection(
+    view: JobView = "summary",
+    for_scoring: bool = False,
+    var: str = "j",
+) -> str:
+    """
+    Cypher map projection of a JobPosting for listings.
+
+    Both views keep ``JOB_SUMMARY_FIELDS``. ``full`` adds the complete
+    description; ``summary`` only its first ``$description_chars``
+    characters, unless ``for_scoring`` needs the complete text.
+    """
+    fields = [f".{name}" for name in JOB_SUMMARY_FIELDS]
+    if for_scoring:
+        fields += [f".{name}" for name in JOB_SCORING_FIELDS]
+    elif view == "full":
+        fields.append(".description")
+    else:
+        fields.append(f"description: left({var}.description, $description_chars)")
+    return f"{var} {{{', '.join(fields)}}}"
+
+
+def public_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """The client-facing properties of a projected posting, description included."""
+    public = {name: job.get(name) for name in JOB_PUBLIC_FIELDS}
+    public["description"] = job.get("description")
+    return public
+
+
+def truncate_description(job: Dict[str, Any], chars: Optional[int] = None) -> Dict[str, Any]:
+    """Cut ``job["description"]`` to the summary length, in place."""
+    chars = settings.job_summary_description_chars if chars is None else chars
+    description = job.get("description")
+    if description and len(description) > chars:
+        job["description"] = description[:chars]
+    return job
+
+# Characters with meaning in Lucene query syntax.
+_LUCENE_SPECIAL_RE = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+_LUCENE_OPERATORS = {"and", "or", "not", "to"}
+
+
+def lucene_query(text: Optional[str]) -> Optional[str]:
+    """
+    Turn free text into a Lucene query that requires every term.
+
+    Terms are escaped so user input can never change the query structure.
+    Returns None when the text contains no searchable terms.
+    """
+    terms = []
+    for term in (text or "").lower().split():
+        escaped = _LUCENE_SPECIAL_RE.sub(r"\\\1", term)
+        if term in _LUCENE_OPERATORS:
+            escaped = f'"{escaped}"'
+        if escaped:
+            terms.append(f"+{escaped}")
+    return " ".join(terms) or None
+
+
+class JobSearchService:
+    """Builds and runs filtered, keyset-paginated JobPosting searches.
+
+    Free text goes through the ``job_fulltext_index`` full-text index (title,
+    description, company, location) and is ranked by relevance. Location uses
+    the text index on ``location_lc`` and source the range index on
+    ``source``. Only the predicates that are actually set are added to the
+    query, so the planner can pick the matching index. A resume skill filter
+    starts at the Resume, follows its ``HAS_SKILL`` edges to the shared
+    canonical ``Skill`` nodes and their ``REQUIRES_SKILL`` edges back to
+    postings, ranking postings by how many of the resume's skills they
+    require.
+
+    Results are ordered by ``(sort_ts, apply_url)`` descending (preceded by
+    the relevance score for text searches) and paged with an opaque cursor
+    holding the last row's sort key. Without text, each page is a range seek
+    on the ``sort_ts`` index, so deep pages cost the same as the first.
+
+    Rows are map projections (see ``job_projection``), so only the
+    properties a listing needs cross the wire.
+    """
+
+    def build_query(
+        self,
+        q: Optional[str] = None,
+        location: Optional[str] = None,
+        source: Optional[str] = None,
+        remote_only: bool = False,
+        limit: int = 200,
+        cursor: Optional[str] = None,
+        view: JobView = "summary",
+        for_scoring: bool = False,
+        skills_of: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Return ``(cypher, params)`` yielding ``j`` (a property map) and
+        ``score`` rows. One row more than ``limit`` is requested to detect a
+        next page. ``skills_of`` (a resume id, used without ``q``) restricts
+        results to postings requiring at least one of that resume's skills.
+
+        Raises:
+            InvalidCursorError: if ``cursor`` is malformed
+        """
+        params: Dict[str, Any] = {"limit": limit + 1}
+        where: List[str] = []
+
+        search = lucene_query(q)
+        skills_of = None if search else skills_of
+        if search:
+            params["search"] = search
+            match = (
+                f"CALL db.index.fulltext.queryNodes('{JOB_FULLTEXT_INDEX}', $search) "
+                "YIELD node AS j, score"
+            )
+            order = "score DESC, j.sort_ts DESC, j.apply_url DESC"
+        elif skills_of:
+            params["resume_id"] = skills_of
+            match = (
+                "MATCH (:Resume {id: $resume_id})-[:HAS_SKILL]->(s:Skill)"
+                "<-[:REQUIRES_SKILL]-(j:JobPosting)\n"
+                "WITH j, count(DISTINCT s) AS score"
+            )
+            order = "score DESC, j.sort_ts DESC, j.apply_url DESC"
+        else:
+            match = "MATCH (j:JobPosting)"
+            order = "j.sort_ts DESC, j.apply_url DESC"
+            # Lets the planner serve ORDER BY from the sort_ts index.
+            where.append("j.sort_ts IS NOT NULL")
+
+        ranked = bool(search or skills_of)
+        if cursor:
+            if ranked:
+                score, sort_ts, apply_url = decode_cursor(cursor, 3)
+                params.update(after_score=score, after_ts=sort_ts, after_url=apply_url)
+                where.append(
+                    "(score < $after_score OR (score = $after_score AND "
+                    "(j.sort_ts < $after_ts OR (j.sort_ts = $after_ts AND j.apply_url < $after_url))))"
+                )
+            else:
+                sort_ts, apply_url = decode_cursor(cursor, 2)
+                params.update(after_ts=sort_ts, after_url=apply_url)
+                # The first conjunct is a plain range, so it is an index seek.
+                where.append("j.sort_ts <= $after_ts")
+                where.append("(j.sort_ts < $after_ts OR j.apply_url < $after_url)")
+
+        if location:
+            params["location"] = location.lower()
+            where.append("j.location_lc CONTAINS $location")
+        if source:
+            params["source"] = source
+            # Postings folded in from another board keep that board in alt_sources.
+            where.append("(j.source = $source OR $source IN coalesce(j.alt_sources, []))")
+        if remote_only:
+            where.append("j.remote = true")
+
+        cypher = match
+        if where:
+            cypher += "\nWHERE " + "\n  AND ".join(where)
+        if view == "summary" and not for_scoring:
+            params["description_chars"] = settings.job_summary_description_chars
+        cypher += f"\nRETURN {job_projection(view, for_scoring)} AS j, "
+        cypher += "score" if ranked else "null AS score"
+        cypher += f"\nORDER BY {order}\nLIMIT $limit"
+        return cypher, params
+
+    async def search(
+        self,
+        db,
+        q: Optional[str] = None,
+        location: Optional[str] = None,
+        source: Optional[str] = None,
+        remote_only: bool = False,
+        limit: int = 200,
+        cursor: Optional[str] = None,
+        view: JobView = "summary",
+        for_scoring: bool = False,
+        skills_of: Optional[str] = None,
+    ) -> Tuple[List[Tuple[Dict[str, Any], Optional[float]]], Optional[str]]:
+        """
+        Run the search.
+
+        Returns:
+            ``([(properties, score or None), ...], next_cursor)`` where the
+            score is the full-text relevance (or, with ``skills_of``, the
+            number of shared skills) and ``next_cursor`` is None on the last page
+
+        Raises:
+            InvalidCursorError: if ``cursor`` is malformed
+        """
+        cypher, params = self.build_query(
+            q, location, source, remote_only, limit, cursor, view, for_scoring, skills_of
+        )
+        result = await db.run(cypher, **params)
+        rows = [(record["j"], record["score"]) async for record in result]
+        if len(rows) <= limit or limit < 1:
+            return rows[:max(limit, 0)], None
+
+        rows = rows[:limit]
+        last, score = rows[-1]
+        key = (last.get("sort_ts"), last.get("apply_url"))
+        return rows, encode_cursor(*((score,) + key if score is not None else key))
+
+
+# Global service instance
+job_search_service = JobSearchService()
@@ -0,0 +1,242 @@
+"""Inverted skill -> job index stored as graph edges.
+
+Every JobPosting links to the canonical skills ATS extraction found in it:
+
+    (:JobPosting)-[:REQUIRES_SKILL {kind}]->(:Skill {name})
+
+where ``kind`` is ``required``, ``preferred`` or ``mentioned`` (any other
+skill in the posting). Skill nodes are shared with resumes and found
+through ``skill_name_index``, so "postings that mention any of these
+skills" is an index seek plus a traversal instead of a scan.
+
+Edges are rewritten only when the posting's requirements change:
+``skills_hash`` on the posting records the ``ats_requirements_hash`` the
+edges were built from. That hash is prefixed with the skill alias table
+version (``ats_service.requirements_hash``), so ``backfill`` also relinks
+postings indexed under an older alias table.
+
+Resumes link to the same nodes:
+
+    (:Resume)-[:HAS_SKILL {labels}]->(:Skill {name})
+
+Each listed skill is mapped to its canonical names with
+``ats_service.canonical_skill_names`` and the hierarchy-implied parents
+are added, so "postings sharing a skill with this resume" is a traversal
+``(r)-[:HAS_SKILL]->(:Skill)<-[:REQUIRES_SKILL]-(j)``. ``labels`` keeps the
+skills as written on the resume for display (empty for implied skills).
+``Resume.skills_version`` records the ``resume_skills_version()`` the
+edges were built with.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from app.services.ats_service import JobRequirements, ats_service
+
+# Bump whenever resume_skill_rows changes its output so resume HAS_SKILL
+# edges are rebuilt by backfill_resume_skills.
+RESUME_SKILLS_VERSION = 1
+
+
+def resume_skills_version() -> str:
+    """Stamp for resume HAS_SKILL edges: ``RESUME_SKILLS_VERSION`` plus the
+    skill alias table the canonical names came from."""
+    return f"{RESUME_SKILLS_VERSION}:{ats_service.skill_aliases_version}"
+
+
+def skill_edges(requirements: JobRequirements) -> List[Dict[str, str]]:
+    """``[{"name", "kind"}]`` for every canonical skill in the requirements."""
+    kinds: Dict[str, str] = {}
+    for kind, skills in (
+        ("required", requirements.required_skills),
+        ("preferred", requirements.preferred_skills),
+        ("mentioned", requirements.all_skills),
+    ):
+        for skill in skills:
+            kinds.setdefault(skill, kind)
+    return [{"name": name, "kind": kind} for name, kind in kinds.items()]
+
+
+def skill_index_row(apply_url: str, requirements: JobRequirements) -> Dict[str, Any]:
+    """Parameters for ``JobSkillIndexService.link`` for one posting."""
+    return {
+        "apply_url": apply_url,
+        "skills_hash": requirements.content_hash,
+        "skills": skill_edges(requirements),
+    }
+
+
+def resume_skill_rows(raw_skills: Iterable[str]) -> List[Dict[str, Any]]:
+    """``[{"name", "labels"}]`` HAS_SKILL rows for a resume's listed skills."""
+    labels: Dict[str, List[str]] = {}
+    for raw in raw_skills:
+        raw = raw.strip()
+        for name in ats_service.canonical_skill_names(raw):
+            if raw not in labels.setdefault(name, []):
+                labels[name].append(raw)
+    for name in ats_service.expand_skill_hierarchy(labels):
+        labels.setdefault(name, [])
+    return [{"name": name, "labels": labels[name]} for name in sorted(labels)]
+
+
+_LINK_SKILLS_CYPHER = """
+UNWIND $rows AS row
+MATCH (j:JobPosting {apply_url: row.apply_url})
+WHERE j.skills_hash IS NULL OR j.skills_hash <> row.skills_hash
+OPTIONAL MATCH (j)-[old:REQUIRES_SKILL]->(:Skill)
+DELETE old
+WITH DISTINCT j, row
+SET j.skills_hash = row.skills_hash
+WITH j, row
+UNWIND row.skills AS skill
+MERGE (s:Skill {name: skill.name})
+MERGE (j)-[rel:REQUIRES_SKILL]->(s)
+SET rel.kind = skill.kind
+"""
+
+
+# Career-tracker skills (``routers/career.py``) carry an ``id`` and are
+# never resume-derived, so only id-less orphans are removed.
+_RELINK_RESUME_SKILLS_CYPHER = """
+UNWIND $rows AS row
+MATCH (r:Resume {id: row.resume_id})
+OPTIONAL MATCH (r)-[old:HAS_SKILL]->(stale:Skill)
+DELETE old
+WITH r, row, collect(DISTINCT stale) AS stale
+SET r.skills_version = $version
+WITH r, row, stale
+CALL {
+    WITH r, row
+    UNWIND row.skills AS skill
+    MERGE (s:Skill {name: skill.name})
+    MERGE (r)-[rel:HAS_SKILL]->(s)
+    SET rel.labels = skill.labels,
+        rel.created_at = coalesce(rel.created_at, datetime())
+}
+WITH stale
+UNWIND stale AS s
+WITH DISTINCT s
+WHERE s.id IS NULL AND NOT EXISTS { (s)--() }
+DELETE s
+"""
+
+
+class JobSkillIndexService:
+    """Maintains ``REQUIRES_SKILL`` edges from postings to canonical skills."""
+
+    async def link(self, tx, rows: List[Dict[str, Any]]) -> None:
+        """
+        Replace the skill edges of postings whose requirements changed.
+
+        Args:
+            tx: Transaction or session to write with
+            rows: ``skill_index_row`` dicts
+        """
+        if not rows:
+            return
+        result = await tx.run(_LINK_SKILLS_CYPHER, rows=rows)
+        await result.consume()
+
+    async def saved_job_skills(self, db, resume_id: str) -> List[Dict[str, Any]]:
+        """
+        Skills required by a resume's saved jobs, read from the index.
+
+        Returns:
+            ``[{"skill", "kind", "jobs"}]``: one row per skill and edge kind,
+            with the number of saved jobs requiring it that way
+        """
+        result = await db.run(
+            """
+            MATCH (:Resume {id: $resume_id})-[:SAVED_JOB]->(j:JobPosting)-[req:REQUIRES_SKILL]->(s:Skill)
+            RETURN s.name AS skill, req.kind AS kind, count(DISTINCT j) AS jobs
+            ORDER BY jobs DESC, skill
+            """,
+            resume_id=resume_id,
+        )
+        return await result.data()
+
+    async def backfill(self, db, batch_size: int = 500) -> int:
+        """Build skill edges for postings stored before (or outside) the index."""
+        linked = 0
+        while True:
+            result = await db.run(
+                """
+                MATCH (j:JobPosting)
+                WHERE j.apply_url IS NOT NULL
+                  AND (j.skills_hash IS NULL
+                       OR j.skills_hash <> coalesce(j.ats_requirements_hash, '')
+                       OR NOT j.skills_hash STARTS WITH $aliases_prefix)
+                RETURN j.apply_url AS apply_url, j.title AS title, j.company AS company,
+                       j.location AS location, j.description AS description,
+                       j.ats_requirements_hash AS ats_requirements_hash,
+                       j.ats_requirements AS ats_requirements
+                LIMIT $batch_size
+                """,
+                aliases_prefix=f"{ats_service.skill_aliases_version}:",
+                batch_size=batch_size,
+            )
+            jobs = await result.data()
+            if not jobs:
+                return linked
+
+            rows = []
+            for job in jobs:
+                requirements = ats_service.get_job_requirements(job)
+                row = skill_index_row(job["apply_url"], requirements)
+                row.update(requirements.to_node_properties())
+                rows.append(row)
+            # Postings saved without requirements (or with stale ones) get
+            # them persisted too, so their hash matches skills_hash afterwards.
+            write = await db.run(
+                """
+                UNWIND $rows AS row
+                MATCH (j:JobPosting {apply_url: row.apply_url})
+                SET j.ats_requirements_hash = row.ats_requirements_hash,
+                    j.ats_requirements = row.ats_requirements
+                """,
+                rows=rows,
+            )
+            await write.consume()
+            await self.link(db, rows)
+            linked += len(rows)
+
+    async def backfill_resume_skills(self, db, batch_size: int = 200) -> int:
+        """
+        Relink HAS_SKILL edges of resumes built before (or with an older
+        version of) canonical skill names, and drop the raw-named Skill
+        nodes nothing links to any more.
+
+        Returns:
+            Number of resumes relinked
+        """
+        relinked = 0
+        while True:
+            result = await db.run(
+                """
+                MATCH (r:Resume)
+                WHERE coalesce(r.skills_version, '') <> $version
+                RETURN r.id AS resume_id,
+                       COLLECT { MATCH (r)-[e:HAS_SKILL]->(s:Skill)
+                                 UNWIND coalesce(e.labels, [s.name]) AS label
+                                 RETURN DISTINCT label } AS skills
+                LIMIT $batch_size
+                """,
+                version=resume_skills_version(),
+                batch_size=batch_size,
+            )
+            resumes = await result.data()
+            if not resumes:
+                return relinked
+
+            rows = [
+                {"resume_id": resume["resume_id"], "skills": resume_skill_rows(resume["skills"])}
+                for resume in resumes
+            ]
+            write = await db.run(_RELINK_RESUME_SKILLS_CYPHER, rows=rows, version=resume_skills_version())
+            await write.consume()
+            relinked += len(rows)
+
+
+# Global service instance
+job_skill_index_service = JobSkillIndexService()
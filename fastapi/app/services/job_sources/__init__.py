@@ -1,11 +1,14 @@
 """Job source integrations."""
 
+from .base import JobPage, JobSource
 from .usajobs import USAJobsClient
 from .adzuna import AdzunaClient
 from .remotive import RemotiveClient
 from .weworkremotely import WeWorkRemotelyClient
 
 __all__ = [
+    "JobPage",
+    "JobSource",
     "USAJobsClient",
     "AdzunaClient",
     "RemotiveClient",
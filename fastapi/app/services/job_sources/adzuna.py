@@ -1,30 +1,42 @@
 """Adzuna API integration for commercial job aggregation."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional
+import asyncio
 import httpx
 from datetime import datetime
 
+from .rate_limit import get_source_limiter
+
 
 class AdzunaClient:
     """Client for Adzuna API (requires API key)."""
 
+    name = "adzuna"
     BASE_URL = "https://api.adzuna.com/v1/api/jobs/us/search"
 
-    def __init__(self, app_id: str, app_key: str):
+    def __init__(
+        self,
+        app_id: str,
+        app_key: str,
+        session: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize Adzuna client.
 
         Args:
             app_id: Adzuna application ID
             app_key: Adzuna application key
+            session: Shared HTTP client; a private one is created if omitted
         """
         self.app_id = app_id
         self.app_key = app_key
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self._owns_session = session is None
+        self.session = session or httpx.AsyncClient(timeout=30.0)
 
     async def close(self):
-        """Close the HTTP session."""
-        await self.session.aclose()
+        """Close the HTTP session unless it is a shared one."""
+        if self._owns_session:
+            await self.session.aclose()
 
     def is_configured(self) -> bool:
         """Check if API credentials are configured."""
@@ -49,12 +61,38 @@ class AdzunaClient:
             category: Job category tag
 
         Returns:
-            List of job dictionaries in standardized format
+            List of job dictionaries in standardized format; empty if the
+            request failed
         """
         if not self.is_configured():
             print("Adzuna: API credentials not configured")
             return []
 
+        try:
+            jobs = await self._fetch_page(keyword, location, page, results_per_page, category)
+            print(f"Adzuna: Fetched {len(jobs)} jobs")
+            return jobs
+
+        except httpx.HTTPError as e:
+            import traceback
+            print(f"Adzuna: Error - {e}")
+            print(f"Traceback: {traceback.format_exc()}")
+            return []
+
+    async def _fetch_page(
+        self,
+        keyword: str,
+        location: str,
+        page: int,
+        results_per_page: int,
+        category: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Request one page of results.
+
+        Raises:
+            httpx.HTTPError: when the request fails
+        """
         params = {
             "app_id": self.app_id,
             "app_key": self.app_key,
@@ -66,27 +104,138 @@ class AdzunaClient:
         if category:
             params["category"] = category
 
+        await get_source_limiter(self.name).throttle()
+        response = await self.session.get(
+            f"{self.BASE_URL}/{page}",
+            params=params,
+            headers={"Accept": "application/json"}
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        # Parse Adzuna response
+        results = data.get("results", [])
+        return [self._parse_job(job_data) for job_data in results]
+
+    async def fetch_jobs_paginated(
+        self,
+        keyword: str = "",
+        location: str = "",
+        limit: int = 100,
+        category: Optional[str] = None,
+        concurrency: int = 4,
+        max_pages: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch up to ``limit`` unique jobs across pages, several pages at a time.
+
+        See ``iter_pages`` for how pages are scheduled and deduplicated.
+
+        Returns:
+            List of job dictionaries in standardized format
+
+        Raises:
+            httpx.HTTPError: when a page request fails
+        """
+        jobs: List[Dict[str, Any]] = []
+        async for page in self.iter_pages(
+            keyword=keyword,
+            location=location,
+            category=category,
+            limit=limit,
+            concurrency=concurrency,
+            max_pages=max_pages,
+        ):
+            jobs.extend(page)
+        return jobs
+
+    async def iter_pages(
+        self,
+        keyword: str = "",
+        location: str = "",
+        category: Optional[str] = None,
+        limit: int = 100,
+        concurrency: int = 4,
+        max_pages: int = 20,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield unique jobs page by page, keeping several page requests in flight.
+
+        Keeps at most ``concurrency`` page requests in flight. Completed pages
+        are deduplicated by apply_url and yielded in page order, and no new
+        requests are issued once ``limit`` unique jobs have been yielded or a
+        page comes back empty. A failed page request raises instead of
+        looking like the end of results, so callers can record the failure.
+
+        Args:
+            keyword: Job title or keyword search
+            location: Location filter
+            category: Job category tag
+            limit: Maximum number of unique jobs to yield
+            concurrency: Maximum page requests in flight
+            max_pages: Hard cap on pages requested
+
+        Raises:
+            httpx.HTTPError: when a page request fails
+        """
+        if not self.is_configured():
+            print("Adzuna: API credentials not configured")
+            return
+
+        produced = 0
+        seen_urls = set()
+        completed: Dict[int, List[Dict[str, Any]]] = {}
+        pending: Dict[asyncio.Task, int] = {}
+        next_page = 1
+        next_to_merge = 1
+        last_page = max_pages
+
         try:
-            response = await self.session.get(
-                f"{self.BASE_URL}/{page}",
-                params=params,
-                headers={"Accept": "application/json"}
-            )
-            response.raise_for_status()
-            data = response.json()
+            while produced < limit:
+                while len(pending) < max(concurrency, 1) and next_page <= last_page:
+                    task = asyncio.create_task(self._fetch_page(
+                        keyword, location, next_page, 50, category
+                    ))
+                    pending[task] = next_page
+                    next_page += 1
 
-            # Parse Adzuna response
-            results = data.get("results", [])
-            jobs = [self._parse_job(job_data) for job_data in results]
+                if not pending:
+                    break
 
-            print(f"Adzuna: Fetched {len(jobs)} jobs")
-            return jobs
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = pending.pop(task)
+                    page_jobs = task.result()
+                    if not page_jobs:
+                        # Nothing exists past an empty page.
+                        last_page = min(last_page, page - 1)
+                    completed[page] = page_jobs
 
-        except httpx.HTTPError as e:
-            import traceback
-            print(f"Adzuna: Error - {e}")
-            print(f"Traceback: {traceback.format_exc()}")
-            return []
+                # Merge completed pages in order so output does not depend on timing.
+                while next_to_merge in completed and next_to_merge <= last_page and produced < limit:
+                    batch = []
+                    for job in completed.pop(next_to_merge):
+                        url = job.get("apply_url")
+                        if url and url not in seen_urls:
+                            seen_urls.add(url)
+                            batch.append(job)
+                            if produced + len(batch) >= limit:
+                                break
+                    next_to_merge += 1
+                    if batch:
+                        produced += len(batch)
+                        yield batch
+
+                if next_to_merge > last_page:
+                    break
+        finally:
+            # Still-running requests are cancelled and awaited, and finished
+            # ones not merged yet (e.g. siblings of a failed page) have their
+            # results or exceptions retrieved, so nothing outlives the
+            # generator or logs "Task exception was never retrieved".
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     def _parse_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Adzuna job data into standardized format."""
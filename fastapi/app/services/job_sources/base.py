@@ -0,0 +1,37 @@
+"""Common interface implemented by every job source client."""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol, runtime_checkable
+
+JobPage = List[Dict[str, Any]]
+
+
+@runtime_checkable
+class JobSource(Protocol):
+    """A job board that yields normalized postings page by page.
+
+    ``iter_pages`` yields non-empty lists of postings in the standardized
+    format (title, company, location, apply_url, source, ...) as soon as each
+    page is available, and yields at most ``limit`` postings in total.
+    Consumers that stop early should ``aclose()`` the iterator so in-flight
+    requests are cancelled.
+    """
+
+    name: str
+
+    def is_configured(self) -> bool:
+        """Whether the source has the credentials it needs."""
+        ...
+
+    def iter_pages(
+        self,
+        keyword: str = "",
+        location: str = "",
+        category: Optional[str] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[JobPage]:
+        """Yield pages of normalized postings."""
+        ...
+
+    async def close(self) -> None:
+        """Release the client's resources."""
+        ...
@@ -0,0 +1,153 @@
+"""Conditional-request cache for whole-feed job sources (Remotive, WWR RSS)."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import httpx
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+
+@dataclass
+class FeedEntry:
+    """Parsed feed plus the validators needed to revalidate it."""
+
+    value: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class FeedCache:
+    """Caches parsed feed payloads and revalidates them with ETag/Last-Modified.
+
+    Within ``ttl`` seconds a cached parse is served without any request. After
+    that the feed is requested with ``If-None-Match``/``If-Modified-Since``; a
+    304 keeps the cached parse, so an unchanged feed costs one empty response
+    and no parsing.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, maxsize: Optional[int] = None):
+        self.ttl = settings.job_feed_cache_ttl if ttl is None else ttl
+        self._entries: LRUCache[Hashable, FeedEntry] = LRUCache(
+            settings.job_feed_cache_size if maxsize is None else maxsize
+        )
+        self.not_modified = 0
+
+    async def fetch(
+        self,
+        session: httpx.AsyncClient,
+        url: str,
+        parse: Callable[[httpx.Response], Awaitable[Any]],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        key: Hashable = None,
+        throttle: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> Any:
+        """
+        Return the parsed feed at ``url``, downloading and parsing only when needed.
+
+        Args:
+            session: HTTP client to use
+            url: Feed URL
+            parse: Coroutine turning a streamed 200 response into the cached value
+            params: Query parameters (part of the cache key)
+            key: Extra cache key for parses that depend on more than the URL
+            throttle: Awaited before a request is actually sent (rate limiting)
+
+        Raises:
+            httpx.HTTPError: when the upstream request fails
+        """
+        value = self.get_fresh(url, params=params, key=key)
+        if value is not None:
+            return value
+
+        headers = self.conditional_headers(url, params=params, key=key)
+        if throttle is not None:
+            await throttle()
+        async with session.stream("GET", url, params=params, headers=headers) as response:
+            if response.status_code == 304:
+                value = self.revalidated(url, params=params, key=key)
+                if value is not None:
+                    return value
+            response.raise_for_status()
+            value = await parse(response)
+
+        self.store(url, response, value, params=params, key=key)
+        return value
+
+    def get_fresh(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        key: Hashable = None,
+    ) -> Optional[Any]:
+        """Return the cached parse if it is still within the TTL, else None."""
+        entry = self._entries.get(self._key(url, params, key))
+        if entry and time.monotonic() - entry.fetched_at < self.ttl:
+            return entry.value
+        return None
+
+    def conditional_headers(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        key: Hashable = None,
+    ) -> Dict[str, str]:
+        """Validators to send so an unchanged feed answers 304."""
+        entry = self._entries.get(self._key(url, params, key))
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidated(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        key: Hashable = None,
+    ) -> Optional[Any]:
+        """Record a 304 for ``url`` and return the cached parse (None if evicted)."""
+        entry = self._entries.get(self._key(url, params, key))
+        if entry is None:
+            return None
+        entry.fetched_at = time.monotonic()
+        self.not_modified += 1
+        return entry.value
+
+    def store(
+        self,
+        url: str,
+        response: httpx.Response,
+        value: Any,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        key: Hashable = None,
+    ) -> None:
+        """Cache a complete parse together with the response's validators."""
+        self._entries.set(self._key(url, params, key), FeedEntry(
+            value=value,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=time.monotonic(),
+        ))
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict[str, Any]], key: Hashable) -> Hashable:
+        return (url, tuple(sorted((params or {}).items())), key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Global cache instance
+feed_cache = FeedCache()
@@ -0,0 +1,85 @@
+"""Per-source concurrency and rate-limit policies for job source fetches."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class SourcePolicy:
+    """How hard we are allowed to hit one upstream job source."""
+
+    max_concurrency: int = 1  # whole-source fetches running at once
+    requests_per_minute: Optional[float] = None  # upstream HTTP calls; None = no rate limit
+    timeout: float = 45.0  # seconds to wait for each page of a fetch
+
+
+# Conservative defaults based on each provider's published limits
+# (Adzuna's free tier allows 25 calls/minute; Remotive and WWR ask
+# clients to poll sparingly). The rate applies to every HTTP request the
+# source clients send (each Adzuna page is one call), not to whole fetches.
+SOURCE_POLICIES: Dict[str, SourcePolicy] = {
+    "usajobs": SourcePolicy(max_concurrency=2, requests_per_minute=60),
+    "adzuna": SourcePolicy(max_concurrency=2, requests_per_minute=25),
+    "remotive": SourcePolicy(max_concurrency=1, requests_per_minute=10),
+    "weworkremotely": SourcePolicy(max_concurrency=1, requests_per_minute=10),
+}
+
+
+class RateLimiter:
+    """Spaces acquisitions at least ``60 / requests_per_minute`` seconds apart."""
+
+    def __init__(self, requests_per_minute: Optional[float] = None):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        now = time.monotonic()
+        # Reserve the next slot before sleeping so concurrent callers queue up
+        # behind each other instead of all waking at the same instant.
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class SourceLimiter:
+    """Concurrency cap plus rate limit for one source.
+
+    ``async with limiter`` caps concurrent whole-source fetches; the source
+    clients call ``throttle()`` before each upstream HTTP request, so paged
+    fetches pay one rate-limit token per page.
+    """
+
+    def __init__(self, policy: SourcePolicy):
+        self.policy = policy
+        self._semaphore = asyncio.Semaphore(max(policy.max_concurrency, 1))
+        self._rate = RateLimiter(policy.requests_per_minute)
+
+    async def __aenter__(self) -> "SourceLimiter":
+        await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._semaphore.release()
+
+    async def throttle(self) -> None:
+        """Wait for a rate-limit token; call once before every upstream request."""
+        await self._rate.acquire()
+
+
+_limiters: Dict[str, SourceLimiter] = {}
+
+
+def get_source_limiter(source: str) -> SourceLimiter:
+    """Return the process-wide limiter for a source, so limits hold across requests."""
+    limiter = _limiters.get(source)
+    if limiter is None:
+        limiter = SourceLimiter(SOURCE_POLICIES.get(source, SourcePolicy()))
+        _limiters[source] = limiter
+    return limiter
@@ -1,22 +1,39 @@
 """Remotive API integration for remote job listings."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional
 import httpx
 from datetime import datetime
 
+from .feed_cache import FeedCache, feed_cache
+from .rate_limit import get_source_limiter
+
 
 class RemotiveClient:
     """Client for Remotive API (no authentication required)."""
 
+    name = "remotive"
     BASE_URL = "https://remotive.com/api/remote-jobs"
 
-    def __init__(self):
-        """Initialize Remotive client."""
-        self.session = httpx.AsyncClient(timeout=30.0)
+    def __init__(
+        self,
+        session: Optional[httpx.AsyncClient] = None,
+        cache: Optional[FeedCache] = None,
+    ):
+        """
+        Initialize Remotive client.
+
+        Args:
+            session: Shared HTTP client; a private one is created if omitted
+            cache: Feed cache (defaults to the process-wide one)
+        """
+        self._owns_session = session is None
+        self.session = session or httpx.AsyncClient(timeout=30.0)
+        self.cache = cache or feed_cache
 
     async def close(self):
-        """Close the HTTP session."""
-        await self.session.aclose()
+        """Close the HTTP session unless it is a shared one."""
+        if self._owns_session:
+            await self.session.aclose()
 
     async def fetch_jobs(
         self,
@@ -42,16 +59,8 @@ class RemotiveClient:
             params["company_name"] = company
 
         try:
-            response = await self.session.get(
-                self.BASE_URL,
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse Remotive response
-            jobs_data = data.get("jobs", [])
-            jobs = [self._parse_job(job_data) for job_data in jobs_data[:limit]]
+            feed = await self._fetch_feed(params)
+            jobs = [dict(job) for job in feed["jobs"][:limit]]
 
             print(f"Remotive: Fetched {len(jobs)} jobs")
             return jobs
@@ -62,6 +71,51 @@ class RemotiveClient:
             print(f"Traceback: {traceback.format_exc()}")
             return []
 
+    def is_configured(self) -> bool:
+        """Remotive needs no credentials."""
+        return True
+
+    async def iter_pages(
+        self,
+        keyword: str = "",
+        location: str = "",
+        category: Optional[str] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the (cached) Remotive feed as a single page.
+
+        Remotive only filters by category; keyword and location are ignored.
+
+        Raises:
+            httpx.HTTPError: when the feed request fails
+        """
+        if limit <= 0:
+            return
+        feed = await self._fetch_feed({"category": category} if category else {})
+        jobs = [dict(job) for job in feed["jobs"][:limit]]
+        if jobs:
+            yield jobs
+
+    async def _fetch_feed(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch (or reuse) the parsed feed: standardized jobs plus its categories."""
+
+        async def parse(response: httpx.Response) -> Dict[str, Any]:
+            await response.aread()
+            jobs_data = response.json().get("jobs", [])
+            return {
+                "jobs": [self._parse_job(job_data) for job_data in jobs_data],
+                "categories": sorted({job["category"] for job in jobs_data if job.get("category")}),
+            }
+
+        return await self.cache.fetch(
+            self.session,
+            self.BASE_URL,
+            parse,
+            params=params,
+            throttle=get_source_limiter(self.name).throttle,
+        )
+
     def _parse_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Remotive job data into standardized format."""
         # Extract job details
@@ -130,19 +184,8 @@ class RemotiveClient:
             List of category slugs
         """
         try:
-            response = await self.session.get(self.BASE_URL)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract unique categories
-            jobs = data.get("jobs", [])
-            categories = set()
-            for job in jobs:
-                category = job.get("category")
-                if category:
-                    categories.add(category)
-
-            return sorted(list(categories))
+            feed = await self._fetch_feed({})
+            return list(feed["categories"])
 
         except httpx.HTTPError as e:
             import traceback
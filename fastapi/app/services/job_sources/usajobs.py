@@ -1,9 +1,11 @@
 """USAJOBS API integration for federal government jobs."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional
 import httpx
 from datetime import datetime
 
+from .rate_limit import get_source_limiter
+
 
 class USAJobsClient:
     """
@@ -15,27 +17,36 @@ class USAJobsClient:
     Email should be passed as 'User-Agent' header.
     """
 
+    name = "usajobs"
     BASE_URL = "https://data.usajobs.gov/api/search"
 
-    def __init__(self, api_key: str = "", email: str = ""):
+    def __init__(
+        self,
+        api_key: str = "",
+        email: str = "",
+        session: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize USAJOBS client.
 
         Args:
             api_key: USAJOBS API key (register at https://developer.usajobs.gov/)
             email: Your email address for User-Agent
+            session: Shared HTTP client; a private one is created if omitted
         """
         self.api_key = api_key
         self.email = email or "noreply@example.com"
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self._owns_session = session is None
+        self.session = session or httpx.AsyncClient(timeout=30.0)
 
     def is_configured(self) -> bool:
         """Check if API credentials are configured."""
         return bool(self.api_key)
 
     async def close(self):
-        """Close the HTTP session."""
-        await self.session.aclose()
+        """Close the HTTP session unless it is a shared one."""
+        if self._owns_session:
+            await self.session.aclose()
 
     async def fetch_jobs(
         self,
@@ -56,45 +67,12 @@ class USAJobsClient:
         Returns:
             List of job dictionaries in standardized format
         """
-        params = {
-            "Keyword": keyword,
-            "ResultsPerPage": min(limit, 500),
-            "Page": 1,
-        }
-
-        if location:
-            params["LocationName"] = location
-
-        if remote:
-            params["RemoteIndicator"] = "True"
-
         if not self.is_configured():
             print("USAJOBS: API key not configured")
             return []
 
         try:
-            headers = {
-                "User-Agent": self.email,
-                "Authorization-Key": self.api_key,
-            }
-
-            response = await self.session.get(
-                self.BASE_URL,
-                params=params,
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse USAJOBS response
-            search_result = data.get("SearchResult", {})
-            results = search_result.get("SearchResultItems", [])
-
-            jobs = []
-            for item in results:
-                job_data = item.get("MatchedObjectDescriptor", {})
-                jobs.append(self._parse_job(job_data))
-
+            jobs = await self._search(keyword, location, remote, limit)
             print(f"USAJOBS: Fetched {len(jobs)} jobs")
             return jobs
 
@@ -104,6 +82,68 @@ class USAJobsClient:
             print(f"Traceback: {traceback.format_exc()}")
             return []
 
+    async def iter_pages(
+        self,
+        keyword: str = "",
+        location: str = "",
+        category: Optional[str] = None,
+        limit: int = 100,
+        remote: bool = False,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield USAJOBS results as a single page (one search returns up to 500).
+
+        Raises:
+            httpx.HTTPError: when the search request fails
+        """
+        if not self.is_configured() or limit <= 0:
+            return
+        jobs = await self._search(keyword, location, remote, limit)
+        if jobs:
+            yield jobs
+
+    async def _search(
+        self,
+        keyword: str,
+        location: str,
+        remote: bool,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        params = {
+            "Keyword": keyword,
+            "ResultsPerPage": min(limit, 500),
+            "Page": 1,
+        }
+
+        if location:
+            params["LocationName"] = location
+
+        if remote:
+            params["RemoteIndicator"] = "True"
+
+        headers = {
+            "User-Agent": self.email,
+            "Authorization-Key": self.api_key,
+        }
+
+        await get_source_limiter(self.name).throttle()
+        response = await self.session.get(
+            self.BASE_URL,
+            params=params,
+            headers=headers
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        # Parse USAJOBS response
+        search_result = data.get("SearchResult", {})
+        results = search_result.get("SearchResultItems", [])
+
+        return [
+            self._parse_job(item.get("MatchedObjectDescriptor", {}))
+            for item in results
+        ]
+
     def _parse_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse USAJOBS job data into standardized format."""
         # Extract position details
@@ -1,15 +1,19 @@
 """WeWorkRemotely RSS feed integration for remote job listings."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional
 import httpx
 from datetime import datetime
 import xml.etree.ElementTree as ET
 import re
 
+from .feed_cache import FeedCache, feed_cache
+from .rate_limit import get_source_limiter
+
 
 class WeWorkRemotelyClient:
     """Client for WeWorkRemotely RSS feed (no authentication required)."""
 
+    name = "weworkremotely"
     RSS_URL = "https://weworkremotely.com/categories/remote-programming-jobs.rss"
     CATEGORIES = {
         "programming": "https://weworkremotely.com/categories/remote-programming-jobs.rss",
@@ -21,13 +25,26 @@ class WeWorkRemotelyClient:
         "product": "https://weworkremotely.com/categories/remote-product-jobs.rss",
     }
 
-    def __init__(self):
-        """Initialize WeWorkRemotely client."""
-        self.session = httpx.AsyncClient(timeout=30.0)
+    def __init__(
+        self,
+        session: Optional[httpx.AsyncClient] = None,
+        cache: Optional[FeedCache] = None,
+    ):
+        """
+        Initialize WeWorkRemotely client.
+
+        Args:
+            session: Shared HTTP client; a private one is created if omitted
+            cache: Feed cache (defaults to the process-wide one)
+        """
+        self._owns_session = session is None
+        self.session = session or httpx.AsyncClient(timeout=30.0)
+        self.cache = cache or feed_cache
 
     async def close(self):
-        """Close the HTTP session."""
-        await self.session.aclose()
+        """Close the HTTP session unless it is a shared one."""
+        if self._owns_session:
+            await self.session.aclose()
 
     async def fetch_jobs(
         self,
@@ -44,23 +61,8 @@ class WeWorkRemotelyClient:
         Returns:
             List of job dictionaries in standardized format
         """
-        # Use specified category or default to programming
-        rss_url = self.CATEGORIES.get(category, self.RSS_URL)
-
         try:
-            response = await self.session.get(rss_url)
-            response.raise_for_status()
-
-            # Parse RSS XML
-            root = ET.fromstring(response.text)
-
-            jobs = []
-            items = root.findall(".//item")[:limit]
-
-            for item in items:
-                job = self._parse_rss_item(item, category)
-                if job:
-                    jobs.append(job)
+            jobs = [job async for job in self.iter_jobs(category=category, limit=limit)]
 
             print(f"WeWorkRemotely: Fetched {len(jobs)} jobs")
             return jobs
@@ -71,6 +73,116 @@ class WeWorkRemotelyClient:
             print(f"Traceback: {traceback.format_exc()}")
             return []
 
+    def is_configured(self) -> bool:
+        """WeWorkRemotely needs no credentials."""
+        return True
+
+    async def iter_pages(
+        self,
+        keyword: str = "",
+        location: str = "",
+        category: Optional[str] = None,
+        limit: int = 100,
+        page_size: int = 25,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield streamed RSS jobs in pages of ``page_size``.
+
+        The RSS feeds are per category; keyword and location are ignored.
+
+        Raises:
+            httpx.HTTPError, ET.ParseError: when the feed cannot be read
+        """
+        page: List[Dict[str, Any]] = []
+        async for job in self.iter_jobs(category=category, limit=limit):
+            page.append(job)
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    async def iter_jobs(
+        self,
+        category: Optional[str] = None,
+        limit: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream jobs from the RSS feed as each ``<item>`` finishes parsing.
+
+        The response body is fed to a pull parser chunk by chunk and every item
+        is dropped from the tree once parsed, so the feed is never held in
+        memory as both text and a full tree. Jobs are yielded as soon as they
+        are parsed and the download stops once ``limit`` jobs are produced.
+        Only a feed that was read to the end is cached, since a partial parse
+        cannot answer a later request with a larger limit.
+
+        Args:
+            category: Category to fetch (programming, design, devops, etc.)
+            limit: Maximum number of jobs to yield
+
+        Raises:
+            httpx.HTTPError, ET.ParseError: when the feed cannot be read
+        """
+        if limit <= 0:
+            return
+
+        # Use specified category or default to programming
+        rss_url = self.CATEGORIES.get(category, self.RSS_URL)
+
+        cached = self.cache.get_fresh(rss_url, key=category)
+        if cached is None:
+            headers = self.cache.conditional_headers(rss_url, key=category)
+            await get_source_limiter(self.name).throttle()
+            async with self.session.stream("GET", rss_url, headers=headers) as response:
+                if response.status_code == 304:
+                    cached = self.cache.revalidated(rss_url, key=category)
+                if cached is None:
+                    response.raise_for_status()
+                    parser = ET.XMLPullParser(events=("start", "end"))
+                    open_elements: List[ET.Element] = []
+                    jobs: List[Dict[str, Any]] = []
+
+                    async for chunk in response.aiter_bytes():
+                        parser.feed(chunk)
+                        for job in self._read_items(parser, open_elements, category):
+                            jobs.append(job)
+                            yield dict(job)
+                            if len(jobs) >= limit:
+                                return
+
+                    parser.close()
+                    produced = len(jobs)
+                    jobs.extend(self._read_items(parser, open_elements, category))
+                    self.cache.store(rss_url, response, jobs, key=category)
+                    for job in jobs[produced:limit]:
+                        yield dict(job)
+                    return
+
+        for job in cached[:limit]:
+            yield dict(job)
+
+    def _read_items(
+        self,
+        parser: ET.XMLPullParser,
+        open_elements: List[ET.Element],
+        category: Optional[str],
+    ) -> Iterator[Dict[str, Any]]:
+        """Parse each completed ``<item>`` and detach it from the tree."""
+        for event, elem in parser.read_events():
+            if event == "start":
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if elem.tag != "item":
+                continue
+            job = self._parse_rss_item(elem, category)
+            if open_elements:
+                open_elements[-1].remove(elem)
+            elem.clear()
+            if job:
+                yield job
+
     def _parse_rss_item(self, item: ET.Element, category: Optional[str]) -> Optional[Dict[str, Any]]:
         """Parse RSS item into standardized job format."""
         try:
@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+import uuid
+from typing import Any, Dict, Optional
 
 import httpx
 from pydantic import ValidationError
 
 from app.core.config import settings
 from app.schemas.llm import ResumeGraphData
+from app.services.job_skill_index_service import resume_skill_rows, resume_skills_version
+from app.services.resume_profile_cache import resume_profile_cache
+
+# Bump when the extraction prompt changes, so cached extractions are redone.
+RESUME_GRAPH_PROMPT_VERSION = 1
 
 
 class ResumeGraphExtractionError(ValueError):
@@ -108,6 +114,7 @@ Return JSON with this exact structure:
         *,
         resume_id: str,
         user_id: str,
+        resume: Optional[Dict[str, Any]] = None,
     ) -> int:
         """
         Create a subgraph in Neo4j from structured resume data.
@@ -119,119 +126,162 @@ Return JSON with this exact structure:
 
         Idempotent: re-running for the same resume_id replaces edges
         without duplicating shared content nodes.
-        """
-        nodes_created = 0
 
-        person = graph_data.get("person", {})
-        person_name = person.get("name", "Unknown")
-
-        # MERGE Person scoped under the user via :OWNS, then refresh Resume
-        # contact info on the Person.
-        person_query = """
-        MATCH (u:User {id: $user_id})
-        MERGE (u)-[:OWNS]->(p:Person {name: $name})
-        SET p.email = $email,
-            p.phone = $phone,
-            p.location = $location,
-            p.updated_at = datetime()
-        WITH p
-        MATCH (r:Resume {id: $resume_id})
-        MERGE (r)-[:BELONGS_TO]->(p)
-        RETURN p
-        """
-        result = await db.run(
-            person_query,
-            user_id=user_id,
-            resume_id=resume_id,
-            name=person_name,
-            email=person.get("email"),
-            phone=person.get("phone"),
-            location=person.get("location"),
-        )
-        summary = await result.consume()
-        nodes_created += summary.counters.nodes_created
+        The whole graph is sent as parameters and written by a handful of
+        UNWIND statements in one write transaction, so a failure leaves the
+        previous subgraph intact.
 
-        # Replace any existing per-resume edges so re-uploads stay clean.
-        await db.run(
-            """
-            MATCH (r:Resume {id: $resume_id})-[rel:HAS_SKILL|HAS_EXPERIENCE|HAS_EDUCATION]->()
-            DELETE rel
-            """,
-            resume_id=resume_id,
-        )
-
-        # Skills (Resume->Skill)
-        for skill in graph_data.get("skills", []) or []:
-            if isinstance(skill, str) and skill.strip():
-                result = await db.run(
-                    """
-                    MERGE (s:Skill {name: $skill_name})
-                    WITH s
-                    MATCH (r:Resume {id: $resume_id})
-                    MERGE (r)-[rel:HAS_SKILL]->(s)
-                    SET rel.created_at = coalesce(rel.created_at, datetime())
-                    RETURN s
-                    """,
-                    skill_name=skill.strip(),
-                    resume_id=resume_id,
-                )
-                summary = await result.consume()
-                nodes_created += summary.counters.nodes_created
-
-        # Experiences (Resume->Experience)
-        for exp in graph_data.get("experiences", []) or []:
-            if isinstance(exp, dict):
-                result = await db.run(
-                    """
-                    MERGE (e:Experience {
-                        title: $title,
-                        company: $company,
-                        duration: $duration,
-                        description: $description
-                    })
-                    ON CREATE SET e.created_at = datetime()
-                    WITH e
-                    MATCH (r:Resume {id: $resume_id})
-                    MERGE (r)-[rel:HAS_EXPERIENCE]->(e)
-                    ON CREATE SET rel.created_at = datetime()
-                    RETURN e
-                    """,
-                    title=exp.get("title", ""),
-                    company=exp.get("company", ""),
-                    duration=exp.get("duration", ""),
-                    description=exp.get("description", ""),
-                    resume_id=resume_id,
-                )
-                summary = await result.consume()
-                nodes_created += summary.counters.nodes_created
-
-        # Education (Resume->Education)
-        for edu in graph_data.get("education", []) or []:
-            if isinstance(edu, dict):
-                result = await db.run(
-                    """
-                    MERGE (e:Education {
-                        degree: $degree,
-                        institution: $institution,
-                        year: $year
-                    })
-                    ON CREATE SET e.created_at = datetime()
-                    WITH e
-                    MATCH (r:Resume {id: $resume_id})
-                    MERGE (r)-[rel:HAS_EDUCATION]->(e)
-                    ON CREATE SET rel.created_at = datetime()
-                    RETURN e
-                    """,
-                    degree=edu.get("degree", ""),
-                    institution=edu.get("institution", ""),
-                    year=edu.get("year", ""),
-                    resume_id=resume_id,
-                )
-                summary = await result.consume()
-                nodes_created += summary.counters.nodes_created
+        Args:
+            resume: Properties (name, person_name, text, filename) of a new
+                Resume node to create, owned by the user, in the same
+                transaction; omit to rebuild an existing resume
 
+        Returns:
+            Number of nodes created
+        """
+        person = graph_data.get("person", {})
+        params = {
+            "user_id": user_id,
+            "resume_id": resume_id,
+            "name": person.get("name", "Unknown"),
+            "email": person.get("email"),
+            "phone": person.get("phone"),
+            "location": person.get("location"),
+            # Canonical Skill names shared with the job-side skill index.
+            "skills": resume_skill_rows(
+                skill
+                for skill in graph_data.get("skills", []) or []
+                if isinstance(skill, str) and skill.strip()
+            ),
+            "skills_version": resume_skills_version(),
+            "experiences": [
+                {
+                    "title": exp.get("title", ""),
+                    "company": exp.get("company", ""),
+                    "duration": exp.get("duration", ""),
+                    "description": exp.get("description", ""),
+                }
+                for exp in graph_data.get("experiences", []) or []
+                if isinstance(exp, dict)
+            ],
+            "education": [
+                {
+                    "degree": edu.get("degree", ""),
+                    "institution": edu.get("institution", ""),
+                    "year": edu.get("year", ""),
+                }
+                for edu in graph_data.get("education", []) or []
+                if isinstance(edu, dict)
+            ],
+            # New profile version: materialized ATS scores for this resume are stale.
+            "profile_version": str(uuid.uuid4()),
+            "resume": resume,
+        }
+        nodes_created = await db.execute_write(_write_resume_subgraph_tx, params)
+        resume_profile_cache.invalidate(resume_id)
         return nodes_created
 
 
+# Create the Resume node and link it to the owning user.
+_RESUME_CYPHER = """
+MATCH (u:User {id: $user_id})
+CREATE (r:Resume {
+    id: $resume_id,
+    name: $resume.name,
+    person_name: $resume.person_name,
+    text: $resume.text,
+    filename: $resume.filename,
+    created_at: datetime(),
+    updated_at: datetime()
+})
+MERGE (u)-[:OWNS]->(r)
+"""
+
+# MERGE Person scoped under the user via :OWNS, then refresh Resume
+# contact info on the Person.
+_PERSON_CYPHER = """
+MATCH (u:User {id: $user_id})
+MERGE (u)-[:OWNS]->(p:Person {name: $name})
+SET p.email = $email,
+    p.phone = $phone,
+    p.location = $location,
+    p.updated_at = datetime()
+WITH p
+MATCH (r:Resume {id: $resume_id})
+MERGE (r)-[:BELONGS_TO]->(p)
+"""
+
+# Replace any existing per-resume edges so re-uploads stay clean.
+_CLEAR_EDGES_CYPHER = """
+MATCH (r:Resume {id: $resume_id})-[rel:HAS_SKILL|HAS_EXPERIENCE|HAS_EDUCATION]->()
+DELETE rel
+"""
+
+_SKILLS_CYPHER = """
+MATCH (r:Resume {id: $resume_id})
+UNWIND $skills AS skill
+MERGE (s:Skill {name: skill.name})
+MERGE (r)-[rel:HAS_SKILL]->(s)
+SET rel.labels = skill.labels,
+    rel.created_at = coalesce(rel.created_at, datetime())
+"""
+
+_EXPERIENCES_CYPHER = """
+MATCH (r:Resume {id: $resume_id})
+UNWIND $experiences AS exp
+MERGE (e:Experience {
+    title: exp.title,
+    company: exp.company,
+    duration: exp.duration,
+    description: exp.description
+})
+ON CREATE SET e.created_at = datetime()
+MERGE (r)-[rel:HAS_EXPERIENCE]->(e)
+ON CREATE SET rel.created_at = datetime()
+"""
+
+_EDUCATION_CYPHER = """
+MATCH (r:Resume {id: $resume_id})
+UNWIND $education AS edu
+MERGE (e:Education {
+    degree: edu.degree,
+    institution: edu.institution,
+    year: edu.year
+})
+ON CREATE SET e.created_at = datetime()
+MERGE (r)-[rel:HAS_EDUCATION]->(e)
+ON CREATE SET rel.created_at = datetime()
+"""
+
+_PROFILE_VERSION_CYPHER = """
+MATCH (r:Resume {id: $resume_id})
+SET r.profile_version = $profile_version,
+    r.skills_version = $skills_version,
+    r.updated_at = datetime()
+"""
+
+
+async def _write_resume_subgraph_tx(tx, params: Dict[str, Any]) -> int:
+    if params["resume"]:
+        # Not part of the subgraph: excluded from nodes_created.
+        await (await tx.run(_RESUME_CYPHER, **params)).consume()
+
+    nodes_created = 0
+    for cypher, needs in (
+        (_PERSON_CYPHER, None),
+        (_CLEAR_EDGES_CYPHER, None),
+        (_SKILLS_CYPHER, "skills"),
+        (_EXPERIENCES_CYPHER, "experiences"),
+        (_EDUCATION_CYPHER, "education"),
+        (_PROFILE_VERSION_CYPHER, None),
+    ):
+        if needs and not params[needs]:
+            continue
+        result = await tx.run(cypher, **params)
+        summary = await result.consume()
+        nodes_created += summary.counters.nodes_created
+    return nodes_created
+
+
 # Global service instance
 knowledge_graph_service = KnowledgeGraphService()
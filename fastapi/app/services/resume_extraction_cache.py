@@ -0,0 +1,141 @@
+"""Content-addressed cache of LLM resume extractions.
+
+``transform_resume_to_graph`` sends the whole resume to Ollama, which takes
+30-180 s, and users often re-upload the same file under a new resume name.
+Extractions are stored as ``:ResumeExtraction`` nodes keyed by a SHA-256 of
+the uploading user, the normalized resume text, the Ollama model and the
+prompt version, so identical content skips the LLM call. Entries are per
+user like every other resume artifact: a cache hit (reported as
+``extraction_cached``) never reveals another account's uploads. Changing the model or bumping
+``RESUME_GRAPH_PROMPT_VERSION`` makes old entries unreachable; they age
+out through the least-recently-used eviction that keeps the cache at
+``resume_extraction_cache_size`` entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.schemas.llm import ResumeGraphData
+from app.services.knowledge_graph_service import (
+    RESUME_GRAPH_PROMPT_VERSION,
+    knowledge_graph_service,
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+_GET_CYPHER = """
+MATCH (c:ResumeExtraction {key: $key})
+SET c.last_used_at = datetime(), c.hits = coalesce(c.hits, 0) + 1
+RETURN c.graph_data AS graph_data
+"""
+
+_SET_CYPHER = """
+MERGE (c:ResumeExtraction {key: $key})
+ON CREATE SET c.created_at = datetime(), c.hits = 0
+SET c.graph_data = $graph_data,
+    c.user_id = $user_id,
+    c.model = $model,
+    c.prompt_version = $prompt_version,
+    c.last_used_at = datetime()
+"""
+
+_EVICT_CYPHER = """
+MATCH (c:ResumeExtraction)
+WITH c ORDER BY c.last_used_at DESC
+SKIP $max_entries
+DELETE c
+"""
+
+
+def normalize_resume_text(text: str) -> str:
+    """Unicode-normalize and collapse whitespace, so re-exports of the same
+    document (different line endings, spacing) share a cache entry."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def extraction_key(
+    text: str,
+    model: str,
+    user_id: str,
+    prompt_version: int = RESUME_GRAPH_PROMPT_VERSION,
+) -> str:
+    """SHA-256 of the user, the normalized text, the model and the prompt version."""
+    content = "\x1f".join([str(prompt_version), model, user_id, normalize_resume_text(text)])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ResumeExtractionCache:
+    """Neo4j-backed cache in front of ``transform_resume_to_graph``."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = (
+            settings.resume_extraction_cache_size if max_entries is None else max_entries
+        )
+
+    async def get(self, db, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached graph data for ``key``, or None on a miss.
+
+        Entries that no longer validate against ``ResumeGraphData`` count as
+        misses and are overwritten by the next extraction.
+        """
+        record = await (await db.run(_GET_CYPHER, key=key)).single()
+        if not record or not record["graph_data"]:
+            return None
+        try:
+            return ResumeGraphData.model_validate_json(record["graph_data"]).model_dump()
+        except ValidationError:
+            return None
+
+    async def set(self, db, key: str, graph_data: Dict[str, Any], user_id: str) -> None:
+        """Store validated graph data and evict beyond ``max_entries``."""
+        await (await db.run(
+            _SET_CYPHER,
+            key=key,
+            graph_data=json.dumps(graph_data),
+            user_id=user_id,
+            model=knowledge_graph_service.model,
+            prompt_version=RESUME_GRAPH_PROMPT_VERSION,
+        )).consume()
+        await (await db.run(_EVICT_CYPHER, max_entries=self.max_entries)).consume()
+
+    async def get_or_extract(self, db, resume_text: str, user_id: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Extract the resume graph, reusing the user's cached extraction of
+        the same content.
+
+        Args:
+            db: Neo4j database session
+            resume_text: Extracted resume text
+            user_id: Uploading user; entries are never shared across users
+
+        Returns:
+            Tuple of (graph data, whether it came from the cache). The graph
+            data is a fresh dict the caller may modify.
+
+        Raises:
+            ResumeGraphExtractionError: if the LLM output is unusable (not cached)
+            ValueError: If Ollama authentication is required
+        """
+        if self.max_entries <= 0:
+            return await knowledge_graph_service.transform_resume_to_graph(resume_text), False
+
+        key = extraction_key(resume_text, knowledge_graph_service.model, user_id)
+        cached = await self.get(db, key)
+        if cached is not None:
+            return cached, True
+
+        graph_data = await knowledge_graph_service.transform_resume_to_graph(resume_text)
+        await self.set(db, key, graph_data, user_id)
+        return graph_data, False
+
+
+# Global service instance
+resume_extraction_cache = ResumeExtractionCache()
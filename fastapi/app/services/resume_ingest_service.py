@@ -0,0 +1,305 @@
+"""Resume upload pipeline and its background job queue.
+
+``ingest`` runs the whole upload: text extraction, LLM graph extraction
+(through ``resume_extraction_cache``) and the subgraph write. The upload
+endpoint either awaits it inline or ``submit``s it as a background job, so
+the request returns at once and the work survives client timeouts. At most
+``resume_ingest_concurrency`` jobs run at a time, the rest wait as
+``queued``; beyond ``resume_ingest_max_pending`` unfinished jobs new
+submissions are refused. Job state lives in this process and finished jobs
+are kept for ``resume_ingest_job_ttl`` seconds. ``start`` (called from the
+app's startup hook) creates the concurrency semaphore on the serving loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Literal, Optional
+
+from app.core.config import settings
+from app.core.database import neo4j_db
+from app.services.knowledge_graph_service import knowledge_graph_service
+from app.services.resume_extraction_cache import resume_extraction_cache
+from app.services.resume_processor import resume_processor
+
+IngestStatus = Literal[
+    "queued", "extracting_text", "extracting_graph", "writing", "completed", "failed"
+]
+TERMINAL_STATUSES = ("completed", "failed")
+
+logger = logging.getLogger(__name__)
+
+
+class IngestQueueFullError(RuntimeError):
+    """Raised when too many background uploads are already pending."""
+
+
+def describe_ingest_error(exc: Exception) -> Dict[str, Any]:
+    """Default ``{"status_code", "detail"}`` kept for a failed job."""
+    return {"status_code": 500, "detail": str(exc)}
+
+
+@dataclass
+class IngestJob:
+    """A background resume upload and its progress."""
+
+    job_id: str
+    user_id: str
+    filename: str
+    resume_name: str
+    status: IngestStatus = "queued"
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[Dict[str, Any]] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    # Set, then replaced, on every status change. Created by submit() on
+    # the running loop.
+    changed: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+
+class ResumeIngestService:
+    """Runs resume uploads inline or as bounded background jobs."""
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None):
+        self._session_factory = session_factory or neo4j_db.session
+        self._jobs: Dict[str, IngestJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def ingest(
+        self,
+        db,
+        *,
+        user_id: str,
+        file_content: bytes,
+        filename: str,
+        resume_name: str,
+        person_name: str = "",
+        progress: Optional[Callable[[IngestStatus], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Extract, structure and store one uploaded resume.
+
+        Args:
+            db: Neo4j database session
+            user_id: Owner of the new resume
+            file_content: Uploaded file bytes
+            filename: Uploaded file name (selects the text extractor)
+            resume_name: Name of the new resume
+            person_name: Overrides the name the LLM extracted, if given
+            progress: Called with each pipeline stage as it starts
+
+        Returns:
+            The upload response payload
+
+        Raises:
+            ValueError: if no meaningful text could be extracted, the format
+                is unsupported or Ollama authentication is required
+            ResumeGraphExtractionError: if the LLM output is unusable
+            ExecutorTimeoutError: if text extraction timed out
+        """
+        report = progress or (lambda status: None)
+
+        report("extracting_text")
+        text = await resume_processor.extract_text_from_file(file_content, filename)
+        if not text or len(text.strip()) < 10:
+            raise ValueError("Could not extract meaningful text from the file")
+
+        report("extracting_graph")
+        # Re-uploads of the same content reuse the stored LLM extraction.
+        graph_data, extraction_cached = await resume_extraction_cache.get_or_extract(db, text, user_id)
+
+        extracted_person_name = (
+            graph_data.get("person", {}).get("name") if graph_data.get("person") else None
+        )
+        final_person_name = (
+            person_name.strip()
+            if person_name and person_name.strip()
+            else (extracted_person_name or "Unknown")
+        )
+        if not graph_data.get("person"):
+            graph_data["person"] = {"name": final_person_name}
+        else:
+            graph_data["person"]["name"] = final_person_name
+
+        final_resume_name = resume_name.strip()
+
+        # Create the Resume node, owned by the user, together with its
+        # subgraph (Skills/Experiences/Education hang off this Resume;
+        # Person is created/MERGEd under the user) in one transaction.
+        report("writing")
+        resume_id = str(uuid.uuid4())
+        nodes_created = await knowledge_graph_service.create_resume_subgraph(
+            db,
+            graph_data,
+            resume_id=resume_id,
+            user_id=user_id,
+            resume={
+                "name": final_resume_name,
+                "person_name": final_person_name,
+                "text": text,
+                "filename": filename,
+            },
+        )
+
+        return {
+            "message": "Resume processed successfully",
+            "resume_id": resume_id,
+            "resume_name": final_resume_name,
+            "person_name": final_person_name,
+            "filename": filename,
+            "text_length": len(text),
+            "nodes_created": nodes_created,
+            "extraction_cached": extraction_cached,
+            "graph_data": graph_data,
+        }
+
+    def submit(
+        self,
+        *,
+        user_id: str,
+        file_content: bytes,
+        filename: str,
+        resume_name: str,
+        person_name: str = "",
+        describe_error: Callable[[Exception], Dict[str, Any]] = describe_ingest_error,
+    ) -> IngestJob:
+        """
+        Queue an upload to run in the background on its own database session.
+
+        Args:
+            describe_error: Maps a failure to the ``{"status_code", "detail"}``
+                stored as the job's ``error``
+
+        Raises:
+            RuntimeError: if ``start`` has not been called
+            IngestQueueFullError: if ``resume_ingest_max_pending`` jobs are unfinished
+        """
+        if self._slots is None:
+            raise RuntimeError("ResumeIngestService.start() must run before submit()")
+        self._prune()
+        if len(self._tasks) >= settings.resume_ingest_max_pending:
+            raise IngestQueueFullError(
+                f"{len(self._tasks)} resume uploads are already being processed; retry shortly"
+            )
+
+        job = IngestJob(
+            job_id=str(uuid.uuid4()),
+            user_id=user_id,
+            filename=filename,
+            resume_name=resume_name.strip(),
+            changed=asyncio.Event(),
+        )
+        self._jobs[job.job_id] = job
+        task = asyncio.create_task(self._run(job, describe_error, {
+            "user_id": user_id,
+            "file_content": file_content,
+            "filename": filename,
+            "resume_name": resume_name,
+            "person_name": person_name,
+        }))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _task: self._tasks.pop(job.job_id, None))
+        return job
+
+    async def _run(
+        self,
+        job: IngestJob,
+        describe_error: Callable[[Exception], Dict[str, Any]],
+        upload: Dict[str, Any],
+    ) -> None:
+        try:
+            async with self._slots:
+                async with self._session_factory() as db:
+                    job.result = await self.ingest(
+                        db, progress=lambda status: self._update(job, status), **upload
+                    )
+            self._update(job, "completed")
+        except asyncio.CancelledError:
+            job.error = {
+                "status_code": 503,
+                "detail": "Resume upload was cancelled by a server shutdown",
+            }
+            self._update(job, "failed")
+            raise
+        except Exception as e:
+            logger.exception("Background resume upload %s failed", job.job_id)
+            job.error = describe_error(e)
+            self._update(job, "failed")
+
+    def _update(self, job: IngestJob, status: IngestStatus) -> None:
+        job.status = status
+        job.updated_at = time.time()
+        if job.done:
+            job.finished_at = job.updated_at
+        changed, job.changed = job.changed, asyncio.Event()
+        changed.set()
+
+    def get(self, job_id: str, user_id: str) -> Optional[IngestJob]:
+        """Return one of the user's jobs, or None if unknown or expired."""
+        self._prune()
+        job = self._jobs.get(job_id)
+        return job if job is not None and job.user_id == user_id else None
+
+    async def watch(self, job: IngestJob, heartbeat: float = 15.0) -> AsyncIterator[Optional[IngestJob]]:
+        """
+        Yield the job on every status change until it finishes.
+
+        Yields None when ``heartbeat`` seconds pass without a change, so
+        streaming callers can keep idle connections open.
+        """
+        while True:
+            changed = job.changed
+            yield job
+            if job.done:
+                return
+            while True:
+                try:
+                    await asyncio.wait_for(changed.wait(), heartbeat)
+                    break
+                except asyncio.TimeoutError:
+                    yield None
+
+    def _prune(self) -> None:
+        cutoff = time.time() - settings.resume_ingest_job_ttl
+        for job_id in [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counts by status, for the health check."""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "concurrency": settings.resume_ingest_concurrency,
+            "pending": len(self._tasks),
+            "max_pending": settings.resume_ingest_max_pending,
+            "jobs": counts,
+        }
+
+    async def start(self) -> None:
+        """Create the concurrency semaphore on the serving event loop."""
+        self._slots = asyncio.Semaphore(max(settings.resume_ingest_concurrency, 1))
+
+    async def shutdown(self) -> None:
+        """Cancel unfinished jobs; their status becomes ``failed``."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Global service instance
+resume_ingest_service = ResumeIngestService()
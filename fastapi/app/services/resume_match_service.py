@@ -0,0 +1,122 @@
+"""Bounded top-K scoring of a resume against stored job postings."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.ats_service import ResumeATSProfile, ats_service
+from app.services.job_search_service import (
+    JobSearchService,
+    JobView,
+    job_search_service,
+    public_job,
+    truncate_description,
+)
+
+
+@dataclass
+class ScoredPage:
+    """One page of candidates: the page's best jobs and the running totals."""
+
+    jobs: List[Dict[str, Any]]
+    scanned: int
+    top: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class ResumeMatchService:
+    """Scores a resume against the postings that share a skill with it.
+
+    Candidates are found by traversing from the resume over its
+    ``HAS_SKILL`` edges to the canonical skills and on to postings over
+    ``REQUIRES_SKILL`` edges (see ``job_skill_index_service``), most shared
+    skills first, read in keyset pages of
+    ``resume_score_page_size`` and capped at ``resume_score_max_candidates``.
+    Each page is ranked with ``ats_service.rank_resume_to_jobs`` and merged
+    into a running top-K, so memory and scoring work are bounded by the
+    page size and K rather than by the size of the corpus. Without a stored
+    resume, or when no posting shares one of its skills, the most recent
+    postings are scored instead.
+    """
+
+    def __init__(self, search: Optional[JobSearchService] = None):
+        self.search = search or job_search_service
+
+    async def iter_pages(
+        self,
+        db,
+        profile: ResumeATSProfile,
+        top: int,
+        view: JobView = "summary",
+        page_size: Optional[int] = None,
+        max_candidates: Optional[int] = None,
+        resume_id: Optional[str] = None,
+    ) -> AsyncIterator[ScoredPage]:
+        """
+        Yield a ``ScoredPage`` per candidate page as soon as it is scored.
+
+        ``ScoredPage.jobs`` are the page's best ``top`` jobs (best first);
+        ``ScoredPage.top`` is the overall top-K so far.
+        """
+        page_size = page_size or settings.resume_score_page_size
+        max_candidates = max_candidates or settings.resume_score_max_candidates
+        best: List[Dict[str, Any]] = []
+        scanned = 0
+        cursor = None
+        skills_of = resume_id
+        while scanned < max_candidates:
+            rows, cursor = await self.search.search(
+                db,
+                limit=min(page_size, max_candidates - scanned),
+                cursor=cursor,
+                view=view,
+                for_scoring=True,
+                skills_of=skills_of,
+            )
+            if not rows and skills_of and not scanned:
+                skills_of = None
+                continue
+            if not rows:
+                break
+            scanned += len(rows)
+
+            jobs = [job for job, _ in rows]
+            requirements = [ats_service.get_job_requirements(job) for job in jobs]
+            ranked = []
+            for index, scoring in ats_service.rank_resume_to_jobs(profile, jobs, top, requirements):
+                job = public_job(jobs[index])
+                job.update(scoring)
+                if view == "summary":
+                    truncate_description(job)
+                ranked.append(job)
+
+            # nlargest is stable, so earlier (more relevant) pages win ties.
+            best = heapq.nlargest(top, best + ranked, key=lambda job: job.get("ats_score", 0))
+            yield ScoredPage(jobs=ranked, scanned=scanned, top=best)
+            if cursor is None:
+                break
+
+    async def top_jobs(
+        self,
+        db,
+        profile: ResumeATSProfile,
+        top: int,
+        view: JobView = "summary",
+        resume_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Score every candidate page and return the overall best jobs.
+
+        Returns:
+            ``{"jobs": [...best first], "scanned": candidates scored}``
+        """
+        result: Dict[str, Any] = {"jobs": [], "scanned": 0}
+        async for page in self.iter_pages(db, profile, top, view, resume_id=resume_id):
+            result = {"jobs": page.top, "scanned": page.scanned}
+        return result
+
+
+# Global service instance
+resume_match_service = ResumeMatchService()
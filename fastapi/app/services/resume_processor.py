@@ -1,17 +1,41 @@
 """Resume file processing service supporting multiple formats."""
 from __future__ import annotations
+import asyncio
 import os
+import threading
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Optional, Tuple
 from pypdf import PdfReader
 from docx import Document
+from app.core.config import settings
+from app.core.executors import BoundedExecutor
 
+# PyMuPDF is not thread-safe; thread pools take turns, process pools never contend.
+_PYMUPDF_LOCK = threading.Lock()
 
-class ResumeProcessor:
-    """Service for processing resume files in various formats."""
 
-    @staticmethod
-    async def extract_text_from_file(file_content: bytes, filename: str) -> str:
+class ResumeProcessor:
+    """Service for processing resume files in various formats.
+
+    PDF and DOCX parsing is CPU-bound, so it runs on a bounded worker pool
+    (``extraction_executor``: thread or process, ``extraction_max_workers``,
+    ``extraction_timeout``) instead of on the event loop.
+
+    PDFs are read with PyMuPDF text blocks in reading order (pypdf is the
+    fallback, or the backend when ``pdf_extractor`` is ``"pypdf"``). On a
+    process pool, PDFs longer than ``pdf_pages_per_job`` pages are split
+    into page ranges extracted in parallel.
+    """
+
+    def __init__(self, executor: Optional[BoundedExecutor] = None):
+        self.executor = executor or BoundedExecutor(
+            "resume-extract",
+            kind=settings.extraction_executor,
+            max_workers=settings.extraction_max_workers,
+            timeout=settings.extraction_timeout,
+        )
+
+    async def extract_text_from_file(self, file_content: bytes, filename: str) -> str:
         """
         Extract text from a resume file.
 
@@ -23,6 +47,10 @@ class ResumeProcessor:
 
         Returns:
             Extracted text content
+
+        Raises:
+            ValueError: if the format is unsupported
+            ExecutorTimeoutError: if extraction exceeds the timeout
         """
         file_ext = Path(filename).suffix.lower()
 
@@ -30,10 +58,10 @@ class ResumeProcessor:
             return ResumeProcessor._extract_text_plain(file_content)
 
         elif file_ext == '.pdf':
-            return ResumeProcessor._extract_text_pdf(file_content)
+            return await self._extract_pdf(file_content)
 
         elif file_ext in ['.doc', '.docx']:
-            return ResumeProcessor._extract_text_docx(file_content)
+            return await self.executor.run(ResumeProcessor._extract_text_docx, file_content)
 
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
@@ -48,19 +76,81 @@ class ResumeProcessor:
             # Fallback to latin-1
             return file_content.decode('latin-1', errors='ignore')
 
+    async def _extract_pdf(self, file_content: bytes) -> str:
+        """Extract a PDF on the pool, fanning page ranges out when page-parallel."""
+        backend = settings.pdf_extractor
+        pages_per_job = settings.pdf_pages_per_job
+        if backend != "pymupdf" or self.executor.kind != "process" or pages_per_job <= 0:
+            text, _ = await self.executor.run(
+                ResumeProcessor._extract_text_pdf, file_content, 0, None, backend
+            )
+            return text
+
+        # The first range also reports the page count, so short resumes cost one job.
+        first, page_count = await self.executor.run(
+            ResumeProcessor._extract_text_pdf, file_content, 0, pages_per_job, backend
+        )
+        rest = await asyncio.gather(*(
+            self.executor.run(
+                ResumeProcessor._extract_text_pdf,
+                file_content, start, min(start + pages_per_job, page_count), backend,
+            )
+            for start in range(pages_per_job, page_count, pages_per_job)
+        ))
+        return "\n".join(text for text in [first, *(text for text, _ in rest)] if text)
+
     @staticmethod
-    def _extract_text_pdf(file_content: bytes) -> str:
-        """Extract text from PDF files using pypdf."""
-        from io import BytesIO
+    def _extract_text_pdf(
+        file_content: bytes,
+        start: int = 0,
+        stop: Optional[int] = None,
+        backend: str = "pymupdf",
+    ) -> Tuple[str, int]:
+        """
+        Extract text from pages ``[start, stop)`` of a PDF.
 
-        pdf_stream = BytesIO(file_content)
-        reader = PdfReader(pdf_stream)
+        Falls back to pypdf when PyMuPDF is not installed or cannot read the
+        file.
 
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
+        Returns:
+            Tuple of (text, total page count)
+        """
+        if backend == "pymupdf":
+            try:
+                return ResumeProcessor._extract_text_pdf_pymupdf(file_content, start, stop)
+            except Exception as e:
+                print(f"PyMuPDF extraction failed, falling back to pypdf: {e}")
+        return ResumeProcessor._extract_text_pdf_pypdf(file_content, start, stop)
 
-        return text.strip()
+    @staticmethod
+    def _extract_text_pdf_pymupdf(
+        file_content: bytes, start: int = 0, stop: Optional[int] = None
+    ) -> Tuple[str, int]:
+        """Extract PDF text blocks in reading order using PyMuPDF."""
+        import fitz  # PyMuPDF
+
+        with _PYMUPDF_LOCK, fitz.open(stream=file_content, filetype="pdf") as doc:
+            page_count = doc.page_count
+            pages = []
+            for page_number in range(start, page_count if stop is None else min(stop, page_count)):
+                # blocks: (x0, y0, x1, y1, text, block_no, block_type); type 1 is an image
+                blocks = doc[page_number].get_text("blocks", sort=True)
+                pages.append("\n".join(
+                    block[4].strip() for block in blocks if block[6] == 0 and block[4].strip()
+                ))
+        return "\n".join(pages).strip(), page_count
+
+    @staticmethod
+    def _extract_text_pdf_pypdf(
+        file_content: bytes, start: int = 0, stop: Optional[int] = None
+    ) -> Tuple[str, int]:
+        """Extract text from PDF files using pypdf."""
+        from io import BytesIO
+
+        reader = PdfReader(BytesIO(file_content))
+        pages = reader.pages[start:stop]
+        text = "\n".join(page.extract_text() for page in pages)
+        return text.strip(), len(reader.pages)
 
     @staticmethod
     def _extract_text_docx(file_content: bytes) -> str:
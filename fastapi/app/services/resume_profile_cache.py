@@ -0,0 +1,96 @@
+"""Cache of ATS resume profiles shared by the scoring endpoints.
+
+Building a ``ResumeATSProfile`` collects the resume subgraph and regex-scans
+the full resume text. The result only changes when the subgraph does, and
+``create_resume_subgraph`` stamps every rebuild with a new
+``Resume.profile_version``; profiles are therefore cached per
+``(resume_id, profile_version)`` and the skill alias table they were
+built with. A lookup costs one indexed read of the version, which also
+keeps several worker processes consistent.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.services.ats_service import ResumeATSProfile, ats_service
+from app.services.resume_queries import profile_collections
+
+_VERSION_QUERY = """
+MATCH (r:Resume {id: $resume_id})
+RETURN coalesce(r.profile_version, toString(r.updated_at)) AS profile_version
+"""
+
+_PROFILE_QUERY = f"""
+MATCH (r:Resume {{id: $resume_id}})
+RETURN coalesce(r.profile_version, toString(r.updated_at)) AS profile_version,
+       r.text AS resume_text,
+       {profile_collections("r")}
+"""
+
+
+class ResumeProfileCache:
+    """LRU of resume profiles, validated against the resume's profile version."""
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._profiles: LRUCache[str, Tuple[Tuple[Optional[str], str], ResumeATSProfile]] = LRUCache(
+            settings.resume_profile_cache_size if maxsize is None else maxsize
+        )
+
+    async def get_profile(
+        self,
+        db,
+        resume_id: str,
+        profile_version: Optional[str] = None,
+    ) -> Optional[ResumeATSProfile]:
+        """
+        Return the resume's ATS profile, building it only on a version change.
+
+        Args:
+            db: Neo4j database session
+            resume_id: Resume to profile
+            profile_version: The resume's current version, when the caller
+                has already read it (skips the version lookup)
+
+        Returns:
+            The profile, or None if the resume does not exist
+        """
+        if profile_version is None:
+            record = await (await db.run(_VERSION_QUERY, resume_id=resume_id)).single()
+            if not record:
+                self.invalidate(resume_id)
+                return None
+            profile_version = record["profile_version"]
+
+        cached = self._profiles.get(resume_id)
+        if cached is not None and cached[0] == (profile_version, ats_service.skill_aliases_version):
+            return cached[1]
+
+        record = await (await db.run(_PROFILE_QUERY, resume_id=resume_id)).single()
+        if not record:
+            self.invalidate(resume_id)
+            return None
+        profile = ats_service.build_resume_profile(
+            skills=record["skills"] or [],
+            experiences=record["experiences"] or [],
+            experience_titles=record["experience_titles"] or [],
+            education=record["education"] or [],
+            resume_text=record["resume_text"] or "",
+        )
+        self._profiles.set(
+            resume_id, ((record["profile_version"], ats_service.skill_aliases_version), profile)
+        )
+        return profile
+
+    def invalidate(self, resume_id: str) -> None:
+        """Drop the cached profile of a rebuilt or deleted resume."""
+        self._profiles.pop(resume_id)
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+
+# Global service instance
+resume_profile_cache = ResumeProfileCache()
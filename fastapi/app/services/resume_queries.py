@@ -0,0 +1,79 @@
+"""Cypher fragments for reading a resume subgraph in one row.
+
+Chaining ``OPTIONAL MATCH`` for skills, experiences and education makes
+Neo4j build |skills| x |experiences| x |education| rows before
+``collect(DISTINCT ...)`` folds them back (a resume with 60 skills, 12 roles
+and 3 degrees produces 2,160 rows). ``COLLECT { }`` subqueries aggregate
+each relationship on its own, so the work is |skills| + |experiences| +
+|education| rows. Requires Neo4j 5.6+.
+
+Every helper takes the variable of the node the relationships hang off
+(``r`` for a Resume, ``p`` for a Person) and returns ``RETURN``-clause
+items, so queries keep their own anchor ``MATCH``.
+"""
+
+from __future__ import annotations
+
+
+def collect_related(owner: str, rel: str, label: str, projection: str, alias: str) -> str:
+    """
+    ``COLLECT { }`` item listing the distinct, non-null ``projection`` of
+    ``(owner)-[:rel]->(n:label)`` as ``alias``.
+    """
+    return (
+        f"COLLECT {{ MATCH ({owner})-[:{rel}]->(n:{label}) "
+        f"WITH DISTINCT {projection} AS item WHERE item IS NOT NULL "
+        f"RETURN item }} AS {alias}"
+    )
+
+
+def collect_skill_labels(owner: str, alias: str = "skills") -> str:
+    """
+    ``COLLECT { }`` item listing the skills as written on the resume
+    (``HAS_SKILL.labels``) as ``alias``. Edges written before labels were
+    stored fall back to the Skill node's name.
+    """
+    return (
+        f"COLLECT {{ MATCH ({owner})-[e:HAS_SKILL]->(n:Skill) "
+        f"UNWIND coalesce(e.labels, [n.name]) AS item "
+        f"WITH DISTINCT item WHERE item IS NOT NULL "
+        f"RETURN item }} AS {alias}"
+    )
+
+
+def profile_collections(owner: str = "r") -> str:
+    """Items for ``ats_service.build_resume_profile``: skills, experiences,
+    experience_titles and education (all lists of strings)."""
+    return ",\n       ".join([
+        collect_skill_labels(owner),
+        collect_related(owner, "HAS_EXPERIENCE", "Experience", "n.description", "experiences"),
+        collect_related(owner, "HAS_EXPERIENCE", "Experience", "n.title", "experience_titles"),
+        collect_related(owner, "HAS_EDUCATION", "Education", "n.degree", "education"),
+    ])
+
+
+def context_collections(owner: str = "r") -> str:
+    """Items for an interview context: skill names plus experience and
+    education maps."""
+    return ",\n       ".join([
+        collect_skill_labels(owner),
+        collect_related(
+            owner, "HAS_EXPERIENCE", "Experience",
+            "{title: n.title, company: n.company, duration: n.duration, description: n.description}",
+            "experiences",
+        ),
+        collect_related(
+            owner, "HAS_EDUCATION", "Education",
+            "{degree: n.degree, institution: n.institution, year: n.year}",
+            "education",
+        ),
+    ])
+
+
+def subgraph_collections(owner: str = "r") -> str:
+    """Items for the resume graph view: skill, experience and education nodes."""
+    return ",\n       ".join([
+        collect_related(owner, "HAS_SKILL", "Skill", "n", "skills"),
+        collect_related(owner, "HAS_EXPERIENCE", "Experience", "n", "experiences"),
+        collect_related(owner, "HAS_EDUCATION", "Education", "n", "education"),
+    ])
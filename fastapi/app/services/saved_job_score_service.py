@@ -0,0 +1,225 @@
+"""Materialized ATS scores for saved jobs.
+
+Each (:Resume)-[:SAVED_JOB]->(:JobPosting) relationship carries the last
+ATS result computed for that pair, stamped with the resume profile
+version, the job content hash and ``ats_service.scoring_version`` (the
+scoring formula plus the skill alias table). Reads reuse the stored result
+and rescore rows whose stamps no longer match in memory; they never write.
+The rescored rows come back as ``PendingScores`` for the caller to
+``persist`` after the response (a background task), and ``score_saved_job``
+stores the score of a newly saved job as part of the save.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.database import neo4j_db
+from app.core.pagination import decode_cursor, encode_cursor
+from app.services.ats_service import ats_service, job_content_hash
+from app.services.resume_profile_cache import resume_profile_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingScores:
+    """Scores computed on read, to be written back to SAVED_JOB."""
+
+    resume_id: str
+    profile_version: Optional[str]
+    scoring_version: str
+    rows: List[Dict[str, Any]]
+
+
+_STORE_SCORES_CYPHER = """
+UNWIND $rows AS row
+MATCH (r:Resume {id: $resume_id})-[s:SAVED_JOB]->(j:JobPosting {apply_url: row.apply_url})
+SET s.ats_score = row.ats_score,
+    s.ats_details = row.ats_details,
+    s.ats_job_hash = row.job_hash,
+    s.ats_resume_version = $profile_version,
+    s.ats_scoring_version = $scoring_version,
+    s.ats_scored_at = datetime()
+"""
+
+
+class SavedJobScoreService:
+    """Loads saved jobs with their ATS scores, rescoring only stale rows."""
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None):
+        self._session_factory = session_factory or neo4j_db.session
+
+    async def load_saved_jobs(
+        self,
+        db,
+        *,
+        user_id: str,
+        resume_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the resume name and its saved jobs (newest first), each with
+        ``ats_score`` and ``ats_details``. Read-only: ``pending_scores``
+        holds the rows rescored here (or None) for ``persist``.
+
+        With ``limit`` only one page is loaded (and scored), keyset-paginated
+        on ``(saved_at, apply_url)``; ``next_cursor`` is set when more remain.
+
+        Returns None when the resume does not exist or is not owned by the user.
+
+        Raises:
+            InvalidCursorError: if ``cursor`` is malformed
+        """
+        params: Dict[str, Any] = {"user_id": user_id, "resume_id": resume_id}
+        page_filter = ""
+        page_limit = ""
+        if cursor:
+            params["after_saved_at"], params["after_url"] = decode_cursor(cursor, 2)
+            page_filter = """
+        WHERE s.saved_at < datetime($after_saved_at)
+           OR (s.saved_at = datetime($after_saved_at) AND j.apply_url < $after_url)"""
+        if limit is not None:
+            params["limit"] = limit + 1
+            page_limit = "\n        LIMIT $limit"
+
+        query = f"""
+        MATCH (u:User {{id: $user_id}})-[:OWNS]->(r:Resume {{id: $resume_id}})
+        OPTIONAL MATCH (r)-[s:SAVED_JOB]->(j:JobPosting){page_filter}
+        WITH r, s, j
+        ORDER BY s.saved_at DESC, j.apply_url DESC{page_limit}
+        RETURN r.name AS resume_name,
+               r.person_name AS person_name,
+               coalesce(r.profile_version, toString(r.updated_at)) AS profile_version,
+               collect(CASE WHEN j IS NULL THEN NULL ELSE {{
+                   title: j.title,
+                   company: j.company,
+                   location: j.location,
+                   apply_url: j.apply_url,
+                   source: j.source,
+                   description: j.description,
+                   ats_requirements_hash: j.ats_requirements_hash,
+                   ats_requirements: j.ats_requirements,
+                   saved_at: toString(s.saved_at),
+                   notes: s.notes,
+                   stored_score: s.ats_score,
+                   stored_details: s.ats_details,
+                   stored_resume_version: s.ats_resume_version,
+                   stored_job_hash: s.ats_job_hash,
+                   stored_scoring_version: s.ats_scoring_version
+               }} END) AS jobs
+        """
+        record = await (await db.run(query, **params)).single()
+        if not record:
+            return None
+
+        profile_version = record["profile_version"]
+        scoring_version = ats_service.scoring_version
+        jobs = [dict(job) for job in record["jobs"] or []]
+        next_cursor = None
+        if limit is not None and len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_cursor(jobs[-1]["saved_at"], jobs[-1]["apply_url"])
+
+        stale: List[Dict[str, Any]] = []
+        for job in jobs:
+            job["job_hash"] = job_content_hash(job)
+            if (
+                job.get("stored_details")
+                and job.get("stored_resume_version") == profile_version
+                and job.get("stored_job_hash") == job["job_hash"]
+                and job.get("stored_scoring_version") == scoring_version
+            ):
+                job["ats_score"] = job["stored_score"]
+                job["ats_details"] = json.loads(job["stored_details"])
+            else:
+                stale.append(job)
+
+        pending = None
+        if stale:
+            pending = await self._score(db, resume_id, profile_version, scoring_version, stale)
+
+        return {
+            "resume_name": record["resume_name"],
+            "person_name": record["person_name"],
+            "jobs": jobs,
+            "next_cursor": next_cursor,
+            "pending_scores": pending,
+        }
+
+    async def score_saved_job(
+        self,
+        db,
+        *,
+        resume_id: str,
+        profile_version: Optional[str],
+        job: Dict[str, Any],
+    ) -> None:
+        """
+        Score a just-saved job and store the result on its SAVED_JOB
+        relationship, in the saving request.
+
+        Args:
+            db: Neo4j database session
+            resume_id: Resume the job was saved to
+            profile_version: The resume's current profile version
+            job: Posting properties (title, company, location, description,
+                apply_url and any persisted ATS requirements)
+        """
+        job = dict(job)
+        job["job_hash"] = job_content_hash(job)
+        pending = await self._score(db, resume_id, profile_version, ats_service.scoring_version, [job])
+        await self._store(db, pending)
+
+    async def persist(self, pending: Optional[PendingScores]) -> None:
+        """
+        Write scores computed on read back to SAVED_JOB in a session of its
+        own; meant to run after the response. Failures are logged, the
+        rows are simply rescored on the next read.
+        """
+        if not pending or not pending.rows:
+            return
+        try:
+            async with self._session_factory() as db:
+                await self._store(db, pending)
+        except Exception:
+            logger.exception("Failed to persist ATS scores for resume %s", pending.resume_id)
+
+    async def _score(
+        self,
+        db,
+        resume_id: str,
+        profile_version: Optional[str],
+        scoring_version: str,
+        jobs: List[Dict[str, Any]],
+    ) -> PendingScores:
+        profile = await resume_profile_cache.get_profile(db, resume_id, profile_version)
+        for job, scoring in zip(jobs, ats_service.score_resume_to_jobs(profile, jobs)):
+            job.update(scoring)
+        rows = [
+            {
+                "apply_url": job["apply_url"],
+                "ats_score": job["ats_score"],
+                "ats_details": json.dumps(job["ats_details"]),
+                "job_hash": job["job_hash"],
+            }
+            for job in jobs
+        ]
+        return PendingScores(resume_id, profile_version, scoring_version, rows)
+
+    async def _store(self, db, pending: PendingScores) -> None:
+        result = await db.run(
+            _STORE_SCORES_CYPHER,
+            rows=pending.rows,
+            resume_id=pending.resume_id,
+            profile_version=pending.profile_version,
+            scoring_version=pending.scoring_version,
+        )
+        await result.consume()
+
+
+# Global service instance
+saved_job_score_service = SavedJobScoreService()
@@ -0,0 +1,64 @@
+"""Compare per-job ATS scoring against the batch scorer for one resume x N jobs.
+
+Run from the ``fastapi`` directory:
+
+    python -m benchmarks.bench_batch_scoring
+"""
+from __future__ import annotations
+
+import random
+import timeit
+
+from app.services.ats_service import SKILL_ALIASES, ats_service
+
+WORDS = (
+    "senior junior lead staff required must have preferred bonus plus responsibilities "
+    "you will in this role 5+ years bachelor's master's platform design own build ship "
+    "api services mentor customers reliability observability"
+).split()
+
+
+def make_jobs(count: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    aliases = [alias for values in SKILL_ALIASES.values() for alias in values]
+
+    def text(words: int) -> str:
+        return " ".join(rng.choice(aliases + WORDS * 3) + rng.choice(["", ".", ","]) for _ in range(words))
+
+    return [
+        {"title": text(3), "company": "Acme", "location": "Remote", "description": text(180)}
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    profile = ats_service.build_resume_profile(
+        skills=["Python", "FastAPI", "Docker", "PostgreSQL", "React"],
+        experiences=["Built APIs and data pipelines for 6 years"],
+        experience_titles=["Senior Backend Engineer", "Software Engineer"],
+        education=["BS Computer Science"],
+        resume_text="Senior engineer with 6 years of experience.",
+    )
+    for count in (50, 200, 500):
+        jobs = make_jobs(count)
+        requirements = [ats_service.get_job_requirements(job) for job in jobs]
+        assert ats_service.score_resume_to_jobs(profile, jobs, requirements) == [
+            ats_service.score_resume_to_job(profile, job, req) for job, req in zip(jobs, requirements)
+        ]
+
+        runs = 20
+        loop = timeit.timeit(
+            lambda: [ats_service.score_resume_to_job(profile, job, req) for job, req in zip(jobs, requirements)],
+            number=runs,
+        )
+        batch = timeit.timeit(
+            lambda: ats_service.score_resume_to_jobs(profile, jobs, requirements), number=runs
+        )
+        print(
+            f"{count:4d} jobs: loop {loop / runs * 1000:8.2f} ms  "
+            f"batch {batch / runs * 1000:8.2f} ms  speedup {loop / batch:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
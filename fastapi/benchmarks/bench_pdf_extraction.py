@@ -0,0 +1,101 @@
+"""Compare PDF text extraction throughput: pypdf, PyMuPDF, page-parallel PyMuPDF.
+
+Uses the PDFs in the directory given as the first argument, or a synthetic
+corpus of resumes (1-3 pages, plus a few long CVs) when none is given.
+
+Run from the ``fastapi`` directory:
+
+    python -m benchmarks.bench_pdf_extraction [resume_dir]
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from app.core.config import settings
+from app.core.executors import BoundedExecutor
+from app.services.resume_processor import ResumeProcessor
+
+SECTION = (
+    "Senior Backend Engineer, Acme Corp (2019-2024)\n"
+    "Built FastAPI services in Python backed by PostgreSQL and Redis.\n"
+    "Ran Docker and Kubernetes deployments on AWS with CI/CD pipelines.\n"
+)
+
+
+def synthetic_corpus() -> list[bytes]:
+    corpus = []
+    for pages in [1] * 20 + [2] * 20 + [3] * 10 + [24] * 4:
+        doc = fitz.open()
+        for _ in range(pages):
+            page = doc.new_page()
+            # Two columns of text blocks per page.
+            for column, x in enumerate((50, 310)):
+                for row in range(6):
+                    page.insert_textbox(
+                        fitz.Rect(x, 60 + row * 120, x + 240, 170 + row * 120),
+                        SECTION, fontsize=8,
+                    )
+        corpus.append(doc.tobytes())
+        doc.close()
+    return corpus
+
+
+def load_corpus(directory: str) -> list[bytes]:
+    return [path.read_bytes() for path in sorted(Path(directory).glob("*.pdf"))]
+
+
+def run_serial(corpus: list[bytes], backend: str) -> None:
+    for content in corpus:
+        ResumeProcessor._extract_text_pdf(content, 0, None, backend)
+
+
+async def run_pool(corpus: list[bytes], pages_per_job: int) -> float:
+    settings.pdf_extractor = "pymupdf"
+    settings.pdf_pages_per_job = pages_per_job
+    executor = BoundedExecutor("bench", kind="process", max_workers=settings.extraction_max_workers)
+    processor = ResumeProcessor(executor)
+    try:
+        await processor.extract_text_from_file(corpus[0], "warmup.pdf")  # start the workers
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            processor.extract_text_from_file(content, "resume.pdf") for content in corpus
+        ))
+        return time.perf_counter() - started
+    finally:
+        executor.shutdown()
+
+
+def report(label: str, seconds: float, docs: int, pages: int) -> None:
+    print(f"{label:34s} {seconds * 1000:8.1f} ms  {docs / seconds:7.1f} docs/s  {pages / seconds:8.1f} pages/s")
+
+
+def main() -> None:
+    corpus = load_corpus(sys.argv[1]) if len(sys.argv) > 1 else synthetic_corpus()
+    if not corpus:
+        sys.exit("no PDFs found")
+    pages = sum(ResumeProcessor._extract_text_pdf(c, 0, 0)[1] for c in corpus)
+    print(f"{len(corpus)} resumes, {pages} pages, {settings.extraction_max_workers} workers\n")
+
+    for backend in ("pypdf", "pymupdf"):
+        started = time.perf_counter()
+        run_serial(corpus, backend)
+        report(f"{backend} (serial)", time.perf_counter() - started, len(corpus), pages)
+
+    report("pymupdf process pool", asyncio.run(run_pool(corpus, 0)), len(corpus), pages)
+    report("pymupdf process pool, page-parallel", asyncio.run(run_pool(corpus, 8)), len(corpus), pages)
+
+    # Page-parallel mode targets the latency of one long document.
+    longest = max(corpus, key=lambda c: ResumeProcessor._extract_text_pdf(c, 0, 0)[1])
+    long_pages = ResumeProcessor._extract_text_pdf(longest, 0, 0)[1]
+    print(f"\nlongest resume ({long_pages} pages):")
+    report("pymupdf process pool", asyncio.run(run_pool([longest], 0)), 1, long_pages)
+    report("pymupdf process pool, page-parallel", asyncio.run(run_pool([longest], 8)), 1, long_pages)
+
+
+if __name__ == "__main__":
+    main()
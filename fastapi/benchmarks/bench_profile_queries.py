@@ -0,0 +1,126 @@
+"""Compare chained OPTIONAL MATCH profile reads against COLLECT subqueries.
+
+Seeds throw-away resumes with growing skill/experience/education counts in
+the Neo4j configured in ``settings`` (NEO4J_URI etc.), reports the rows each
+form produces before aggregation and the mean latency, then deletes them.
+
+Run from the ``fastapi`` directory:
+
+    python -m benchmarks.bench_profile_queries
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+
+from neo4j import AsyncGraphDatabase
+
+from app.core.config import settings
+from app.services.resume_queries import profile_collections
+
+LEGACY_QUERY = """
+MATCH (r:Resume {id: $resume_id})
+OPTIONAL MATCH (r)-[:HAS_SKILL]->(s:Skill)
+OPTIONAL MATCH (r)-[:HAS_EXPERIENCE]->(e:Experience)
+OPTIONAL MATCH (r)-[:HAS_EDUCATION]->(ed:Education)
+RETURN collect(DISTINCT s.name) AS skills,
+       collect(DISTINCT e.description) AS experiences,
+       collect(DISTINCT e.title) AS experience_titles,
+       collect(DISTINCT ed.degree) AS education
+"""
+
+# Rows reaching the aggregation in the legacy form.
+LEGACY_ROWS = """
+MATCH (r:Resume {id: $resume_id})
+OPTIONAL MATCH (r)-[:HAS_SKILL]->(s:Skill)
+OPTIONAL MATCH (r)-[:HAS_EXPERIENCE]->(e:Experience)
+OPTIONAL MATCH (r)-[:HAS_EDUCATION]->(ed:Education)
+RETURN count(*) AS rows
+"""
+
+SUBQUERY_QUERY = f"""
+MATCH (r:Resume {{id: $resume_id}})
+RETURN {profile_collections("r")}
+"""
+
+# Rows the subqueries iterate: one per related node.
+SUBQUERY_ROWS = """
+MATCH (r:Resume {id: $resume_id})
+RETURN COUNT { (r)-[:HAS_SKILL]->(:Skill) }
+     + 2 * COUNT { (r)-[:HAS_EXPERIENCE]->(:Experience) }
+     + COUNT { (r)-[:HAS_EDUCATION]->(:Education) } AS rows
+"""
+
+SEED = """
+CREATE (r:Resume {id: $resume_id, name: 'bench', text: 'bench'})
+WITH r
+UNWIND range(1, $skills) AS i
+MERGE (s:Skill {name: 'bench-skill-' + i})
+CREATE (r)-[:HAS_SKILL]->(s)
+WITH DISTINCT r
+UNWIND range(1, $experiences) AS i
+CREATE (r)-[:HAS_EXPERIENCE]->(:Experience {title: 'Role ' + i, description: 'Did thing ' + i})
+WITH DISTINCT r
+UNWIND range(1, $education) AS i
+CREATE (r)-[:HAS_EDUCATION]->(:Education {degree: 'Degree ' + i})
+"""
+
+CLEANUP = """
+MATCH (r:Resume {id: $resume_id})
+OPTIONAL MATCH (r)-[:HAS_EXPERIENCE|HAS_EDUCATION]->(n)
+DETACH DELETE r, n
+"""
+
+SHAPES = ((10, 4, 2), (50, 10, 3), (80, 15, 4))
+
+
+async def _mean_ms(session, query: str, resume_id: str, runs: int) -> float:
+    await (await session.run(query, resume_id=resume_id)).consume()  # warm the plan cache
+    started = time.perf_counter()
+    for _ in range(runs):
+        await (await session.run(query, resume_id=resume_id)).consume()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+async def main() -> None:
+    driver = AsyncGraphDatabase.driver(
+        settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password)
+    )
+    try:
+        async with driver.session() as session:
+            for skills, experiences, education in SHAPES:
+                resume_id = f"bench-{uuid.uuid4()}"
+                await (await session.run(
+                    SEED, resume_id=resume_id, skills=skills,
+                    experiences=experiences, education=education,
+                )).consume()
+                try:
+                    legacy = await (await session.run(LEGACY_QUERY, resume_id=resume_id)).single()
+                    subquery = await (await session.run(SUBQUERY_QUERY, resume_id=resume_id)).single()
+                    assert {k: sorted(v) for k, v in legacy.items()} == {
+                        k: sorted(v) for k, v in subquery.items()
+                    }
+
+                    legacy_rows = (await (await session.run(LEGACY_ROWS, resume_id=resume_id)).single())["rows"]
+                    subquery_rows = (await (await session.run(SUBQUERY_ROWS, resume_id=resume_id)).single())["rows"]
+                    runs = 50
+                    legacy_ms = await _mean_ms(session, LEGACY_QUERY, resume_id, runs)
+                    subquery_ms = await _mean_ms(session, SUBQUERY_QUERY, resume_id, runs)
+                    print(
+                        f"{skills:3d} skills x {experiences:2d} exp x {education} edu: "
+                        f"rows {legacy_rows:6d} -> {subquery_rows:4d}  "
+                        f"legacy {legacy_ms:7.2f} ms  subquery {subquery_ms:7.2f} ms  "
+                        f"speedup {legacy_ms / subquery_ms:5.1f}x"
+                    )
+                finally:
+                    await (await session.run(CLEANUP, resume_id=resume_id)).consume()
+            await (await session.run(
+                "MATCH (s:Skill) WHERE s.name STARTS WITH 'bench-skill-' AND NOT (s)--() DELETE s"
+            )).consume()
+    finally:
+        await driver.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+"""Compare the compiled single-pass skill matcher against the per-alias loop.
+
+Run from the ``fastapi`` directory:
+
+    python -m benchmarks.bench_skill_matcher
+"""
+from __future__ import annotations
+
+import re
+import timeit
+
+from app.services.ats_service import SKILL_ALIASES, ats_service
+
+
+def legacy_extract_known_skills(text: str) -> list[str]:
+    haystack = text.lower()
+    matches: list[str] = []
+    for canonical, aliases in SKILL_ALIASES.items():
+        if any(
+            re.search(rf"(?<!\w){re.escape(alias.lower())}(?!\w)", haystack)
+            for alias in aliases
+        ):
+            matches.append(canonical)
+    return sorted(set(matches))
+
+
+JOB_DESCRIPTION = (
+    "We are hiring a Senior Backend Engineer to build APIs in Python and FastAPI. "
+    "Requirements: 5+ years with PostgreSQL, Redis, Docker and Kubernetes on AWS. "
+    "Preferred: experience with React.js, TypeScript, GraphQL and CI/CD pipelines. "
+    "You will own services end to end, mentor engineers and collaborate with "
+    "data science on machine learning features (PyTorch, pandas, numpy). "
+) * 6
+
+
+def main() -> None:
+    sentences = [s for s in re.split(r"[\n\.\;\-]+", JOB_DESCRIPTION.lower()) if s.strip()]
+    assert ats_service.extract_known_skills(JOB_DESCRIPTION) == legacy_extract_known_skills(JOB_DESCRIPTION)
+
+    for label, texts in (("full description", [JOB_DESCRIPTION]), ("per sentence", sentences)):
+        runs = 200
+        legacy = timeit.timeit(lambda: [legacy_extract_known_skills(t) for t in texts], number=runs)
+        compiled = timeit.timeit(lambda: [ats_service.extract_known_skills(t) for t in texts], number=runs)
+        print(
+            f"{label:>16}: legacy {legacy / runs * 1000:8.3f} ms  "
+            f"compiled {compiled / runs * 1000:8.3f} ms  "
+            f"speedup {legacy / compiled:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
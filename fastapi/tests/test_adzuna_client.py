@@ -0,0 +1,165 @@
+import asyncio
+import gc
+
+import httpx
+import pytest
+
+from app.services.job_sources import AdzunaClient
+
+
+class PagedAdzuna(AdzunaClient):
+    def __init__(self, pages, delay=0.01, failing_pages=()):
+        super().__init__("id", "key")
+        self.pages = pages
+        self.delay = delay
+        self.failing_pages = set(failing_pages)
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _fetch_page(self, keyword, location, page, results_per_page, category):
+        self.requested.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later pages answer first to exercise out-of-order completion.
+            await asyncio.sleep(self.delay * (len(self.pages) - page + 1))
+            if page in self.failing_pages:
+                request = httpx.Request("GET", f"https://api.adzuna.com/{page}")
+                raise httpx.HTTPStatusError(
+                    "503 Service Unavailable", request=request, response=httpx.Response(503, request=request)
+                )
+            return self.pages[page - 1] if page <= len(self.pages) else []
+        finally:
+            self.in_flight -= 1
+
+
+def _page(start, count=3):
+    return [{"apply_url": f"https://example.com/{i}"} for i in range(start, start + count)]
+
+
+@pytest.mark.asyncio
+async def test_paginated_fetch_dedupes_in_page_order_with_bounded_concurrency():
+    client = PagedAdzuna([_page(0), _page(2), _page(5), _page(8)])
+
+    jobs = await client.fetch_jobs_paginated(limit=100, concurrency=2, max_pages=10)
+    await client.close()
+
+    assert [job["apply_url"] for job in jobs] == [f"https://example.com/{i}" for i in range(11)]
+    assert client.max_in_flight == 2
+    assert max(client.requested) <= 6  # stopped shortly after the first empty page
+
+
+@pytest.mark.asyncio
+async def test_paginated_fetch_stops_issuing_requests_at_limit():
+    client = PagedAdzuna([_page(i * 3) for i in range(20)], delay=0.001)
+
+    jobs = await client.fetch_jobs_paginated(limit=5, concurrency=1, max_pages=20)
+    await client.close()
+
+    assert len(jobs) == 5
+    assert client.requested == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_every_page_request_takes_a_rate_limit_token(monkeypatch):
+    from app.services.job_sources import rate_limit
+
+    class CountingLimiter(rate_limit.SourceLimiter):
+        tokens = 0
+
+        async def throttle(self):
+            CountingLimiter.tokens += 1
+
+    monkeypatch.setattr(rate_limit, "_limiters", {"adzuna": CountingLimiter(rate_limit.SourcePolicy())})
+
+    def handler(request):
+        page = int(request.url.path.rsplit("/", 1)[-1])
+        results = [
+            {"redirect_url": f"https://adzuna.example/{page}-{i}", "title": "Engineer"}
+            for i in range(2)
+        ] if page <= 3 else []
+        return httpx.Response(200, json={"results": results})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+        client = AdzunaClient("id", "key", session=session)
+        jobs = await client.fetch_jobs_paginated(limit=100, concurrency=1, max_pages=10)
+
+    assert len(jobs) == 6
+    assert CountingLimiter.tokens == 4  # three pages of results and the empty fourth
+
+
+@pytest.mark.asyncio
+async def test_failing_middle_page_raises_instead_of_truncating():
+    client = PagedAdzuna([_page(0), _page(3), _page(6)], delay=0.001, failing_pages={2})
+
+    pages = []
+    with pytest.raises(httpx.HTTPStatusError):
+        async for page in client.iter_pages(limit=100, concurrency=1, max_pages=10):
+            pages.append(page)
+
+    assert pages == [_page(0)]
+
+
+@pytest.mark.asyncio
+async def test_ingest_reports_adzuna_as_failed_on_a_page_error(monkeypatch):
+    from app.services import job_ingest_service
+    from app.services.job_sources import rate_limit
+
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    client = PagedAdzuna([_page(0), _page(3), _page(6)], delay=0.001, failing_pages={2})
+
+    async def upsert(db, jobs, chunk_size=None):
+        return [{"created": len(jobs), "updated": 0, "merged": 0}]
+
+    monkeypatch.setattr(job_ingest_service, "_upsert_jobs", upsert)
+    results = await job_ingest_service.ingest_all_sources(
+        object(), limit_per_source=100, sources=["adzuna"], open_source=lambda name: client
+    )
+
+    assert "503" in results["sources"]["adzuna"]["error"]
+
+
+async def _first_error(pages):
+    # Only the type escapes, so no traceback keeps the generator's tasks alive.
+    try:
+        async for _ in pages:
+            pass
+    except Exception as exc:
+        return type(exc)
+    return None
+
+
+@pytest.mark.asyncio
+async def test_failed_sibling_pages_have_their_exceptions_retrieved():
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    previous = loop.get_exception_handler()
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+    # With no delay every page finishes in the same wait, so both failures
+    # land in one ``done`` set.
+    client = PagedAdzuna([_page(0), _page(3), _page(6)], delay=0, failing_pages={1, 2})
+    try:
+        assert await _first_error(client.iter_pages(limit=100, concurrency=3, max_pages=3)) is httpx.HTTPStatusError
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(previous)
+        await client.close()
+
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+async def test_closing_the_page_iterator_awaits_cancelled_requests():
+    # Page 3 is requested once page 2 answers and is still running when page 1
+    # is yielded.
+    client = PagedAdzuna([_page(i * 3) for i in range(6)], delay=0.01)
+
+    pages = client.iter_pages(limit=100, concurrency=2, max_pages=6)
+    await pages.__anext__()
+    await pages.aclose()
+    in_flight = client.in_flight
+    await client.close()
+
+    assert in_flight == 0
@@ -0,0 +1,165 @@
+import random
+import re
+
+import pytest
+
+from app.services.ats_service import SKILL_ALIASES, ATSScoringService, ats_service
+
+
+def legacy_extract_known_skills(text: str) -> list[str]:
+    haystack = text.lower()
+    matches: list[str] = []
+    for canonical, aliases in SKILL_ALIASES.items():
+        if any(
+            re.search(rf"(?<!\w){re.escape(alias.lower())}(?!\w)", haystack)
+            for alias in aliases
+        ):
+            matches.append(canonical)
+    return sorted(set(matches))
+
+
+SAMPLE_TEXTS = [
+    "Senior Python engineer with FastAPI, Docker and k8s. Required: AWS, PostgreSQL.",
+    "Frontend role: React.js, Next.js, TypeScript and Tailwind. Bonus: GraphQL.",
+    "Experience with tensorflow/keras, PyTorch and stable baselines3 (PPO).",
+    "We use C++, C# and .NET; Go (golang) is a plus. CI/CD via GitHub Actions.",
+    "Google Cloud Platform or Amazon Web Services; RESTful API design; unit testing with pytest.",
+    "Machine-learning: logistic regression, random forests, k-NN and SVMs.",
+    "nothing relevant here except javascript_is_not_a_word and gopher",
+]
+
+
+def test_compiled_matcher_matches_legacy_on_samples():
+    for text in SAMPLE_TEXTS:
+        assert ats_service.extract_known_skills(text) == legacy_extract_known_skills(text)
+
+
+def test_compiled_matcher_matches_legacy_on_random_alias_soup():
+    rng = random.Random(7)
+    aliases = [alias for values in SKILL_ALIASES.values() for alias in values]
+    separators = [" ", "/", ".", "-", ", ", "_", "", "(", ")", "\n", "+"]
+    for _ in range(300):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            parts.append(rng.choice(aliases).upper() if rng.random() < 0.2 else rng.choice(aliases))
+            parts.append(rng.choice(separators))
+        text = "".join(parts)
+        assert ats_service.extract_known_skills(text) == legacy_extract_known_skills(text), text
+
+
+def test_reload_skill_aliases_rebuilds_matcher():
+    service = ATSScoringService({"elixir": ["elixir", "phoenix framework"]})
+    assert service.extract_known_skills("Phoenix Framework and Python") == ["elixir"]
+
+    service.reload_skill_aliases()
+    assert service.extract_known_skills("Phoenix Framework and Python") == ["python"]
+
+
+JOB = {
+    "title": "Senior Backend Engineer",
+    "company": "Acme",
+    "location": "Remote",
+    "description": "Requirements: Python, FastAPI and PostgreSQL. Nice to have: Docker. 5+ years.",
+}
+
+
+def test_job_requirements_are_cached_by_content_hash(monkeypatch):
+    service = ATSScoringService(requirements_cache_size=8)
+    calls = []
+    original = service.extract_job_requirements
+    monkeypatch.setattr(
+        service, "extract_job_requirements", lambda job: calls.append(job) or original(job)
+    )
+
+    first = service.get_job_requirements(dict(JOB))
+    second = service.get_job_requirements(dict(JOB))
+    assert first is second
+    assert len(calls) == 1
+    assert first.as_dict() == original(JOB)
+
+    service.get_job_requirements({**JOB, "description": JOB["description"] + " Kubernetes."})
+    assert len(calls) == 2
+
+
+def test_job_requirements_load_from_persisted_node_properties(monkeypatch):
+    persisted = {**JOB, **ats_service.get_job_requirements(JOB).to_node_properties()}
+    service = ATSScoringService(requirements_cache_size=8)
+    monkeypatch.setattr(service, "extract_job_requirements", lambda job: pytest.fail("re-parsed"))
+
+    assert service.get_job_requirements(persisted).required_skills == ("fastapi", "postgresql", "python")
+
+    stale = {**persisted, "description": "Requirements: Rust."}
+    monkeypatch.undo()
+    assert service.get_job_requirements(stale).required_skills == ("rust",)
+
+
+def test_persisted_requirements_are_ignored_after_an_alias_reload():
+    service = ATSScoringService(requirements_cache_size=8)
+    job = {**JOB, "description": JOB["description"] + " Elixir."}
+    persisted = {**job, **service.get_job_requirements(job).to_node_properties()}
+
+    service.reload_skill_aliases({**SKILL_ALIASES, "elixir": ["elixir"]})
+
+    assert "elixir" in service.get_job_requirements(persisted).all_skills
+    assert not persisted["ats_requirements_hash"].startswith(service.skill_aliases_version)
+
+
+def _sample_jobs():
+    descriptions = [
+        "Requirements: Python, FastAPI, PostgreSQL. Preferred: Docker, Kubernetes. 5+ years. Bachelor's degree.",
+        "Senior React.js engineer. Must have TypeScript and GraphQL. Nice to have: AWS. You will own the UI.",
+        "Junior data analyst. Required: SQL and pandas. Bonus: machine learning. Master's preferred.",
+        "Staff ML engineer in this role: PyTorch, TensorFlow, reinforcement learning (PPO). PhD required. 8 years.",
+        "",
+        "Director of Engineering, head of platform. Requirements: Go, Rust, Terraform. 10+ yrs.",
+    ]
+    titles = ["Backend Engineer", "Senior Frontend Developer", "Junior Data Analyst",
+              "Staff Machine Learning Engineer", "Intern", "Director of Engineering"]
+    return [
+        {"title": title, "company": "Acme", "location": "Remote", "description": description}
+        for title, description in zip(titles, descriptions)
+    ]
+
+
+@pytest.mark.parametrize("profile_kwargs", [
+    dict(
+        skills=["Python", "FastAPI", "Docker", "SQL"],
+        experiences=["Built APIs with Python and PostgreSQL for 6 years"],
+        experience_titles=["Senior Backend Engineer"],
+        education=["BS Computer Science"],
+        resume_text="Senior engineer, 6 years of experience shipping APIs.",
+    ),
+    dict(skills=[], experiences=[], experience_titles=[], education=[], resume_text=""),
+    dict(
+        skills=["PyTorch", "pandas"],
+        experiences=["Research on neural networks"],
+        experience_titles=["ML Intern", "Data Analyst"],
+        education=["PhD Machine Learning"],
+        resume_text="Published work on deep learning",
+    ),
+])
+def test_batch_scoring_matches_per_job_scorer(profile_kwargs):
+    profile = ats_service.build_resume_profile(**profile_kwargs)
+    jobs = _sample_jobs()
+
+    batch = ats_service.score_resume_to_jobs(profile, jobs)
+
+    assert batch == [ats_service.score_resume_to_job(profile, job) for job in jobs]
+    assert ats_service.score_resume_to_jobs(profile, []) == []
+
+
+@pytest.mark.parametrize("top_k", [1, 2, 4, 10])
+def test_rank_resume_to_jobs_matches_sorted_batch(top_k):
+    profile = ats_service.build_resume_profile(
+        skills=["Python", "SQL", "React"],
+        experiences=["Analytics dashboards"],
+        experience_titles=["Data Analyst"],
+        education=["BS Statistics"],
+        resume_text="3 years of analytics work",
+    )
+    jobs = _sample_jobs() * 2  # duplicates exercise tie ordering
+
+    batch = ats_service.score_resume_to_jobs(profile, jobs)
+    expected = sorted(enumerate(batch), key=lambda pair: pair[1]["ats_score"], reverse=True)[:top_k]
+
+    assert ats_service.rank_resume_to_jobs(profile, jobs, top_k) == expected
@@ -0,0 +1,70 @@
+import asyncio
+import io
+import time
+
+import pytest
+from docx import Document
+
+from app.core.executors import BoundedExecutor, ExecutorTimeoutError
+from app.services.resume_processor import ResumeProcessor
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_off_the_loop_and_queue_beyond_pool_size():
+    executor = BoundedExecutor("test", max_workers=2, timeout=5)
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    try:
+        results = await asyncio.gather(*(executor.run(_sleep, 0.1) for _ in range(4)))
+    finally:
+        beat.cancel()
+        executor.shutdown()
+
+    assert results == [0.1] * 4
+    assert ticks >= 10  # the event loop kept running meanwhile
+    stats = executor.stats()
+    assert stats["completed"] == 4
+    assert stats["running"] == 0 and stats["waiting"] == 0
+    assert stats["queue_wait_ms"]["max"] >= 90  # two jobs waited for a slot
+
+
+@pytest.mark.asyncio
+async def test_timeout_keeps_the_slot_until_the_job_finishes():
+    executor = BoundedExecutor("test", max_workers=1, timeout=0.05)
+    try:
+        with pytest.raises(ExecutorTimeoutError):
+            await executor.run(_sleep, 0.2)
+        assert executor.stats()["running"] == 1
+        assert await executor.run(_sleep, 0.0, timeout=1) == 0.0
+        assert executor.stats()["timeouts"] == 1
+        assert executor.stats()["queue_wait_ms"]["last"] >= 100
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_resume_processor_parses_docx_on_the_pool():
+    document = Document()
+    document.add_paragraph("Jane Doe - Backend Engineer")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    executor = BoundedExecutor("test", max_workers=1)
+    try:
+        text = await ResumeProcessor(executor).extract_text_from_file(buffer.getvalue(), "cv.docx")
+    finally:
+        executor.shutdown()
+
+    assert text == "Jane Doe - Backend Engineer"
+    assert executor.stats()["completed"] == 1
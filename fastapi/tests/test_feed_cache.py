@@ -0,0 +1,119 @@
+import httpx
+import pytest
+
+from app.services.job_sources import RemotiveClient, WeWorkRemotelyClient
+from app.services.job_sources import rate_limit
+from app.services.job_sources.feed_cache import FeedCache
+
+REMOTIVE_FEED = {
+    "jobs": [
+        {"id": 1, "title": "Backend Engineer", "company_name": "Acme", "url": "https://remotive.com/1",
+         "category": "Software Development", "description": "Python"},
+        {"id": 2, "title": "Designer", "company_name": "Beta", "url": "https://remotive.com/2",
+         "category": "Design", "description": "Figma"},
+    ]
+}
+
+WWR_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss><channel>
+<item><title>Acme: Backend Engineer</title><link>https://weworkremotely.com/1</link>
+<description>Python</description></item>
+<item><title>Beta: Designer</title><link>https://weworkremotely.com/2</link>
+<description>Figma</description></item>
+</channel></rss>"""
+
+
+@pytest.fixture(autouse=True)
+def unthrottled(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    for name in ("remotive", "weworkremotely"):
+        monkeypatch.setitem(rate_limit.SOURCE_POLICIES, name, rate_limit.SourcePolicy())
+
+
+def _transport(body, etag='"v1"', content_type="application/json"):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        if isinstance(body, dict):
+            return httpx.Response(200, json=body, headers={"ETag": etag})
+        return httpx.Response(200, content=body, headers={"ETag": etag, "Content-Type": content_type})
+
+    return httpx.MockTransport(handler), requests
+
+
+@pytest.mark.asyncio
+async def test_remotive_serves_fresh_cache_and_categories_without_requests():
+    transport, requests = _transport(REMOTIVE_FEED)
+    async with httpx.AsyncClient(transport=transport) as session:
+        client = RemotiveClient(session=session, cache=FeedCache(ttl=60, maxsize=8))
+
+        jobs = await client.fetch_jobs(limit=1)
+        again = await client.fetch_jobs(limit=10)
+        categories = await client.get_categories()
+
+    assert len(requests) == 1
+    assert [job["title"] for job in jobs] == ["Backend Engineer"]
+    assert len(again) == 2
+    assert categories == ["Design", "Software Development"]
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_with_etag():
+    transport, requests = _transport(WWR_FEED, content_type="application/rss+xml")
+    cache = FeedCache(ttl=0, maxsize=8)
+    async with httpx.AsyncClient(transport=transport) as session:
+        client = WeWorkRemotelyClient(session=session, cache=cache)
+
+        first = await client.fetch_jobs(category="programming")
+        second = await client.fetch_jobs(category="programming")
+
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert cache.not_modified == 1
+    assert first == second
+    assert [job["company"] for job in second] == ["Acme", "Beta"]
+
+
+@pytest.mark.asyncio
+async def test_wwr_limited_read_stops_the_download_and_skips_the_cache():
+    items = b"".join(
+        b"<item><title>Co%d: Role</title><link>https://weworkremotely.com/%d</link></item>" % (i, i)
+        for i in range(50)
+    )
+    body = b"<rss><channel>" + items + b"</channel></rss>"
+    chunks = [body[i:i + 64] for i in range(0, len(body), 64)]
+    requests = []
+    sent = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+
+        async def stream():
+            for chunk in chunks:
+                sent.append(chunk)
+                yield chunk
+
+        return httpx.Response(200, content=stream(), headers={"ETag": '"v1"'})
+
+    cache = FeedCache(ttl=0, maxsize=8)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+        client = WeWorkRemotelyClient(session=session, cache=cache)
+        jobs = await client.fetch_jobs(limit=3)
+        limited_chunks = len(sent)
+        full = await client.fetch_jobs(limit=100)
+        refreshed = await client.fetch_jobs(limit=100)
+
+    assert [job["apply_url"] for job in jobs] == [f"https://weworkremotely.com/{i}" for i in range(3)]
+    assert limited_chunks < len(chunks)
+    # The partial parse was not cached, so the next read is unconditional.
+    assert "If-None-Match" not in requests[1].headers
+    assert len(full) == 50
+    assert requests[2].headers["If-None-Match"] == '"v1"'
+    assert cache.not_modified == 1
+    assert refreshed == full
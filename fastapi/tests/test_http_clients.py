@@ -0,0 +1,30 @@
+import httpx
+import pytest
+
+from app.core.http import HTTPClientRegistry
+from app.services.job_sources import RemotiveClient
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_client_until_closed():
+    registry = HTTPClientRegistry()
+    client = registry.get()
+    assert registry.get() is client
+
+    await registry.close()
+    assert client.is_closed
+    assert registry.get() is not client
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_source_client_leaves_injected_session_open():
+    session = httpx.AsyncClient()
+    client = RemotiveClient(session=session)
+    await client.close()
+    assert not session.is_closed
+    await session.aclose()
+
+    owned = RemotiveClient()
+    await owned.close()
+    assert owned.session.is_closed
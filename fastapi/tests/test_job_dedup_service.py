@@ -0,0 +1,80 @@
+import random
+
+from app.services.job_dedup_service import (
+    JobDedupService,
+    hamming_distance,
+    job_fingerprint,
+    simhash64,
+)
+
+WORDS = (
+    "python api design distributed systems team customers build scale data "
+    "services cloud reliability product engineers ownership mentor review "
+    "testing deploy monitor latency storage queue async database schema"
+).split()
+
+
+def _description(seed, length=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def test_fingerprint_normalizes_title_company_and_location():
+    a = {"title": "Senior Engineer (Remote)", "company": "Acme, Inc.", "location": "Remote, USA"}
+    b = {"title": "senior engineer", "company": "ACME", "location": "Anywhere"}
+    c = {"title": "Senior Engineer", "company": "Acme", "location": "Austin, TX"}
+
+    assert job_fingerprint(a) == job_fingerprint(b)
+    assert job_fingerprint(a) != job_fingerprint(c)
+    assert job_fingerprint({"title": "Unknown"}) is None
+
+
+def test_simhash_separates_edits_from_different_descriptions():
+    base = _description(1)
+    edited = base.replace("python", "golang", 2) + " apply now"
+    other = _description(2)
+
+    assert simhash64("too short to hash") is None
+    assert -(1 << 63) <= simhash64(base) < (1 << 63)
+    assert hamming_distance(simhash64(base), simhash64(edited)) <= 6
+    assert hamming_distance(simhash64(base), simhash64(other)) > 6
+
+
+def test_partition_keeps_same_title_roles_with_different_descriptions_apart():
+    service = JobDedupService(max_distance=6)
+    fp = job_fingerprint({"title": "Engineer", "company": "Acme", "location": "Remote"})
+    rows = [
+        {"apply_url": "u1", "dedup_fingerprint": fp, "simhash": simhash64(_description(1)), "source": "a"},
+        {"apply_url": "u2", "dedup_fingerprint": fp, "simhash": simhash64(_description(2)), "source": "b"},
+        {"apply_url": "u3", "dedup_fingerprint": fp, "simhash": simhash64(_description(1)), "source": "c"},
+    ]
+
+    upserts, aliases = service.partition(rows, {})
+
+    assert [row["apply_url"] for row in upserts] == ["u1", "u2"]
+    assert aliases == [{"canonical_url": "u1", "apply_url": "u3", "source": "c"}]
+
+
+def test_partition_never_folds_postings_from_the_same_source():
+    service = JobDedupService(max_distance=6)
+    fp = job_fingerprint({"title": "Engineer", "company": "Acme", "location": "Austin, TX"})
+    # Adzuna snippets are too short for a SimHash.
+    rows = [
+        {"apply_url": "a1", "dedup_fingerprint": fp, "simhash": None, "description_hash": "h1", "source": "adzuna"},
+        {"apply_url": "a2", "dedup_fingerprint": fp, "simhash": None, "description_hash": "h1", "source": "adzuna"},
+    ]
+    stored = {fp: [{"apply_url": "a0", "simhash": None, "description_hash": "h1",
+                    "source": "remotive", "alt_sources": ["adzuna"]}]}
+
+    upserts, aliases = service.partition(rows, stored)
+
+    assert [row["apply_url"] for row in upserts] == ["a1", "a2"]
+    assert aliases == []
+
+
+def test_missing_simhash_only_matches_an_identical_description():
+    service = JobDedupService(max_distance=6)
+
+    assert service.is_near_duplicate({"simhash": None, "description_hash": "h1"}, {"simhash": 1, "description_hash": "h1"})
+    assert not service.is_near_duplicate({"simhash": None, "description_hash": "h1"}, {"simhash": None, "description_hash": "h2"})
+    assert not service.is_near_duplicate({"simhash": None, "description_hash": None}, {"simhash": None, "description_hash": None})
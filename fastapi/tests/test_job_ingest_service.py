@@ -0,0 +1,284 @@
+import asyncio
+
+import pytest
+
+from app.services import job_ingest_service
+from app.services.job_ingest_service import _upsert_jobs
+from app.services.job_sources import JobSource
+
+
+class DummySummary:
+    def __init__(self, nodes_created):
+        self.counters = type("Counters", (), {"nodes_created": nodes_created})()
+
+
+class DummyResult:
+    def __init__(self, nodes_created=0, records=()):
+        self._summary = DummySummary(nodes_created)
+        self._records = list(records)
+
+    async def consume(self):
+        return self._summary
+
+    async def data(self):
+        return self._records
+
+
+class DummyTx:
+    def __init__(self, db):
+        self.db = db
+
+    async def run(self, query, **kwargs):
+        if "fingerprints" in kwargs:
+            return DummyResult(records=[
+                {
+                    "fp": node["dedup_fingerprint"],
+                    "apply_url": url,
+                    "simhash": node.get("simhash"),
+                    "description_hash": node.get("description_hash"),
+                    "source": node.get("source"),
+                    "alt_sources": node.get("alt_sources", []),
+                    "alt_apply_urls": node.get("alt_apply_urls", []),
+                }
+                for url, node in self.db.nodes.items()
+                if node.get("dedup_fingerprint") in kwargs["fingerprints"]
+            ])
+        if "aliases" in kwargs:
+            self.db.aliases.extend(kwargs["aliases"])
+            for alias in kwargs["aliases"]:
+                node = self.db.nodes[alias["canonical_url"]]
+                urls = node.setdefault("alt_apply_urls", [])
+                if alias["apply_url"] not in urls:
+                    urls.append(alias["apply_url"])
+                sources = node.setdefault("alt_sources", [])
+                if alias["source"] != node.get("source") and alias["source"] not in sources:
+                    sources.append(alias["source"])
+            return DummyResult()
+        if "REQUIRES_SKILL" in query:
+            self.db.skill_links.extend(kwargs["rows"])
+            return DummyResult()
+        rows = kwargs["rows"]
+        self.db.statements.append((query, rows))
+        created = 0
+        for row in rows:
+            if row["apply_url"] not in self.db.nodes:
+                created += 1
+            self.db.nodes[row["apply_url"]] = {
+                **row,
+                **{
+                    key: self.db.nodes.get(row["apply_url"], {}).get(key, [])
+                    for key in ("alt_sources", "alt_apply_urls")
+                },
+            }
+        return DummyResult(created)
+
+
+class DummyDB:
+    def __init__(self, existing=()):
+        # Pre-existing nodes carry no dedup properties, like rows stored before dedup.
+        self.nodes = {url: {} for url in existing}
+        self.aliases = []
+        self.skill_links = []
+        self.statements = []
+        self.transactions = 0
+
+    async def execute_write(self, work, *args):
+        self.transactions += 1
+        return await work(DummyTx(self), *args)
+
+
+def _job(index):
+    return {
+        "apply_url": f"https://example.com/jobs/{index}",
+        "title": f"Engineer {index}",
+        "description": "Required: Python",
+        "source": "remotive",
+    }
+
+
+@pytest.mark.asyncio
+async def test_upsert_jobs_chunks_rows_and_counts_created_and_updated():
+    db = DummyDB(existing={"https://example.com/jobs/1"})
+    jobs = [_job(i) for i in range(5)] + [{"title": "No URL"}]
+
+    chunks = await _upsert_jobs(db, jobs, chunk_size=2)
+
+    assert chunks == [
+        {"created": 1, "updated": 1, "merged": 0},
+        {"created": 2, "updated": 0, "merged": 0},
+        {"created": 1, "updated": 0, "merged": 0},
+    ]
+    assert db.transactions == 3
+    query, rows = db.statements[0]
+    assert query.lstrip().startswith("UNWIND $rows AS row")
+    assert "j.sort_ts = coalesce(j.sort_ts, timestamp())" in query  # refreshes keep their cursor position
+    assert rows[0]["ats_requirements_hash"]
+    assert rows[0]["dedup_fingerprint"]
+    assert [link["apply_url"] for link in db.skill_links] == [f"https://example.com/jobs/{i}" for i in range(5)]
+    assert db.skill_links[0]["skills"] == [{"name": "python", "kind": "required"}]
+    assert db.skill_links[0]["skills_hash"] == rows[0]["ats_requirements_hash"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_jobs_merges_cross_source_duplicates_into_canonical_node():
+    def posting(url, source, title="Senior Backend Engineer (Remote)", company="Acme Inc."):
+        return {
+            "apply_url": url,
+            "title": title,
+            "company": company,
+            "location": "Remote - Anywhere",
+            "description": "Build APIs in Python.",
+            "source": source,
+        }
+
+    db = DummyDB()
+    first = await _upsert_jobs(db, [
+        posting("https://adzuna.example/1", "adzuna"),
+        posting("https://remotive.example/1", "remotive", title="Senior Backend Engineer", company="ACME"),
+    ])
+    second = await _upsert_jobs(db, [
+        posting("https://wwr.example/1", "weworkremotely"),
+        posting("https://adzuna.example/1", "adzuna"),
+        posting("https://adzuna.example/2", "adzuna", title="Frontend Engineer"),
+    ])
+
+    assert first == [{"created": 1, "updated": 0, "merged": 1}]
+    assert second == [{"created": 1, "updated": 1, "merged": 1}]
+    assert set(db.nodes) == {"https://adzuna.example/1", "https://adzuna.example/2"}
+    assert [(a["canonical_url"], a["apply_url"]) for a in db.aliases] == [
+        ("https://adzuna.example/1", "https://remotive.example/1"),
+        ("https://adzuna.example/1", "https://wwr.example/1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_folded_posting_stays_an_alias_across_refreshes():
+    def posting(url, source):
+        return {
+            "apply_url": url,
+            "title": "Senior Backend Engineer",
+            "company": "Acme",
+            "location": "Remote",
+            "description": "Build APIs in Python.",
+            "source": source,
+        }
+
+    db = DummyDB()
+    first = await _upsert_jobs(db, [
+        posting("https://adzuna.example/1", "adzuna"),
+        posting("https://remotive.example/1", "remotive"),
+    ])
+    second = await _upsert_jobs(db, [posting("https://remotive.example/1", "remotive")])
+    third = await _upsert_jobs(db, [posting("https://remotive.example/1", "remotive")])
+
+    assert first == [{"created": 1, "updated": 0, "merged": 1}]
+    assert second == third == [{"created": 0, "updated": 0, "merged": 1}]
+    assert set(db.nodes) == {"https://adzuna.example/1"}
+    assert db.nodes["https://adzuna.example/1"]["alt_apply_urls"] == ["https://remotive.example/1"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_jobs_keeps_same_board_openings_with_matching_title_apart():
+    def adzuna(url, description):
+        return {
+            "apply_url": url,
+            "title": "Backend Engineer",
+            "company": "Acme",
+            "location": "Austin, TX",
+            "description": description,
+            "source": "adzuna",
+        }
+
+    db = DummyDB()
+    chunks = await _upsert_jobs(db, [
+        adzuna("https://adzuna.example/1", "Build payment APIs in Python..."),
+        adzuna("https://adzuna.example/2", "Own the search indexing pipeline..."),
+    ])
+    again = await _upsert_jobs(db, [adzuna("https://adzuna.example/3", "Build payment APIs in Python...")])
+
+    assert chunks == [{"created": 2, "updated": 0, "merged": 0}]
+    assert again == [{"created": 1, "updated": 0, "merged": 0}]
+    assert db.aliases == []
+
+
+class FakeSource:
+    def __init__(self, name, pages, delay=0.0, error=None):
+        self.name = name
+        self.pages = pages
+        self.delay = delay
+        self.error = error
+        self.closed = False
+
+    def is_configured(self):
+        return True
+
+    async def iter_pages(self, keyword="", location="", category=None, limit=100):
+        for page in self.pages:
+            await asyncio.sleep(self.delay)
+            yield page[:limit]
+        if self.error:
+            raise self.error
+
+    async def close(self):
+        self.closed = True
+
+
+def test_clients_implement_job_source_protocol():
+    for name in job_ingest_service.JOB_SOURCE_NAMES:
+        assert isinstance(job_ingest_service.open_job_source(name), JobSource)
+
+
+@pytest.mark.asyncio
+async def test_ingest_sums_created_across_chunks(monkeypatch):
+    source = FakeSource("remotive", [[_job(i) for i in range(4)], [_job(i) for i in range(4, 7)]])
+    monkeypatch.setattr(job_ingest_service, "open_job_source", lambda name: source)
+    monkeypatch.setattr(job_ingest_service.settings, "job_upsert_chunk_size", 3)
+    db = DummyDB(existing={"https://example.com/jobs/0"})
+
+    created = await job_ingest_service.ingest_from_remotive(db, limit=7)
+
+    assert created == 6
+    assert db.transactions == 3
+    assert source.closed
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_sources_isolates_slow_and_failing_sources(monkeypatch):
+    from app.services.job_sources import rate_limit
+
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    monkeypatch.setitem(
+        rate_limit.SOURCE_POLICIES, "slow", rate_limit.SourcePolicy(timeout=0.05)
+    )
+    monkeypatch.setattr(job_ingest_service.settings, "job_upsert_chunk_size", 2)
+
+    fake_sources = {
+        "fast": FakeSource("fast", [[_job(i) for i in range(3)], [_job(i) for i in range(3, 5)]]),
+        "slow": FakeSource("slow", [[_job(100)]], delay=1),
+        "broken": FakeSource("broken", [[_job(200)]], error=RuntimeError("upstream 500")),
+    }
+
+    db = DummyDB()
+    results = await job_ingest_service.ingest_all_sources(
+        db, limit_per_source=5, sources=fake_sources, open_source=fake_sources.__getitem__
+    )
+
+    assert results["by_source"] == {"fast": 5, "slow": 0, "broken": 1}
+    assert results["sources"]["fast"]["fetched"] == 5
+    assert results["sources"]["fast"]["error"] is None
+    assert "timed out" in results["sources"]["slow"]["error"]
+    assert results["sources"]["broken"]["error"] == "upstream 500"
+    assert db.transactions == 4
+    assert results["elapsed_ms"] < 1000
+    assert all(source.closed for source in fake_sources.values())
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_acquisitions():
+    from app.services.job_sources.rate_limit import RateLimiter
+
+    limiter = RateLimiter(requests_per_minute=60 * 20)  # one slot every 50 ms
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+    assert loop.time() - started >= 0.09
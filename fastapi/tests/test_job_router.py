@@ -0,0 +1,189 @@
+import asyncio
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.core.auth import get_current_user
+from app.main import app
+from app.routers import job as job_router
+from app.services.job_search_service import JOB_PUBLIC_FIELDS
+
+client = TestClient(app)
+
+
+class FakeSource:
+    def __init__(self, pages, error=None):
+        self.pages = pages
+        self.error = error
+        self.closed = False
+
+    def is_configured(self):
+        return True
+
+    async def iter_pages(self, keyword="", location="", category=None, limit=100, **kwargs):
+        for page in self.pages:
+            await asyncio.sleep(0)
+            yield page
+        if self.error:
+            raise self.error
+
+    async def close(self):
+        self.closed = True
+
+
+def _jobs(start, count):
+    return [{"title": f"Job {i}", "apply_url": f"https://example.com/{i}"} for i in range(start, start + count)]
+
+
+def _stream(monkeypatch, source):
+    monkeypatch.setattr(job_router, "open_job_source", lambda name: source)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    try:
+        response = client.get("/jobs/fetch-live/remotive/stream?limit=10")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+    return response
+
+
+def test_fetch_live_stream_writes_one_posting_per_line(monkeypatch):
+    source = FakeSource([_jobs(0, 2), _jobs(2, 1)])
+
+    response = _stream(monkeypatch, source)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line.get("apply_url") for line in lines[:-1]] == [f"https://example.com/{i}" for i in range(3)]
+    assert lines[-1] == {"done": True, "count": 3}
+    assert source.closed
+
+
+def test_fetch_live_stream_reports_upstream_failure_after_partial_results(monkeypatch):
+    source = FakeSource([_jobs(0, 1)], error=httpx.ConnectError("boom"))
+
+    response = _stream(monkeypatch, source)
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["apply_url"] == "https://example.com/0"
+    assert lines[-1] == {"error": "boom", "count": 1}
+
+
+class DetailResult:
+    def __init__(self, record):
+        self.record = record
+
+    async def single(self):
+        return self.record
+
+
+class DetailDB:
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    async def run(self, query, **kwargs):
+        node = self.nodes.get(kwargs["apply_url"])
+        return DetailResult({"j": node} if node else None)
+
+
+def test_job_detail_returns_only_public_fields_with_full_description(monkeypatch):
+    from app.core.database import get_db
+
+    node = {
+        "title": "Job",
+        "apply_url": "https://example.com/1",
+        "description": "x" * 1000,
+        "ats_requirements": "{}",
+        "ats_requirements_hash": "h",
+        "simhash": 42,
+        "dedup_fingerprint": "fp",
+        "sort_ts": 1700000000000,
+        "alt_sources": ["adzuna"],
+    }
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    app.dependency_overrides[get_db] = lambda: DetailDB({node["apply_url"]: node})
+    try:
+        found = client.get("/jobs/detail", params={"apply_url": "https://example.com/1"})
+        missing = client.get("/jobs/detail", params={"apply_url": "https://example.com/2"})
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_db, None)
+
+    assert found.status_code == 200
+    job = found.json()
+    assert set(job) == set(JOB_PUBLIC_FIELDS) | {"description"}
+    assert job["title"] == "Job"
+    assert job["description"] == "x" * 1000
+    assert missing.status_code == 404
+
+
+def test_list_jobs_returns_next_cursor_in_the_body(monkeypatch):
+    from app.core.database import get_db
+
+    async def search(db, **kwargs):
+        return [({"title": "Job", "apply_url": "https://example.com/1", "sort_ts": 1}, None)], "next-page"
+
+    monkeypatch.setattr(job_router.job_search_service, "search", search)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    app.dependency_overrides[get_db] = lambda: object()
+    try:
+        response = client.get("/jobs/", params={"limit": 1})
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["next_cursor"] == "next-page"
+    assert [job["apply_url"] for job in body["jobs"]] == ["https://example.com/1"]
+    assert "sort_ts" not in body["jobs"][0]
+
+
+def test_calculate_ats_ignores_client_supplied_requirements(monkeypatch):
+    from app.core.database import get_db
+    from app.services.ats_service import ats_service
+
+    job = {
+        "title": "Backend Engineer",
+        "apply_url": "https://example.com/1",
+        "description": "Required: Python and PostgreSQL.",
+    }
+    forged = {
+        **job,
+        "ats_requirements_hash": ats_service.requirements_hash(job),
+        "ats_requirements": json.dumps({"all_skills": ["cobol"], "required_skills": ["cobol"]}),
+    }
+    profile = ats_service.build_resume_profile(
+        skills=["Python"], experiences=[], experience_titles=[], education=[]
+    )
+
+    async def get_profile(db, resume_id, profile_version=None):
+        return profile
+
+    monkeypatch.setattr(job_router.resume_profile_cache, "get_profile", get_profile)
+    ats_service.requirements_cache.clear()
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    app.dependency_overrides[get_db] = lambda: object()
+    try:
+        response = client.post("/jobs/calculate-ats", json={"jobs": [forged], "resume_id": "r1"})
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200
+    assert "ats_requirements" not in response.json()[0]
+    assert ats_service.get_job_requirements(job).required_skills == ("postgresql", "python")
+
+
+def test_list_jobs_rejects_a_zero_limit():
+    from app.core.database import get_db
+
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    app.dependency_overrides[get_db] = lambda: object()
+    try:
+        response = client.get("/jobs/", params={"limit": 0})
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 422
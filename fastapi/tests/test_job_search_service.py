@@ -0,0 +1,153 @@
+import pytest
+
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.services.job_search_service import (
+    JobSearchService,
+    lucene_query,
+    truncate_description,
+)
+
+
+def test_lucene_query_requires_every_term_and_escapes_syntax():
+    assert lucene_query("Senior  Python") == "+senior +python"
+    assert lucene_query('c++ (remote) title:"x"') == r'+c\+\+ +\(remote\) +title\:\"x\"'
+    assert lucene_query("rock and roll") == '+rock +"and" +roll'
+    assert lucene_query("   ") is None
+
+
+def test_build_query_uses_fulltext_index_and_only_set_predicates():
+    cypher, params = JobSearchService().build_query(q="python", location="Austin", limit=20)
+
+    assert "db.index.fulltext.queryNodes('job_fulltext_index', $search)" in cypher
+    assert "j.location_lc CONTAINS $location" in cypher
+    assert "j.source" not in cypher
+    assert "j.remote" not in cypher
+    assert "ORDER BY score DESC" in cypher
+    assert params == {
+        "search": "+python", "location": "austin", "limit": 21, "description_chars": 300,
+    }
+
+
+def test_build_query_without_text_scans_by_label_with_index_predicates():
+    cypher, params = JobSearchService().build_query(source="adzuna", remote_only=True)
+
+    assert cypher.startswith("MATCH (j:JobPosting)")
+    assert "toLower(" not in cypher
+    assert "j.source = $source" in cypher
+    assert "j.remote = true" in cypher
+    assert "j.sort_ts IS NOT NULL" in cypher
+    assert "ORDER BY j.sort_ts DESC, j.apply_url DESC" in cypher
+    assert params == {"source": "adzuna", "limit": 201, "description_chars": 300}
+
+
+def test_source_filter_matches_postings_folded_in_from_that_source():
+    # An Adzuna posting merged into a Remotive canonical node is listed
+    # under the canonical's alt_sources, not j.source.
+    cypher, _ = JobSearchService().build_query(q="python", source="adzuna")
+
+    assert "(j.source = $source OR $source IN coalesce(j.alt_sources, []))" in cypher
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    cursor = encode_cursor(1700000000000, "https://example.com/jobs/1")
+    assert decode_cursor(cursor, 2) == [1700000000000, "https://example.com/jobs/1"]
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 3)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not a cursor!", 2)
+
+
+def test_build_query_with_cursor_seeks_past_last_row():
+    cursor = encode_cursor(1700000000000, "https://example.com/jobs/1")
+    cypher, params = JobSearchService().build_query(limit=10, cursor=cursor)
+
+    assert "j.sort_ts <= $after_ts" in cypher
+    assert "SKIP" not in cypher
+    assert params["after_ts"] == 1700000000000
+    assert params["after_url"] == "https://example.com/jobs/1"
+
+
+class DummyResult:
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for record in self._records:
+            yield record
+
+
+class DummyDB:
+    def __init__(self, records):
+        self.records = records
+
+    async def run(self, query, **kwargs):
+        return DummyResult(self.records[: kwargs["limit"]])
+
+
+@pytest.mark.asyncio
+async def test_search_returns_next_cursor_only_when_more_rows_exist():
+    records = [
+        {"j": {"sort_ts": 100 - i, "apply_url": f"https://example.com/jobs/{i}"}, "score": None}
+        for i in range(3)
+    ]
+    service = JobSearchService()
+
+    rows, next_cursor = await service.search(DummyDB(records), limit=2)
+    assert len(rows) == 2
+    assert decode_cursor(next_cursor, 2) == [99, "https://example.com/jobs/1"]
+
+    rows, next_cursor = await service.search(DummyDB(records), limit=3)
+    assert len(rows) == 3
+    assert next_cursor is None
+
+
+def test_summary_view_projects_listing_fields_and_truncates_description():
+    cypher, params = JobSearchService().build_query(view="summary")
+
+    assert "RETURN j {.title, " in cypher
+    assert "description: left(j.description, $description_chars)" in cypher
+    assert ".ats_requirements" not in cypher
+    assert params["description_chars"] > 0
+
+    cypher, params = JobSearchService().build_query(view="summary", for_scoring=True)
+    assert ".description, .ats_requirements_hash, .ats_requirements" in cypher
+    assert "description_chars" not in params
+
+    cypher, _ = JobSearchService().build_query(view="full")
+    assert "RETURN j {" in cypher and ".description}" in cypher
+
+
+def test_truncate_description():
+    job = {"description": "x" * 50}
+    assert truncate_description(job, 10)["description"] == "x" * 10
+    assert truncate_description({"description": None}, 10)["description"] is None
+
+
+def test_resume_skill_filter_traverses_has_skill_and_requires_skill_edges():
+    cursor = encode_cursor(2, 1700000000000, "https://example.com/jobs/1")
+    cypher, params = JobSearchService().build_query(
+        skills_of="resume-1", for_scoring=True, cursor=cursor
+    )
+
+    assert cypher.startswith(
+        "MATCH (:Resume {id: $resume_id})-[:HAS_SKILL]->(s:Skill)<-[:REQUIRES_SKILL]-(j:JobPosting)"
+    )
+    assert "WITH j, count(DISTINCT s) AS score\nWHERE (score < $after_score" in cypher
+    assert "ORDER BY score DESC" in cypher
+    assert params["resume_id"] == "resume-1"
+    assert "fulltext" not in cypher
+
+    cypher, _ = JobSearchService().build_query(skills_of=None)
+    assert cypher.startswith("MATCH (j:JobPosting)")
+
+
+@pytest.mark.asyncio
+async def test_search_with_zero_limit_returns_no_rows():
+    records = [{"j": {"sort_ts": 1, "apply_url": "https://example.com/jobs/1"}, "score": None}]
+
+    rows, next_cursor = await JobSearchService().search(DummyDB(records), limit=0)
+
+    assert rows == [] and next_cursor is None
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from app.services.ats_service import JobRequirements, ats_service
+from app.services.job_skill_index_service import (
+    JobSkillIndexService,
+    resume_skill_rows,
+    resume_skills_version,
+    skill_edges,
+)
+
+
+class DummyResult:
+    def __init__(self, records=()):
+        self._records = list(records)
+
+    async def data(self):
+        return self._records
+
+    async def consume(self):
+        return None
+
+
+class DummyDB:
+    """Serves un-indexed postings once, then records the writes."""
+
+    def __init__(self, jobs=(), resumes=()):
+        self.jobs = list(jobs)
+        self.resumes = list(resumes)
+        self.requirement_writes = []
+        self.links = []
+        self.resume_links = []
+
+    async def run(self, query, **kwargs):
+        if "RETURN j.apply_url" in query:
+            jobs, self.jobs = self.jobs, []
+            return DummyResult(jobs)
+        if "RETURN r.id AS resume_id" in query:
+            resumes, self.resumes = self.resumes, []
+            return DummyResult(resumes)
+        if "SET r.skills_version" in query:
+            self.resume_links.extend(kwargs["rows"])
+        elif "REQUIRES_SKILL" in query:
+            self.links.extend(kwargs["rows"])
+        else:
+            self.requirement_writes.extend(kwargs["rows"])
+        return DummyResult()
+
+
+def test_skill_edges_keep_the_strongest_kind_per_skill():
+    requirements = JobRequirements.from_dict("h", {
+        "all_skills": ["docker", "python", "sql"],
+        "required_skills": ["python"],
+        "preferred_skills": ["docker"],
+    })
+
+    assert skill_edges(requirements) == [
+        {"name": "python", "kind": "required"},
+        {"name": "docker", "kind": "preferred"},
+        {"name": "sql", "kind": "mentioned"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_links_postings_and_persists_missing_requirements():
+    db = DummyDB([{
+        "apply_url": "https://example.com/jobs/1",
+        "title": "Backend Engineer",
+        "company": "Acme",
+        "location": "Remote",
+        "description": "Required: Python and PostgreSQL.",
+        "ats_requirements_hash": None,
+        "ats_requirements": None,
+    }])
+
+    linked = await JobSkillIndexService().backfill(db)
+
+    assert linked == 1
+    [link] = db.links
+    assert {"name": "python", "kind": "required"} in link["skills"]
+    [write] = db.requirement_writes
+    assert write["ats_requirements_hash"] == link["skills_hash"]
+    assert "python" in json.loads(write["ats_requirements"])["required_skills"]
+
+
+def test_resume_skills_share_canonical_nodes_with_postings():
+    rows = resume_skill_rows(["Python/Django", "python", " Data   Wrangling ", "PyTorch"])
+
+    assert rows == [
+        {"name": "data wrangling", "labels": ["Data   Wrangling"]},
+        {"name": "deep learning", "labels": []},
+        {"name": "django", "labels": ["Python/Django"]},
+        {"name": "machine learning", "labels": []},
+        {"name": "python", "labels": ["Python/Django", "python"]},
+        {"name": "pytorch", "labels": ["PyTorch"]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_relinks_raw_resume_skills_to_canonical_nodes():
+    db = DummyDB(resumes=[
+        {"resume_id": "r1", "skills": ["Python", "FastAPI"]},
+        {"resume_id": "r2", "skills": []},
+    ])
+
+    relinked = await JobSkillIndexService().backfill_resume_skills(db)
+
+    assert relinked == 2
+    assert db.resume_links == [
+        {"resume_id": "r1", "skills": [
+            {"name": "fastapi", "labels": ["FastAPI"]},
+            {"name": "python", "labels": ["Python"]},
+        ]},
+        {"resume_id": "r2", "skills": []},
+    ]
+    assert resume_skills_version().endswith(ats_service.skill_aliases_version)
@@ -0,0 +1,105 @@
+import pytest
+
+from app.services.knowledge_graph_service import KnowledgeGraphService
+
+
+class DummySummary:
+    def __init__(self, nodes_created):
+        self.counters = type("Counters", (), {"nodes_created": nodes_created})()
+
+
+class DummyResult:
+    def __init__(self, nodes_created):
+        self._summary = DummySummary(nodes_created)
+
+    async def consume(self):
+        return self._summary
+
+
+class DummyTx:
+    def __init__(self, db):
+        self.db = db
+
+    async def run(self, query, **kwargs):
+        self.db.statements.append((query, kwargs))
+        if self.db.fail_on and self.db.fail_on in query:
+            raise RuntimeError("write failed")
+        if "CREATE (r:Resume" in query:
+            return DummyResult(1)
+        if "UNWIND $skills" in query:
+            return DummyResult(len(kwargs["skills"]))
+        if "UNWIND $experiences" in query:
+            return DummyResult(len(kwargs["experiences"]))
+        return DummyResult(0)
+
+
+class DummyDB:
+    def __init__(self, fail_on=None):
+        self.statements = []
+        self.transactions = 0
+        self.fail_on = fail_on
+
+    async def execute_write(self, work, *args):
+        self.transactions += 1
+        return await work(DummyTx(self), *args)
+
+    async def run(self, query, **kwargs):
+        raise AssertionError("subgraph writes must go through execute_write")
+
+
+GRAPH = {
+    "person": {"name": "Jane Doe", "email": "jane@example.com"},
+    "skills": [f"Skill {i}" for i in range(40)] + ["  ", None],
+    "experiences": [{"title": "Engineer", "company": "Acme"}, "not a dict"],
+    "education": [],
+}
+
+
+@pytest.mark.asyncio
+async def test_subgraph_is_written_in_one_transaction_with_unwind():
+    db = DummyDB()
+
+    created = await KnowledgeGraphService().create_resume_subgraph(
+        db, GRAPH, resume_id="r1", user_id="u1",
+        resume={"name": "SWE", "person_name": "Jane Doe", "text": "...", "filename": "cv.pdf"},
+    )
+
+    assert db.transactions == 1
+    # Resume node, person, edge reset, skills, experiences, version; no empty education UNWIND
+    assert len(db.statements) == 6
+    _, params = db.statements[0]
+    assert len(params["skills"]) == 40
+    assert params["skills"][0] == {"name": "skill 0", "labels": ["Skill 0"]}
+    assert params["experiences"] == [
+        {"title": "Engineer", "company": "Acme", "duration": "", "description": ""}
+    ]
+    # The Resume node itself is not counted, as before.
+    assert created == 41
+
+
+@pytest.mark.asyncio
+async def test_failure_propagates_from_the_transaction():
+    db = DummyDB(fail_on="UNWIND $experiences")
+
+    with pytest.raises(RuntimeError):
+        await KnowledgeGraphService().create_resume_subgraph(db, GRAPH, resume_id="r1", user_id="u1")
+
+    assert db.transactions == 1
+    assert not any("CREATE (r:Resume" in query for query, _ in db.statements)
+
+
+@pytest.mark.asyncio
+async def test_resume_skills_merge_on_canonical_names():
+    db = DummyDB()
+    graph = {**GRAPH, "skills": ["Python", "python ", "JavaScript"]}
+
+    await KnowledgeGraphService().create_resume_subgraph(db, graph, resume_id="r1", user_id="u1")
+
+    skills_query, params = next(
+        (query, params) for query, params in db.statements if "UNWIND $skills" in query
+    )
+    assert "MERGE (s:Skill {name: skill.name})" in skills_query
+    assert params["skills"] == [
+        {"name": "javascript", "labels": ["JavaScript"]},
+        {"name": "python", "labels": ["Python", "python"]},
+    ]
@@ -0,0 +1,124 @@
+import pytest
+
+from app.schemas.llm import ResumeGraphData
+from app.services.knowledge_graph_service import ResumeGraphExtractionError, knowledge_graph_service
+from app.services.resume_extraction_cache import ResumeExtractionCache, extraction_key
+
+GRAPH = {
+    "person": {"name": "Jane Doe", "email": None, "phone": None, "location": None},
+    "skills": ["Python"],
+    "experiences": [],
+    "education": [],
+}
+
+
+class DummyResult:
+    def __init__(self, record=None):
+        self._record = record
+
+    async def single(self):
+        return self._record
+
+    async def consume(self):
+        return None
+
+
+class DummyDB:
+    """Keeps ResumeExtraction entries in insertion (= last use) order."""
+
+    def __init__(self):
+        self.entries = {}
+
+    async def run(self, query, **kwargs):
+        if "RETURN c.graph_data" in query:
+            graph_data = self.entries.pop(kwargs["key"], None)
+            if graph_data is None:
+                return DummyResult()
+            self.entries[kwargs["key"]] = graph_data
+            return DummyResult({"graph_data": graph_data})
+        if "MERGE (c:ResumeExtraction" in query:
+            self.entries.pop(kwargs["key"], None)
+            self.entries[kwargs["key"]] = kwargs["graph_data"]
+        elif "SKIP $max_entries" in query:
+            while len(self.entries) > kwargs["max_entries"]:
+                del self.entries[next(iter(self.entries))]
+        return DummyResult()
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    async def transform(resume_text):
+        calls.append(resume_text)
+        if "unreadable" in resume_text:
+            raise ResumeGraphExtractionError("bad output")
+        return {**GRAPH, "skills": [resume_text.split()[0]]}
+
+    monkeypatch.setattr(knowledge_graph_service, "transform_resume_to_graph", transform)
+    return calls
+
+
+def test_key_ignores_whitespace_but_not_user_model_or_prompt_version():
+    key = extraction_key("Jane  Doe\r\nPython", "llama3", "u1")
+
+    assert key == extraction_key(" Jane Doe\nPython ", "llama3", "u1")
+    assert key != extraction_key("Jane Doe Python", "llama3", "u2")
+    assert key != extraction_key("Jane Doe Python", "mistral", "u1")
+    assert key != extraction_key("Jane Doe Python", "llama3", "u1", prompt_version=2)
+
+
+@pytest.mark.asyncio
+async def test_identical_content_skips_the_llm(llm_calls):
+    db = DummyDB()
+    cache = ResumeExtractionCache(max_entries=10)
+
+    first, first_cached = await cache.get_or_extract(db, "Python Jane Doe", "u1")
+    first["person"]["name"] = "Renamed by the caller"
+    second, second_cached = await cache.get_or_extract(db, "Python\n\nJane Doe", "u1")
+
+    assert (first_cached, second_cached) == (False, True)
+    assert llm_calls == ["Python Jane Doe"]
+    assert second["person"]["name"] == "Jane Doe"
+    assert second["skills"] == ["Python"]
+
+
+@pytest.mark.asyncio
+async def test_entries_are_not_shared_across_users(llm_calls):
+    db = DummyDB()
+    cache = ResumeExtractionCache(max_entries=10)
+
+    _, first_cached = await cache.get_or_extract(db, "Python Jane Doe", "u1")
+    _, other_cached = await cache.get_or_extract(db, "Python Jane Doe", "u2")
+
+    assert (first_cached, other_cached) == (False, False)
+    assert len(llm_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_extractions_are_not_cached_and_old_entries_are_evicted(llm_calls):
+    db = DummyDB()
+    cache = ResumeExtractionCache(max_entries=2)
+
+    with pytest.raises(ResumeGraphExtractionError):
+        await cache.get_or_extract(db, "unreadable scan", "u1")
+    for text in ("Go resume", "Rust resume", "Go resume", "Java resume"):
+        await cache.get_or_extract(db, text, "u1")
+
+    model = knowledge_graph_service.model
+    assert list(db.entries) == [
+        extraction_key("Go resume", model, "u1"), extraction_key("Java resume", model, "u1"),
+    ]
+    assert len(llm_calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_invalid_cached_entries_count_as_misses(llm_calls):
+    db = DummyDB()
+    db.entries[extraction_key("Python resume", knowledge_graph_service.model, "u1")] = '{"skills": []}'
+
+    graph_data, cached = await ResumeExtractionCache(max_entries=10).get_or_extract(db, "Python resume", "u1")
+
+    assert cached is False
+    assert graph_data["skills"] == ["Python"]
+    assert ResumeGraphData.model_validate_json(next(iter(db.entries.values())))
@@ -0,0 +1,150 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.auth import get_current_user
+from app.core.config import settings
+from app.core.database import get_db
+from app.main import app
+from app.services import resume_ingest_service as ingest_module
+from app.services.resume_ingest_service import IngestQueueFullError, ResumeIngestService
+
+GRAPH = {"person": {"name": "Jane Doe"}, "skills": ["Python"], "experiences": [], "education": []}
+
+
+class Pipeline:
+    """Fakes the extraction, LLM and write steps; the LLM waits for ``release``."""
+
+    def __init__(self, monkeypatch):
+        self.release = asyncio.Event()
+        self.writes = []
+
+        async def extract(file_content, filename):
+            return file_content.decode()
+
+        async def get_or_extract(db, text, user_id):
+            await self.release.wait()
+            return {**GRAPH, "person": dict(GRAPH["person"])}, False
+
+        async def create_resume_subgraph(db, graph_data, *, resume_id, user_id, resume):
+            self.writes.append((user_id, resume["name"], graph_data["person"]["name"]))
+            return 2
+
+        monkeypatch.setattr(ingest_module.resume_processor, "extract_text_from_file", extract)
+        monkeypatch.setattr(ingest_module.resume_extraction_cache, "get_or_extract", get_or_extract)
+        monkeypatch.setattr(
+            ingest_module.knowledge_graph_service, "create_resume_subgraph", create_resume_subgraph
+        )
+
+
+@asynccontextmanager
+async def dummy_session():
+    yield object()
+
+
+async def _started_service():
+    service = ResumeIngestService(session_factory=dummy_session)
+    await service.start()
+    return service
+
+
+def _submit(service, user_id="u1", text="Jane Doe, Python engineer"):
+    return service.submit(
+        user_id=user_id,
+        file_content=text.encode(),
+        filename="cv.txt",
+        resume_name=" Spring SWE ",
+    )
+
+
+@pytest.mark.asyncio
+async def test_background_job_reports_each_stage_then_the_result(monkeypatch):
+    pipeline = Pipeline(monkeypatch)
+    service = await _started_service()
+    job = _submit(service)
+
+    statuses = []
+    async for update in service.watch(job, heartbeat=0.01):
+        if update is None:
+            pipeline.release.set()
+        else:
+            statuses.append(update.status)
+
+    # Stages that pass between two wake-ups are reported as the latest one.
+    order = ["queued", "extracting_text", "extracting_graph", "writing", "completed"]
+    assert statuses == sorted(set(statuses), key=order.index)
+    assert statuses[0] == "queued" and statuses[-1] == "completed"
+    assert "extracting_graph" in statuses
+    assert job.result["resume_name"] == "Spring SWE"
+    assert job.result["nodes_created"] == 2
+    assert pipeline.writes == [("u1", "Spring SWE", "Jane Doe")]
+    assert service.get(job.job_id, "u1") is job
+    assert service.get(job.job_id, "someone-else") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrency_and_pending_jobs_are_bounded(monkeypatch):
+    pipeline = Pipeline(monkeypatch)
+    monkeypatch.setattr(settings, "resume_ingest_concurrency", 1)
+    monkeypatch.setattr(settings, "resume_ingest_max_pending", 2)
+    service = await _started_service()
+
+    first, second = _submit(service), _submit(service)
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert (first.status, second.status) == ("extracting_graph", "queued")
+    with pytest.raises(IngestQueueFullError):
+        _submit(service)
+
+    pipeline.release.set()
+    await asyncio.wait_for(asyncio.gather(*service._tasks.values()), 1)
+    assert (first.status, second.status) == ("completed", "completed")
+    assert service.stats()["jobs"] == {"completed": 2}
+
+
+@pytest.mark.asyncio
+async def test_failures_and_shutdown_mark_jobs_failed(monkeypatch, caplog):
+    Pipeline(monkeypatch)
+    service = await _started_service()
+
+    empty = _submit(service, text=" ")
+    stuck = _submit(service)
+    await asyncio.sleep(0.01)
+    await service.shutdown()
+
+    assert empty.status == "failed"
+    assert empty.error == {
+        "status_code": 500, "detail": "Could not extract meaningful text from the file"
+    }
+    assert "Background resume upload" in caplog.text
+    assert "Traceback" in caplog.text
+    assert stuck.status == "failed"
+    assert stuck.error["status_code"] == 503
+    assert "shutdown" in stuck.error["detail"]
+
+
+def test_submit_requires_start():
+    with pytest.raises(RuntimeError):
+        _submit(ResumeIngestService(session_factory=dummy_session))
+
+
+def test_upload_without_text_is_a_bad_request(monkeypatch):
+    Pipeline(monkeypatch)
+    client = TestClient(app)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    app.dependency_overrides[get_db] = lambda: object()
+    try:
+        response = client.post(
+            "/api/resume/upload",
+            files={"file": ("cv.txt", b"short", "text/plain")},
+            data={"resume_name": "Spring SWE"},
+        )
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Could not extract meaningful text from the file"
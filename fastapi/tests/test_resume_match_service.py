@@ -0,0 +1,95 @@
+import pytest
+
+from app.services.ats_service import ats_service
+from app.services.resume_match_service import ResumeMatchService
+
+
+class FakeSearch:
+    """Pages through ``jobs`` like JobSearchService.search, recording calls."""
+
+    def __init__(self, jobs, shared_skills=True):
+        self.jobs = jobs
+        self.shared_skills = shared_skills
+        self.calls = []
+
+    async def search(self, db, limit=200, cursor=None, **kwargs):
+        self.calls.append({"limit": limit, "cursor": cursor, **kwargs})
+        if kwargs.get("skills_of") and not self.shared_skills:
+            return [], None
+        start = int(cursor or 0)
+        rows = [(dict(job), 1.0) for job in self.jobs[start:start + limit]]
+        more = start + limit < len(self.jobs)
+        return rows, str(start + limit) if more else None
+
+
+def _job(index, description):
+    return {
+        "title": f"Engineer {index}",
+        "apply_url": f"https://example.com/jobs/{index}",
+        "description": description,
+        "sort_ts": index,
+    }
+
+
+@pytest.fixture
+def profile():
+    return ats_service.build_resume_profile(
+        skills=["Python", "FastAPI"],
+        experiences=["Built APIs with Python and FastAPI"],
+        experience_titles=["Backend Engineer"],
+        education=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_top_jobs_merges_pages_into_bounded_top_k(profile):
+    jobs = [
+        _job(0, "Required: Java"),
+        _job(1, "Required: Python, FastAPI"),
+        _job(2, "Required: Go"),
+        _job(3, "Required: Python " + "detail " * 200),
+        _job(4, "Required: Rust"),
+    ]
+    search = FakeSearch(jobs)
+    service = ResumeMatchService(search)
+
+    result = await service.top_jobs(None, profile, top=2, resume_id="resume-1")
+
+    assert result["scanned"] == 5
+    assert [job["apply_url"] for job in result["jobs"]] == [
+        "https://example.com/jobs/1",
+        "https://example.com/jobs/3",
+    ]
+    assert result["jobs"][0]["ats_score"] >= result["jobs"][1]["ats_score"]
+    assert "sort_ts" not in result["jobs"][0]
+    assert len(result["jobs"][1]["description"]) == 300
+    assert search.calls[0]["skills_of"] == "resume-1"
+    assert search.calls[0]["for_scoring"] is True
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_stops_at_candidate_cap(profile):
+    search = FakeSearch([_job(i, "Required: Python") for i in range(10)])
+    service = ResumeMatchService(search)
+
+    pages = [
+        page async for page in service.iter_pages(
+            None, profile, top=3, page_size=4, max_candidates=6
+        )
+    ]
+
+    assert [page.scanned for page in pages] == [4, 6]
+    assert [call["limit"] for call in search.calls] == [4, 2]
+    assert all(len(page.jobs) <= 3 for page in pages)
+    assert len(pages[-1].top) == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_falls_back_to_recent_postings_without_shared_skills(profile):
+    search = FakeSearch([_job(i, "Required: Python") for i in range(3)], shared_skills=False)
+    service = ResumeMatchService(search)
+
+    result = await service.top_jobs(None, profile, top=2, resume_id="resume-1")
+
+    assert result["scanned"] == 3
+    assert [call["skills_of"] for call in search.calls] == ["resume-1", None]
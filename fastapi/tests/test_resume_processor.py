@@ -0,0 +1,53 @@
+import fitz
+import pytest
+
+from app.core.config import settings
+from app.core.executors import BoundedExecutor
+from app.services.resume_processor import ResumeProcessor
+
+
+def _resume_pdf(pages):
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        # Inserted bottom block first: extraction must follow reading order.
+        page.insert_text((72, 300), f"Skills {number}: Python, Docker")
+        page.insert_text((72, 72), f"Experience {number}")
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+def test_pymupdf_blocks_are_in_reading_order_and_ranges_report_page_count():
+    text, page_count = ResumeProcessor._extract_text_pdf(_resume_pdf(3), 1, 2)
+
+    assert page_count == 3
+    assert text == "Experience 1\nSkills 1: Python, Docker"
+
+
+def test_falls_back_to_pypdf_when_pymupdf_fails(monkeypatch):
+    def broken(*args):
+        raise RuntimeError("cannot open")
+
+    monkeypatch.setattr(ResumeProcessor, "_extract_text_pdf_pymupdf", staticmethod(broken))
+
+    text, page_count = ResumeProcessor._extract_text_pdf(_resume_pdf(2))
+
+    assert page_count == 2
+    assert "Experience 1" in text and "Skills 0: Python, Docker" in text
+
+
+@pytest.mark.asyncio
+async def test_process_pool_extracts_page_ranges_in_parallel(monkeypatch):
+    monkeypatch.setattr(settings, "pdf_pages_per_job", 2)
+    executor = BoundedExecutor("test", kind="process", max_workers=2)
+    try:
+        text = await ResumeProcessor(executor).extract_text_from_file(_resume_pdf(5), "cv.pdf")
+    finally:
+        executor.shutdown()
+
+    assert text.splitlines() == [
+        line for number in range(5)
+        for line in (f"Experience {number}", f"Skills {number}: Python, Docker")
+    ]
+    assert executor.stats()["completed"] == 3
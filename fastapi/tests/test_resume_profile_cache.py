@@ -0,0 +1,62 @@
+import pytest
+
+from app.services.resume_profile_cache import ResumeProfileCache
+
+
+class DummyResult:
+    def __init__(self, data):
+        self._data = data
+
+    async def single(self):
+        return self._data
+
+
+class DummyDB:
+    def __init__(self, version="v1"):
+        self.version = version
+        self.profile_reads = 0
+
+    async def run(self, query, **kwargs):
+        if self.version is None:
+            return DummyResult(None)
+        if "HAS_SKILL" not in query:
+            return DummyResult({"profile_version": self.version})
+        self.profile_reads += 1
+        return DummyResult({
+            "profile_version": self.version,
+            "skills": ["Python"],
+            "experiences": ["Built FastAPI services"],
+            "experience_titles": ["Backend Engineer"],
+            "education": [],
+            "resume_text": "Backend engineer",
+        })
+
+
+@pytest.mark.asyncio
+async def test_profile_is_built_once_per_version():
+    cache = ResumeProfileCache(maxsize=8)
+    db = DummyDB()
+
+    first = await cache.get_profile(db, "r1")
+    second = await cache.get_profile(db, "r1")
+    assert first is second
+    assert "python" in first.skills
+    assert db.profile_reads == 1
+
+    db.version = "v2"
+    assert await cache.get_profile(db, "r1") is not first
+    assert db.profile_reads == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_and_missing_resume():
+    cache = ResumeProfileCache(maxsize=8)
+    db = DummyDB()
+
+    await cache.get_profile(db, "r1", profile_version="v1")
+    cache.invalidate("r1")
+    await cache.get_profile(db, "r1", profile_version="v1")
+    assert db.profile_reads == 2
+
+    db.version = None
+    assert await cache.get_profile(db, "r1") is None
@@ -0,0 +1,28 @@
+from app.services.resume_queries import (
+    collect_related,
+    collect_skill_labels,
+    context_collections,
+    profile_collections,
+)
+
+
+def test_collect_related_aggregates_one_relationship_in_a_subquery():
+    assert collect_related("r", "HAS_SKILL", "Skill", "n.name", "skills") == (
+        "COLLECT { MATCH (r)-[:HAS_SKILL]->(n:Skill) "
+        "WITH DISTINCT n.name AS item WHERE item IS NOT NULL RETURN item } AS skills"
+    )
+
+
+def test_profile_items_never_chain_optional_matches():
+    for items in (profile_collections("r"), context_collections("p")):
+        assert "OPTIONAL MATCH" not in items
+    aliases = [item.rsplit(" AS ", 1)[1] for item in profile_collections().split(",\n")]
+    assert aliases == ["skills", "experiences", "experience_titles", "education"]
+
+
+def test_skills_are_read_as_written_on_the_resume():
+    item = collect_skill_labels("r")
+
+    assert "MATCH (r)-[e:HAS_SKILL]->(n:Skill)" in item
+    assert "UNWIND coalesce(e.labels, [n.name]) AS item" in item
+    assert item in profile_collections("r")
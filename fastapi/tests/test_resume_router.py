@@ -0,0 +1,56 @@
+from fastapi.testclient import TestClient
+
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.main import app
+from app.routers import resume as resume_router
+from app.services.ats_service import ats_service
+
+client = TestClient(app)
+
+
+def test_skill_gap_matches_index_skills_against_the_ats_profile(monkeypatch):
+    # "fastapi" only appears in the experience text, so it has no HAS_SKILL
+    # edge, but the ATS profile (and therefore the scores) counts it.
+    profile = ats_service.build_resume_profile(
+        skills=["Python"],
+        experiences=["Built APIs with FastAPI"],
+        experience_titles=[],
+        education=[],
+    )
+
+    async def load_saved_jobs(db, *, user_id, resume_id):
+        return {
+            "resume_name": "SWE",
+            "jobs": [{"ats_score": 80.0}, {"ats_score": 60.0}],
+            "pending_scores": None,
+        }
+
+    async def get_profile(db, resume_id, profile_version=None):
+        return profile
+
+    async def saved_job_skills(db, resume_id):
+        return [
+            {"skill": "python", "kind": "required", "jobs": 2},
+            {"skill": "fastapi", "kind": "required", "jobs": 1},
+            {"skill": "docker", "kind": "required", "jobs": 2},
+            {"skill": "kubernetes", "kind": "preferred", "jobs": 1},
+        ]
+
+    monkeypatch.setattr(resume_router.saved_job_score_service, "load_saved_jobs", load_saved_jobs)
+    monkeypatch.setattr(resume_router.resume_profile_cache, "get_profile", get_profile)
+    monkeypatch.setattr(resume_router.job_skill_index_service, "saved_job_skills", saved_job_skills)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    app.dependency_overrides[get_db] = lambda: object()
+    try:
+        response = client.get("/api/resume/skill-gap-analysis/r1")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200
+    analysis = response.json()["skill_analysis"]
+    assert analysis["matched_skills"] == ["fastapi", "python"]
+    assert [item["skill"] for item in analysis["missing_required_skills"]] == ["docker"]
+    assert [item["skill"] for item in analysis["missing_preferred_skills"]] == ["kubernetes"]
+    assert analysis["average_ats_score"] == 70.0
@@ -0,0 +1,175 @@
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.services.ats_service import SKILL_ALIASES, ats_service, job_content_hash
+from app.services.resume_profile_cache import resume_profile_cache
+from app.services.saved_job_score_service import SavedJobScoreService
+
+
+@pytest.fixture(autouse=True)
+def _clear_profile_cache():
+    resume_profile_cache.clear()
+    yield
+    resume_profile_cache.clear()
+
+
+class DummyResult:
+    def __init__(self, data):
+        self._data = data
+
+    async def single(self):
+        return self._data
+
+    async def consume(self):
+        return
+
+
+class DummyDB:
+    def __init__(self, jobs, profile_version="v1"):
+        self.jobs = jobs
+        self.profile_version = profile_version
+        self.calls = []
+
+    async def run(self, query, **kwargs):
+        self.calls.append((query, kwargs))
+        if "OPTIONAL MATCH (r)-[s:SAVED_JOB]->(j:JobPosting)" in query:
+            return DummyResult({
+                "resume_name": "SWE",
+                "person_name": "Jane Doe",
+                "profile_version": self.profile_version,
+                "jobs": self.jobs,
+            })
+        if ":HAS_SKILL]->" in query:
+            return DummyResult({
+                "profile_version": self.profile_version,
+                "skills": ["Python", "FastAPI"],
+                "experiences": ["Built APIs for 4 years"],
+                "experience_titles": ["Backend Engineer"],
+                "education": ["BS Computer Science"],
+                "resume_text": "Backend engineer, 4 years",
+            })
+        return DummyResult(None)
+
+    def queries(self, marker):
+        return [kwargs for query, kwargs in self.calls if marker in query]
+
+
+def _saved_job(**stored):
+    job = {
+        "title": "Backend Engineer",
+        "company": "Acme",
+        "location": "Remote",
+        "apply_url": "https://example.com/job",
+        "source": "remotive",
+        "description": "Required: Python, FastAPI, Docker.",
+        "ats_requirements_hash": None,
+        "ats_requirements": None,
+        "saved_at": "2026-01-01T00:00:00Z",
+        "notes": None,
+    }
+    job.update(stored)
+    return job
+
+
+def _session_factory(db):
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    return session
+
+
+@pytest.mark.asyncio
+async def test_stale_rows_are_rescored_on_read_and_persisted_separately():
+    db = DummyDB([_saved_job()])
+    service = SavedJobScoreService(session_factory=_session_factory(db))
+
+    saved = await service.load_saved_jobs(db, user_id="u1", resume_id="r1")
+
+    job = saved["jobs"][0]
+    assert job["ats_details"]["missing"]["required_skills"] == ["docker"]
+    assert db.queries("SET s.ats_score = row.ats_score") == []  # reads never write
+
+    await service.persist(saved["pending_scores"])
+    stored = db.queries("SET s.ats_score = row.ats_score")
+    assert len(stored) == 1
+    assert stored[0]["profile_version"] == "v1"
+    assert stored[0]["scoring_version"] == ats_service.scoring_version
+    assert stored[0]["rows"][0]["ats_score"] == job["ats_score"]
+
+
+@pytest.mark.asyncio
+async def test_persist_logs_and_swallows_write_failures(caplog):
+    @asynccontextmanager
+    async def broken_session():
+        raise RuntimeError("neo4j unavailable")
+        yield
+
+    db = DummyDB([_saved_job()])
+    service = SavedJobScoreService(session_factory=broken_session)
+    saved = await service.load_saved_jobs(db, user_id="u1", resume_id="r1")
+
+    await service.persist(saved["pending_scores"])
+
+    assert "Failed to persist ATS scores for resume r1" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_current_rows_are_served_without_rescoring():
+    job = _saved_job()
+    job.update({
+        "stored_score": 42.0,
+        "stored_details": json.dumps({"confidence": "low"}),
+        "stored_resume_version": "v1",
+        "stored_job_hash": job_content_hash(job),
+        "stored_scoring_version": ats_service.scoring_version,
+    })
+    db = DummyDB([job])
+
+    saved = await SavedJobScoreService().load_saved_jobs(db, user_id="u1", resume_id="r1")
+
+    assert saved["jobs"][0]["ats_score"] == 42.0
+    assert saved["jobs"][0]["ats_details"] == {"confidence": "low"}
+    assert saved["pending_scores"] is None
+    assert len(db.calls) == 1
+
+    db.profile_version = "v2"
+    saved = await SavedJobScoreService().load_saved_jobs(db, user_id="u1", resume_id="r1")
+    assert saved["jobs"][0]["ats_score"] != 42.0
+
+
+@pytest.mark.asyncio
+async def test_alias_table_changes_invalidate_stored_scores():
+    job = _saved_job()
+    job.update({
+        "stored_score": 42.0,
+        "stored_details": json.dumps({"confidence": "low"}),
+        "stored_resume_version": "v1",
+        "stored_job_hash": job_content_hash(job),
+        "stored_scoring_version": ats_service.scoring_version,
+    })
+    db = DummyDB([job])
+
+    try:
+        ats_service.reload_skill_aliases({**SKILL_ALIASES, "docker": ["docker", "containers"]})
+        saved = await SavedJobScoreService().load_saved_jobs(db, user_id="u1", resume_id="r1")
+    finally:
+        ats_service.reload_skill_aliases()
+
+    assert saved["jobs"][0]["ats_score"] != 42.0
+    assert saved["pending_scores"].rows[0]["apply_url"] == job["apply_url"]
+
+
+@pytest.mark.asyncio
+async def test_score_saved_job_stores_the_new_row():
+    db = DummyDB([])
+
+    await SavedJobScoreService().score_saved_job(
+        db, resume_id="r1", profile_version="v1", job=_saved_job()
+    )
+
+    [stored] = db.queries("SET s.ats_score = row.ats_score")
+    assert stored["resume_id"] == "r1"
+    assert stored["rows"][0]["apply_url"] == "https://example.com/job"